@@ -0,0 +1,82 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Helpers shared by the benchmark scripts.
+@version   : v1.0.0
+@date      : 2024-05-13 16:20:12
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+
+try:
+    import usr  # noqa: F401
+except ImportError:
+    # On CPython map `usr` to the `code` folder, as QuecPython mounts it.
+    import os
+    import types
+    _usr = types.ModuleType("usr")
+    _usr.__path__ = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "code")]
+    sys.modules["usr"] = _usr
+
+try:
+    from utime import ticks_us, ticks_diff
+except ImportError:
+    import time
+
+    def ticks_us():
+        return int(time.perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+def measure(func, *args, repeat=10):
+    """Return the average run time of `func(*args)` in microseconds."""
+    start = ticks_us()
+    for _ in range(repeat):
+        func(*args)
+    return ticks_diff(ticks_us(), start) / repeat
+
+
+def heap(func, *args):
+    """
+    Return the bytes of heap used by `func(*args)`: the peak on CPython, the
+    bytes allocated with the garbage collector paused on MicroPython.
+    """
+    try:
+        import tracemalloc
+    except ImportError:
+        import gc
+        gc.collect()
+        gc.disable()
+        try:
+            start = gc.mem_alloc()
+            func(*args)
+            return gc.mem_alloc() - start
+        finally:
+            gc.enable()
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report(name, *columns):
+    print(("{:<28}" + " {:>14}" * len(columns)).format(name, *columns))
@@ -0,0 +1,69 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_decode.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Heap and time of decoding SendLocalList CALLs with decode() and
+             with camel_to_snake_case() and validate_payload() in turn.
+@version   : v1.0.0
+@date      : 2024-05-27 11:06:48
+@copyright : Copyright (c) 2024
+"""
+
+from bench import heap, measure, report
+
+import usr.ocpp.v16  # noqa: F401
+from usr.ocpp.keys import camel_to_snake_case
+from usr.ocpp.messages import Call, decode, unpack, validate_payload
+
+
+def send_local_list(count):
+    items = []
+    for i in range(count):
+        items.append({
+            "idTag": "TAG%08d" % i,
+            "idTagInfo": {"status": "Accepted", "expiryDate": "2024-12-31T23:59:59Z", "parentIdTag": "PARENT01"}
+        })
+    message = Call("1", "SendLocalList", {"listVersion": 7, "updateType": "Full", "localAuthorizationList": items})
+    return message.to_json()
+
+
+def in_steps(text):
+    msg = unpack(text)
+    msg.payload = camel_to_snake_case(msg.payload)
+    validate_payload(msg, "1.6")
+    return msg
+
+
+def fused(text):
+    msg = unpack(text)
+    decode(msg, "1.6")
+    return msg
+
+
+def main():
+    # Load the payload classes first.
+    fused(send_local_list(1))
+    report("SendLocalList", "bytes", "steps heap", "decode heap", "steps us", "decode us")
+    for count in (1, 10, 100):
+        text = send_local_list(count)
+        report(
+            "%d items" % count, len(text), heap(in_steps, text), heap(fused, text),
+            int(measure(in_steps, text)), int(measure(fused, text))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_encode.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Heap and time of encoding MeterValues CALLs with encode() and
+             with asdict(), remove_nones(), validate_payload(),
+             snake_to_camel_case() and to_json() in turn.
+@version   : v1.0.0
+@date      : 2024-05-24 15:38:02
+@copyright : Copyright (c) 2024
+"""
+
+from bench import heap, measure, report
+
+import usr.ocpp.v16  # noqa: F401
+from usr.ocpp.dataclasses import asdict
+from usr.ocpp.keys import snake_to_camel_case
+from usr.ocpp.messages import Call, encode, remove_nones, validate_payload
+from usr.ocpp.v16 import call
+from usr.ocpp.v16.datatypes import MeterValue, SampledValue
+
+
+def meter_values(count):
+    sampled = [
+        SampledValue("%d.%d" % (230 + i % 5, i), context="Sample.Periodic", measurand="Voltage", phase="L1-N", unit="V")
+        for i in range(count)
+    ]
+    return call.MeterValuesPayload(
+        connector_id=1, meter_value=[MeterValue("2024-05-24T15:38:02Z", sampled)], transaction_id=7
+    )
+
+
+def in_steps(payload):
+    message = Call("1", "MeterValues", remove_nones(asdict(payload)))
+    validate_payload(message, "1.6")
+    message.payload = snake_to_camel_case(message.payload)
+    return message.to_json()
+
+
+def fused(payload):
+    return encode(Call("1", "MeterValues", None), payload, "1.6")
+
+
+def main():
+    report("MeterValues", "bytes", "steps heap", "encode heap", "steps us", "encode us")
+    for count in (1, 10, 100):
+        payload = meter_values(count)
+        assert in_steps(payload) == fused(payload)
+        report(
+            "%d sampled values" % count, len(fused(payload)), heap(in_steps, payload), heap(fused, payload),
+            int(measure(in_steps, payload)), int(measure(fused, payload))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_journal.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Rate of queueing MeterValues in the journal while offline and of
+             draining them on replay. Runs on the module.
+@version   : v1.0.0
+@date      : 2024-05-17 15:40:22
+@copyright : Copyright (c) 2024
+"""
+
+from bench import ticks_us, ticks_diff, report
+
+from usr.ocpp.journal import Journal
+
+PATH = "/usr/bench_journal"
+COUNT = 1000
+
+METER_VALUES = (
+    '[2, "%s", "MeterValues", {"connectorId": 1, "transactionId": 7, "meterValue": [{"timestamp": '
+    '"2024-05-17T10:00:00Z", "sampledValue": [{"value": "12345", "measurand": '
+    '"Energy.Active.Import.Register", "unit": "Wh"}, {"value": "7360", "measurand": '
+    '"Power.Active.Import", "unit": "W"}]}]}]'
+)
+
+
+def run(sync_every):
+    journal = Journal(PATH, max_size=0x100000, sync_every=sync_every)
+    start = ticks_us()
+    for i in range(COUNT):
+        unique_id = "%08d" % i
+        journal.append(unique_id, "MeterValues", METER_VALUES % unique_id)
+    journal.sync()
+    queued = ticks_diff(ticks_us(), start)
+
+    start = ticks_us()
+    for unique_id, message in journal.records():
+        journal.ack(unique_id)
+    drained = ticks_diff(ticks_us(), start)
+    return COUNT * 1000000 // queued, COUNT * 1000000 // drained
+
+
+def main():
+    report("%d MeterValues" % COUNT, "queued / s", "drained / s")
+    for sync_every in (1, 16, 64):
+        report("sync every %d" % sync_every, *run(sync_every))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_logging.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Time and heap per message of logging a received MeterValues
+             CALL with the message formatted by the caller and lazily, with
+             info messages logged and not, and saved to the log file, which
+             is written by its LogWriter thread. The console output is left
+             out. Runs on the module.
+@version   : v1.0.0
+@date      : 2024-05-31 09:27:40
+@copyright : Copyright (c) 2024
+"""
+
+from bench import heap, measure, report
+
+from usr.tools import logging
+
+LOGGER = logging.getLogger(__name__)
+
+MESSAGE = (
+    '[2, "1", "MeterValues", {"connectorId": 1, "transactionId": 7, "meterValue": [{"timestamp": '
+    '"2024-05-31T09:27:40Z", "sampledValue": [{"value": "12345", "measurand": '
+    '"Energy.Active.Import.Register", "unit": "Wh"}]}]}]'
+)
+
+
+def eager(count):
+    for _ in range(count):
+        LOGGER.info("%s: receive message %s" % ("cp", MESSAGE))
+
+
+def lazy(count):
+    for _ in range(count):
+        LOGGER.info("%s: receive message %s", "cp", MESSAGE)
+
+
+def main():
+    logging.print = lambda *args: None
+    report("per message", "eager us", "lazy us", "eager heap", "lazy heap")
+    logging.setLogFile("/usr/bench_log", "bench.log")
+    cases = (("logged", True, "debug", False), ("saved", True, "debug", True), ("off", False, "warn", False))
+    for name, debug, level, save in cases:
+        logging.setLogDebug(debug)
+        logging.setLogLevel(level)
+        logging.setSaveLog(save, 0x10000, 1)
+        report(
+            name, "%.2f" % (measure(eager, 100) / 100), "%.2f" % (measure(lazy, 100) / 100),
+            heap(eager, 1), heap(lazy, 1)
+        )
+
+
+if __name__ == "__main__":
+    main()
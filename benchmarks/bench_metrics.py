@@ -0,0 +1,49 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_metrics.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Time and heap of recording the stages of a message with the
+             default metrics collector, and of its dump(). Runs on the
+             module.
+@version   : v1.0.0
+@date      : 2024-05-30 14:36:08
+@copyright : Copyright (c) 2024
+"""
+
+from bench import heap, measure, report
+
+from usr.ocpp.metrics import Metrics, STAGES
+
+ACTIONS = ("MeterValues", "StatusNotification", "RemoteStartTransaction", "Heartbeat")
+COUNT = 1000
+
+
+def record(metrics, count):
+    for i in range(count):
+        metrics.record(ACTIONS[i % len(ACTIONS)], i % len(STAGES), i * 37 % 100000)
+
+
+def main():
+    metrics = Metrics()
+    # The rows of the Actions are added on their first record.
+    record(metrics, len(ACTIONS))
+    report("metrics", "us", "heap bytes")
+    report("%d records" % COUNT, int(measure(record, metrics, COUNT, repeat=3)), heap(record, metrics, COUNT))
+    report("dump", int(measure(metrics.dump)), heap(metrics.dump))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_payload_memory.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Heap of a MeterValues payload of 100 sampled values and time of
+             its asdict(), with the payload classes as they are (`__slots__`)
+             and with a __dict__ per object as before.
+@version   : v1.0.0
+@date      : 2024-05-24 10:12:37
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+
+from bench import heap, measure, report
+
+from usr.ocpp.dataclasses import asdict
+from usr.ocpp.v16 import call
+from usr.ocpp.v16.datatypes import MeterValue, SampledValue
+
+SAMPLES = 100
+VALUES = ["%d.%d" % (230 + i % 5, i) for i in range(SAMPLES)]
+
+
+def with_dict(cls):
+    """Same class as `cls`, its instances keeping their fields in a __dict__."""
+    return type("Dict" + cls.__name__, (object,), {"__init__": cls.__init__})
+
+
+DictSampledValue = with_dict(SampledValue)
+DictMeterValue = with_dict(MeterValue)
+DictMeterValuesPayload = with_dict(call.MeterValuesPayload)
+
+
+def asdict_of_dict(obj):
+    """asdict() as it was, walking the __dict__ of the objects."""
+    if hasattr(obj, "__dict__"):
+        return {key: (val if isinstance(val, (int, float, str)) else asdict_of_dict(val)) for key, val in obj.__dict__.items() if not key.startswith("_")}
+    elif isinstance(obj, list):
+        return [asdict_of_dict(i) for i in obj]
+    return obj
+
+
+def sampled_values(cls):
+    return [cls(v, measurand="Voltage", phase="L1-N", unit="V") for v in VALUES]
+
+
+def payload(payload_cls, meter_cls, sampled_cls):
+    return payload_cls(
+        connector_id=1,
+        meter_value=[meter_cls("2024-05-24T10:12:37Z", sampled_values(sampled_cls))],
+        transaction_id=7,
+    )
+
+
+def size(obj):
+    """Bytes of an object and of its __dict__, CPython only."""
+    return sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, "__dict__") else 0)
+
+
+def main():
+    slots = (call.MeterValuesPayload, MeterValue, SampledValue)
+    dicts = (DictMeterValuesPayload, DictMeterValue, DictSampledValue)
+    used = heap(sampled_values, SampledValue), heap(sampled_values, DictSampledValue)
+    report("%d sampled values" % SAMPLES, "__slots__", "__dict__")
+    report("heap bytes, SampledValues", *used)
+    report("bytes per SampledValue", used[0] // SAMPLES, used[1] // SAMPLES)
+    if hasattr(sys, "getsizeof"):
+        report("getsizeof(SampledValue)", size(SampledValue("1")), size(DictSampledValue("1")))
+    report("heap bytes, payload", heap(payload, *slots), heap(payload, *dicts))
+    report(
+        "asdict() us",
+        int(measure(asdict, payload(*slots), repeat=20)), int(measure(asdict_of_dict, payload(*dicts), repeat=20))
+    )
+    report("asdict() heap bytes", heap(asdict, payload(*slots)), heap(asdict_of_dict, payload(*dicts)))
+
+
+if __name__ == "__main__":
+    main()
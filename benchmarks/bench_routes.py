@@ -0,0 +1,75 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_routes.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Time of creating the route map of a charge point, which reuses
+             the route table of its class, and of building the table, as it
+             was done for every instance, with the handlers of 10 classes of
+             all Actions decorated.
+@version   : v1.0.0
+@date      : 2024-05-28 09:51:20
+@copyright : Copyright (c) 2024
+"""
+
+from bench import heap, measure, report
+
+from usr.ocpp import routing
+from usr.ocpp.routing import on, create_route_map
+from usr.ocpp.v16.enums import Action
+
+ACTIONS = [getattr(Action, name) for name in dir(Action) if not name.startswith("_")]
+CLASSES = 10
+
+
+def handler_class(index):
+    """A class with a handler of every Action, each with its own name."""
+    source = ["class ChargePoint%d:\n" % index]
+    for action in ACTIONS:
+        source.append("    @on(%r)\n    def on_%s_%d(self, **kwargs):\n        return self\n" % (action, action, index))
+    namespace = {"on": on}
+    exec("".join(source), namespace)
+    return namespace["ChargePoint%d" % index]
+
+
+def rebuild(obj):
+    """Build the route table of the class again, as for every instance before."""
+    routing._class_routes.pop(type(obj), None)
+    return create_route_map(obj)
+
+
+def dispatch(obj):
+    return create_route_map(obj)[ACTIONS[0]]["_on_action"]()
+
+
+def create(cls, count):
+    return [create_route_map(cls()) for _ in range(count)]
+
+
+def main():
+    classes = [handler_class(i) for i in range(CLASSES)]
+    cls = classes[-1]
+    obj = cls()
+    print("%d routables, %d Actions per class" % (len(routing.routables), len(ACTIONS)))
+    report("route map", "us", "heap bytes")
+    report("rebuilt per instance", int(measure(rebuild, obj, repeat=20)), heap(rebuild, obj))
+    create_route_map(obj)
+    report("from the class table", int(measure(create_route_map, obj, repeat=20)), heap(create_route_map, obj))
+    report("and its first dispatch", int(measure(dispatch, obj, repeat=20)), heap(dispatch, obj))
+    report("1000 instances", int(measure(create, cls, 1000, repeat=1)), heap(create, cls, 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_startup.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Time and heap of importing usr.ocpp.v16 and creating a
+             ChargePoint, then of the payload classes loaded on first use.
+             Run it on the module in a fresh interpreter, modules are only
+             imported once.
+@version   : v1.0.0
+@date      : 2024-05-22 14:03:51
+@copyright : Copyright (c) 2024
+"""
+
+import gc
+
+from bench import ticks_us, ticks_diff, heap, report
+
+# Actions of a charge point which only sends these CALLs.
+USED = ("BootNotification", "Heartbeat", "StatusNotification", "MeterValues")
+
+modules = {}
+
+
+def phase(name, func):
+    elapsed = []
+
+    def timed():
+        start = ticks_us()
+        func()
+        elapsed.append(ticks_diff(ticks_us(), start))
+
+    used = heap(timed)
+    report(name, elapsed[0] // 1000, used)
+
+
+def import_v16():
+    from usr.ocpp import v16
+    modules["v16"] = v16
+
+
+def create_charge_point():
+    modules["cp"] = modules["v16"].ChargePoint("bench", None)
+
+
+def load_used():
+    cp = modules["cp"]
+    for action in USED:
+        getattr(cp._call, action + "Payload")
+        getattr(cp._call_result, action + "Payload")
+
+
+def load_all():
+    from usr.ocpp.v16.enums import Action
+    cp = modules["cp"]
+    for action in dir(Action):
+        if not action.startswith("_"):
+            getattr(cp._call, action + "Payload", None)
+            getattr(cp._call_result, action + "Payload", None)
+
+
+def main():
+    try:
+        import osTimer  # noqa: F401
+    except ImportError:
+        # usr.ocpp.v16 would fall back to the asyncio ChargePoint of CPython.
+        print("bench_startup measures the ChargePoint of QuecPython, run it on the module.")
+        return
+
+    mem_alloc = getattr(gc, "mem_alloc", None)
+    gc.collect()
+    before = mem_alloc() if mem_alloc else None
+
+    report("phase", "ms", "heap bytes")
+    phase("import usr.ocpp.v16", import_v16)
+    phase("ChargePoint()", create_charge_point)
+    gc.collect()
+    started = mem_alloc() if mem_alloc else None
+    phase("%d Actions used" % len(USED), load_used)
+    phase("all other Actions", load_all)
+
+    if mem_alloc:
+        gc.collect()
+        print("gc.mem_alloc(): %d before, %d after startup, %d with all Actions" % (before, started, mem_alloc()))
+
+
+if __name__ == "__main__":
+    main()
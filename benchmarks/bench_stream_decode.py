@@ -0,0 +1,71 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_stream_decode.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Heap and time of decoding a SendLocalList as a whole and item
+             by item from the receive buffer.
+@version   : v1.0.0
+@date      : 2024-05-16 14:25:50
+@copyright : Copyright (c) 2024
+"""
+
+from bench import heap, measure, report
+
+import usr.ocpp.v16  # noqa: F401
+from usr.ocpp.keys import camel_to_snake_case
+from usr.ocpp.messages import Call, unpack, validate_payload, stream_items
+
+
+def send_local_list(count):
+    items = []
+    for i in range(count):
+        items.append({
+            "idTag": "TAG%08d" % i,
+            "idTagInfo": {"status": "Accepted", "expiryDate": "2024-12-31T23:59:59Z", "parentIdTag": "PARENT01"}
+        })
+    message = Call("1", "SendLocalList", {"listVersion": 7, "updateType": "Full", "localAuthorizationList": items})
+    return bytearray(message.to_json().encode())
+
+
+def whole(buf):
+    msg = unpack(str(buf, "utf-8"))
+    msg.payload = camel_to_snake_case(msg.payload)
+    validate_payload(msg, "1.6")
+    for _ in msg.payload["local_authorization_list"]:
+        pass
+
+
+def streamed(buf):
+    msg = unpack(memoryview(buf), ["SendLocalList"])
+    msg.payload = camel_to_snake_case(msg.payload)
+    validate_payload(msg, "1.6")
+    stream_items(msg)
+    for _ in msg.payload["local_authorization_list"]:
+        pass
+
+
+def main():
+    report("SendLocalList", "bytes", "whole heap", "stream heap", "whole us", "stream us")
+    for count in (10, 100, 400):
+        buf = send_local_list(count)
+        report(
+            "%d items" % count, len(buf), heap(whole, buf), heap(streamed, buf),
+            int(measure(whole, buf, repeat=3)), int(measure(streamed, buf, repeat=3))
+        )
+
+
+if __name__ == "__main__":
+    main()
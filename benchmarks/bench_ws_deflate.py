@@ -0,0 +1,127 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_ws_deflate.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Bytes on the wire for a day of charge point traffic, with and
+             without permessage-deflate.
+@version   : v1.0.0
+@date      : 2024-05-15 15:02:44
+@copyright : Copyright (c) 2024
+"""
+
+from bench import report
+
+import usr.ocpp.v16  # noqa: F401
+from usr.ocpp.messages import Call, CallResult
+from usr.tools import wsdeflate
+
+
+def timestamp(second):
+    return "2024-05-15T%02d:%02d:%02dZ" % (second // 3600, second // 60 % 60, second % 60)
+
+
+def day_of_traffic():
+    """
+    Return (sent, received) messages of one charge point for a day: a
+    Heartbeat every 5 minutes, two 4 hour transactions with MeterValues
+    of 4 samples every minute and the StatusNotifications around them.
+    """
+    sent = []
+    received = []
+    uid = [0]
+
+    def call(action, payload, result):
+        uid[0] += 1
+        sent.append(Call(str(uid[0]), action, payload).to_json())
+        received.append(CallResult(str(uid[0]), result).to_json())
+
+    transactions = ((8 * 3600, 12 * 3600), (14 * 3600, 18 * 3600))
+    for second in range(0, 24 * 3600, 60):
+        now = timestamp(second)
+        if second % 300 == 0:
+            call("Heartbeat", {}, {"currentTime": now})
+        for tx, (start, stop) in enumerate(transactions):
+            if second == start:
+                call("StatusNotification", {"connectorId": 1, "errorCode": "NoError", "status": "Charging",
+                                            "timestamp": now}, {})
+                call("StartTransaction", {"connectorId": 1, "idTag": "04A2B3C4D5", "meterStart": 1000 * tx,
+                                          "timestamp": now},
+                     {"transactionId": tx + 1, "idTagInfo": {"status": "Accepted"}})
+            elif start < second < stop:
+                energy = 1000 * tx + (second - start) // 3
+                call("MeterValues", {"connectorId": 1, "transactionId": tx + 1, "meterValue": [{
+                    "timestamp": now,
+                    "sampledValue": [
+                        {"value": str(energy), "context": "Sample.Periodic", "measurand": "Energy.Active.Import.Register", "unit": "Wh"},
+                        {"value": "7360", "context": "Sample.Periodic", "measurand": "Power.Active.Import", "unit": "W"},
+                        {"value": "32.0", "context": "Sample.Periodic", "measurand": "Current.Import", "unit": "A", "phase": "L1"},
+                        {"value": "230.1", "context": "Sample.Periodic", "measurand": "Voltage", "unit": "V", "phase": "L1"},
+                    ]
+                }]}, {})
+            elif second == stop:
+                call("StopTransaction", {"transactionId": tx + 1, "meterStop": 1000 * tx + (stop - start) // 3,
+                                         "timestamp": now, "reason": "Local"},
+                     {"idTagInfo": {"status": "Accepted"}})
+                call("StatusNotification", {"connectorId": 1, "errorCode": "NoError", "status": "Available",
+                                            "timestamp": now}, {})
+    return sent, received
+
+
+def frame_size(length, masked):
+    size = 2 if length < 126 else 4 if length < (1 << 16) else 10
+    return size + (4 if masked else 0) + length
+
+
+def wire_bytes(messages, masked, compressor=None):
+    total = 0
+    for message in messages:
+        data = message.encode()
+        if compressor is not None:
+            data = compressor.compress(data)
+        total += frame_size(len(data), masked)
+    return total
+
+
+def main():
+    sent, received = day_of_traffic()
+    print("%d messages sent, %d received" % (len(sent), len(received)))
+
+    modes = [("uncompressed", None)]
+    if wsdeflate.can_compress():
+        modes.append(("no context takeover", dict(client_no_context_takeover=True, server_no_context_takeover=True)))
+        modes.append(("context takeover", dict()))
+        modes.append(("takeover, 10 bit window", dict(client_max_window_bits=10, server_max_window_bits=10)))
+
+    report("bytes on wire", "sent", "received", "total", "saved")
+    base = None
+    for name, params in modes:
+        if params is None:
+            up = wire_bytes(sent, True)
+            down = wire_bytes(received, False)
+        else:
+            # The server's compressor is modelled with the same parameters.
+            up = wire_bytes(sent, True, wsdeflate.PerMessageDeflate(**params))
+            server = wsdeflate.PerMessageDeflate(**params)
+            server.client_no_context_takeover = server.server_no_context_takeover
+            server.client_max_window_bits = server.server_max_window_bits
+            down = wire_bytes(received, False, server)
+        if base is None:
+            base = up + down
+        report(name, up, down, up + down, "%.1f%%" % (100 - 100.0 * (up + down) / base))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : bench_ws_mask.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Throughput of WebSocket payload masking for 1 KB, 16 KB, 64 KB.
+@version   : v1.0.0
+@date      : 2024-05-13 16:20:12
+@copyright : Copyright (c) 2024
+"""
+
+from bench import measure, report
+
+from usr.tools import wsmask
+
+KEY = b"\x37\xfa\x21\x3d"
+
+
+def mask_generator(data, key):
+    # The masking of uwebsocket before wsmask.
+    return bytes(b ^ key[i % 4] for i, b in enumerate(data))
+
+
+def main():
+    funcs = [("generator", mask_generator), ("mask_bytes", wsmask.mask_bytes)]
+    if wsmask.mask not in (wsmask.mask_bytes, wsmask.mask_int):
+        funcs.append(("viper", wsmask.mask))
+    try:
+        wsmask.mask_int(bytearray(8), KEY)
+        funcs.append(("mask_int", wsmask.mask_int))
+    except Exception:
+        pass
+
+    sizes = (1024, 16 * 1024, 64 * 1024)
+    report("MB/s", *["%d KB" % (size // 1024) for size in sizes])
+    for name, func in funcs:
+        columns = []
+        for size in sizes:
+            buf = bytearray(size)
+            try:
+                us = measure(func, buf, KEY, repeat=5)
+                columns.append("%.2f" % (size / us))
+            except MemoryError:
+                columns.append("-")
+        report(name, *columns)
+
+
+if __name__ == "__main__":
+    main()
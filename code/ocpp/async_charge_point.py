@@ -0,0 +1,242 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :async_charge_point.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :asyncio ChargePoint for the CPython central system side.
+@version   :1.0.0
+@date      :2024-05-10 09:41:26
+@copyright :Copyright (c) 2024
+"""
+
+import uuid
+import asyncio
+import inspect
+import logging
+
+from usr.ocpp.keys import register_schemas
+from usr.ocpp.messages import Call, MessageType, unpack, encode, decode, _raise_key_error
+from usr.ocpp.exceptions import OCPPError, TimeoutError
+from usr.ocpp.routing import create_route_map
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ChargePoint:
+    """
+    asyncio version of `usr.ocpp.charge_point.ChargePoint`.
+
+    It uses the same routing decorators and payload classes. `@on` handlers
+    may be coroutines, `@after` hooks returning a coroutine are scheduled as
+    tasks. The connection must provide `async recv()` and `async send()`, e.g.
+    a connection of the `websockets` package.
+    """
+
+    def __init__(self, id, connection, response_timeout=30):
+        """
+
+        Args:
+
+            charger_id (str): ID of the charger.
+            connection: Connection to CP.
+            response_timeout (int): When no response on a request is received
+                within this interval, a TimeoutError is raised.
+
+        """
+        self.id = id
+
+        # The maximum time in seconds it may take for a CP to respond to a
+        # CALL. A TimeoutError will be raised if this limit has been exceeded.
+        self._response_timeout = response_timeout
+
+        self._connection = connection
+
+        # A dictionary that hooks for Actions. So if the CS receives a it will
+        # look up the Action into this map and execute the corresponding hooks
+        # if exists.
+        self.route_map = create_route_map(self)
+
+        register_schemas(getattr(self, "_call", None), getattr(self, "_call_result", None))
+
+        self._call_lock = asyncio.Lock()
+
+        # Futures of the CALLs waiting for their CallResult or CallError,
+        # by unique id.
+        self._pending = {}
+
+        # Function used to generate unique ids for CALLs. By default
+        # uuid.uuid4() is used, but it can be changed. This is meant primarily
+        # for testing purposes to have predictable unique ids.
+        self._unique_id_generator = uuid.uuid4
+
+    async def start(self):
+        while True:
+            message = await self._connection.recv()
+            LOGGER.info("%s: receive message %s", self.id, message)
+
+            await self.route_message(message)
+
+    async def route_message(self, raw_msg):
+        """
+        Route a message received from a CP.
+
+        If the message is a of type Call the corresponding hooks are executed.
+        If the message is of type CallResult or CallError the future of the
+        waiting call() is completed.
+        """
+        if not raw_msg:
+            return
+
+        try:
+            msg = unpack(raw_msg)
+        except OCPPError as e:
+            LOGGER.error(
+                "Unable to parse message: '%s', it doesn't seem "
+                "to be valid OCPP: %s", raw_msg, e
+            )
+            return
+
+        if msg.message_type_id == MessageType.Call:
+            try:
+                await self._handle_call(msg)
+            except OCPPError as error:
+                LOGGER.exception("Error while handling request '%s'", msg)
+                response = msg.create_call_error(error).to_json()
+                await self._send(response)
+
+        elif msg.message_type_id in [MessageType.CallResult, MessageType.CallError]:
+            future = self._pending.pop(msg.unique_id, None)
+            if future is None or future.done():
+                LOGGER.error("Ignoring response with unknown unique id: %s", msg)
+                return
+            future.set_result(msg)
+
+    async def _handle_call(self, msg):
+        """
+        Execute all hooks installed for based on the Action of the message.
+
+        First the '_on_action' hook is executed and its response is returned to
+        the client. If there is no '_on_action' hook for Action in the message
+        a CallError with a NotImplementedError is returned. If the Action is
+        not supported by the OCPP version a NotSupportedError is returned.
+
+        Next the '_after_action' hook is executed.
+
+        """
+        try:
+            handlers = self.route_map[msg.action]
+        except KeyError:
+            _raise_key_error(msg.action, self._ocpp_version)
+            return
+
+        decode(msg, self._ocpp_version, not handlers.get("_skip_schema_validation", False))
+
+        try:
+            handler = handlers["_on_action"]
+        except KeyError:
+            _raise_key_error(msg.action, self._ocpp_version)
+
+        try:
+            # call_unique_id should be passed as kwarg only if is defined explicitly
+            # in the handler signature
+            if handler._call_unique_id_required:
+                response = handler(**msg.payload, call_unique_id=msg.unique_id)
+            else:
+                response = handler(**msg.payload)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as e:
+            LOGGER.exception("Error while handling request '%s'", msg)
+            response = msg.create_call_error(e).to_json()
+            await self._send(response)
+
+            return
+
+        # Optional arguments which were not set and have a default value of
+        # None are left out, see encode().
+        await self._send(encode(
+            msg.create_call_result(None), response, self._ocpp_version,
+            not handlers.get("_skip_schema_validation", False)
+        ))
+
+        try:
+            handler = handlers["_after_action"]
+        except KeyError:
+            # '_on_after' hooks are not required. Therefore ignore exception
+            # when no '_on_after' hook is installed.
+            return
+
+        if handler._call_unique_id_required:
+            response = handler(**msg.payload, call_unique_id=msg.unique_id)
+        else:
+            response = handler(**msg.payload)
+        # Create task to avoid blocking when making a call inside the
+        # after handler
+        if inspect.isawaitable(response):
+            asyncio.ensure_future(response)
+        return response
+
+    async def call(self, payload, suppress=True, unique_id=None):
+        """
+        Send Call message to client and return payload of response.
+
+        See `usr.ocpp.charge_point.ChargePoint.call()`. Only one call waits
+        for its response at a time, as required by the OCPP specification.
+        """
+        unique_id = (
+            unique_id if unique_id is not None else str(self._unique_id_generator())
+        )
+
+        call = Call(
+            unique_id=unique_id,
+            action=payload.__class__.__name__[:-7],
+            payload=None,
+        )
+
+        message = encode(call, payload, self._ocpp_version)
+        # Use a lock to prevent make sure that only 1 message can be send at a
+        # a time.
+        async with self._call_lock:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[call.unique_id] = future
+            try:
+                await self._send(message)
+                response = await asyncio.wait_for(future, self._response_timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    "Waited {}s for response on "
+                    "{}.".format(self._response_timeout, message)
+                )
+            finally:
+                self._pending.pop(call.unique_id, None)
+
+        if response.message_type_id == MessageType.CallError:
+            LOGGER.warning("Received a CALLError: %s'", response)
+            if suppress:
+                return
+            raise response.to_exception()
+        else:
+            response.action = call.action
+            decode(response, self._ocpp_version)
+
+        cls = getattr(self._call_result, payload.__class__.__name__)  # noqa
+        return cls(**response.payload)
+
+    async def _send(self, message):
+        LOGGER.info("%s: send %s", self.id, message)
+        await self._connection.send(message)
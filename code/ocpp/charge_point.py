@@ -25,7 +25,6 @@
 """
 
 import sys
-import ure
 import utime
 import queue
 import osTimer
@@ -34,122 +33,31 @@ import _thread
 from usr.tools import uuid
 from usr.tools import logging
 
-from usr.ocpp.dataclasses import asdict
-from usr.ocpp.messages import Call, MessageType, unpack, validate_payload
-from usr.ocpp.exceptions import (
-    NotImplementedError,
-    NotSupportedError,
-    OCPPError,
-    TimeoutError
+from usr.ocpp.keys import register_schemas, snake_to_camel_case
+from usr.ocpp.messages import (
+    Call, MessageType, STREAMED_ITEMS, unpack, stream_items, encode, decode, _raise_key_error
 )
+from usr.ocpp.exceptions import OCPPError, InternalError, TimeoutError
 from usr.ocpp.routing import create_route_map
+from usr.ocpp.metrics import UNPACK, DECODE, HANDLER, ENCODE, SEND, RTT, OTHER
 
 LOGGER = logging.getLogger(__name__)
 
 
-def camel_to_snake_items(data):
-    codes = []
-    _code_ = ""
-    for index, item in enumerate(data):
-        if ure.match(r"[A-Z]", item):
-            if index + 1 < len(data):
-                if not ure.match(r"[A-Z]", data[index + 1]):
-                    if index != 0:
-                        codes.append(_code_)
-                        _code_ = ""
-                else:
-                    if ure.match(r"[A-Z]*([a-z0-9]+)", _code_):
-                        codes.append(_code_)
-                        _code_ = ""
-        _code_ += item
-
-    if _code_:
-        codes.append(_code_)
-
-    return codes
-
-
-def camel_to_snake_case(data):
-    """
-    Convert all keys of all dictionaries inside the given argument from
-    camelCase to snake_case.
-
-    Inspired by: https://stackoverflow.com/a/1176023/1073222
-
-    """
-    if isinstance(data, dict):
-        return {"_".join(camel_to_snake_items(key)).lower(): camel_to_snake_case(value) for key, value in data.items()}
-
-    if isinstance(data, list):
-        return [camel_to_snake_case(value) for value in data]
-
-    return data
-
-
-def snake_to_camel_case(data):
-    """
-    Convert all keys of all dictionaries inside given argument from
-    snake_case to camelCase.
-
-    Inspired by: https://stackoverflow.com/a/19053800/1073222
-    """
-    if isinstance(data, dict):
-        camel_case_dict = {}
-        for key, value in data.items():
-            components = key.replace("soc", "SoC").replace("_v2x", "V2X").split("_")
-            key = components[0] + "".join(x[:1].upper() + x[1:] for x in components[1:])
-            camel_case_dict[key] = snake_to_camel_case(value)
-
-        return camel_case_dict
-
-    if isinstance(data, list):
-        return [snake_to_camel_case(value) for value in data]
-
-    return data
-
-
-def remove_nones(data):
-    if isinstance(data, dict):
-        return {k: remove_nones(v) for k, v in data.items() if v is not None}
-
-    elif isinstance(data, list):
-        return [remove_nones(v) for v in data if v is not None]
-
-    return data
+# Put into a Queue by its timer when the deadline of a wait has passed.
+_TIMEOUT = object()
 
 
-def _raise_key_error(action, version):
-    """
-    Checks whether a keyerror returned by _handle_call
-    is supported by the OCPP version or is simply
-    not implemented by the server/client and raises
-    the appropriate error.
-    """
+class _Lost(object):
+    """Put into the Queues of the calls waiting on a connection which is lost."""
 
-    from ocpp.v16.enums import Action as v16_Action
-    # from ocpp.v201.enums import Action as v201_Action
+    def __init__(self, connection):
+        self.connection = connection
 
-    if version == "1.6":
-        if hasattr(v16_Action, action):
-            raise NotImplementedError(
-                None, {"cause": "No handler for {action} registered.".format(action=action)}
-            )
-        else:
-            raise NotSupportedError(
-                None, {"cause": "{action} not supported by OCPP{version}.".format(action=action, version=version)}
-            )
-    else:
-        # elif version in ["2.0", "2.0.1"]:
-        #     if hasattr(v201_Action, action):
-        #         raise NotImplementedError(
-        #             None, {"cause": f"No handler for {action} registered."}
-        #         )
-        #     else:
-        raise NotSupportedError(
-            None, {"cause": "{action} not supported by OCPP{version}.".format(action=action, version=version)}
-        )
 
-    return
+def deadline_ms(timeout):
+    """Return the absolute utime.ticks_ms() deadline of a timeout in seconds."""
+    return utime.ticks_add(utime.ticks_ms(), int(timeout * 1000))
 
 
 class Queue(queue.Queue):
@@ -157,20 +65,52 @@ class Queue(queue.Queue):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._timer = osTimer()
-        self._timeout_tag = 0
 
     def _timeout(self, args):
-        self._timeout_tag = 1
-        super().put(args)
+        super().put(_TIMEOUT)
 
     def get(self, timeout):
-        self._timeout_tag = 0
-        self._timer.start(timeout * 1000, 0, self._timeout)
-        data = super().get()
-        self._timer.stop()
-        if data is None and self._timeout_tag == 1:
+        return self.get_until(deadline_ms(timeout))
+
+    def get_until(self, deadline, accept=None):
+        """
+        Return the next item accepted by `accept`, waiting until the absolute
+        `deadline` (utime.ticks_ms()) at most. Items which are not accepted
+        are dropped. The timer is armed once for the whole wait.
+        """
+        remaining = utime.ticks_diff(deadline, utime.ticks_ms())
+        if remaining <= 0:
             raise TimeoutError
-        return data
+        self._timer.start(remaining, 0, self._timeout)
+        try:
+            while True:
+                data = super().get()
+                if data is _TIMEOUT:
+                    remaining = utime.ticks_diff(deadline, utime.ticks_ms())
+                    if remaining <= 0:
+                        raise TimeoutError
+                    # Left over from an earlier wait or fired too early,
+                    # wait for the rest of the time.
+                    self._timer.start(remaining, 0, self._timeout)
+                    continue
+                if accept is None or accept(data):
+                    return data
+                # The timer's _TIMEOUT is queued behind a burst of items
+                # which aren't accepted, don't wait for it to come up.
+                if utime.ticks_diff(deadline, utime.ticks_ms()) <= 0:
+                    raise TimeoutError
+        finally:
+            self._timer.stop()
+
+    def clear(self):
+        while not self.empty():
+            super().get()
+
+
+def _check_lost(response):
+    if isinstance(response, _Lost):
+        raise OSError("connection lost")
+    return response
 
 
 class ChargePoint:
@@ -179,7 +119,7 @@ class ChargePoint:
     initiated and received by the Central System
     """
 
-    def __init__(self, id, connection, response_timeout=30):
+    def __init__(self, id, connection, response_timeout=30, max_in_flight=1, journal=None, workers=None, metrics=None):
         """
 
         Args:
@@ -188,6 +128,20 @@ class ChargePoint:
             connection: Connection to CP.
             response_timeout (int): When no response on a request is received
                 within this interval, a asyncio.TimeoutError is raised.
+            max_in_flight (int): Number of CALLs which may wait for their
+                response at the same time. The default of 1 serializes all
+                CALLs as required by the OCPP specification. Only set it
+                higher when the other side is known to accept it.
+            journal (Journal): `usr.ocpp.journal.Journal` keeping the
+                transaction related CALLs until they have been responded
+                to, see `replay()`.
+            workers (WorkerPool): `usr.ocpp.workers.WorkerPool` running the
+                handlers of the CALLs received, so a slow handler doesn't
+                hold up the receive loop. By default they run in the
+                receive loop one after the other.
+            metrics (Metrics): `usr.ocpp.metrics.Metrics`, or any object
+                with its record() method, given the time of every stage
+                of the messages by Action.
 
         """
         self.id = id
@@ -205,21 +159,87 @@ class ChargePoint:
         # if exists.
         self.route_map = create_route_map(self)
 
+        # Actions whose handlers take their large array as an iterator. Their
+        # CALLs are decoded from the receive buffer, see `on(stream_items)`.
+        self._streamed = [
+            action for action, handlers in self.route_map.routes.items()
+            if handlers.get("_stream_items", False) and action in STREAMED_ITEMS
+        ]
+
+        # Build the camelCase <-> snake_case key tables from the payload
+        # schemas, so translating a key is a dictionary lookup. Lazily loaded
+        # payload modules add the keys of each class on its first use.
+        register_schemas(getattr(self, "_call", None), getattr(self, "_call_result", None))
+
         self._call_lock = _thread.allocate_lock()
 
         # A queue used to pass CallResults and CallErrors from
         # the self.serve() task to the self.call() task.
         self._response_queue = Queue()
 
+        # With more than one CALL in flight every CALL waits on its own queue,
+        # registered by unique id in this table. The waiters are preallocated
+        # and handed out by `_waiters`, which blocks when the window is full.
+        self._max_in_flight = max_in_flight
+        self._pending = None
+        if max_in_flight > 1:
+            self._pending = {}
+            self._pending_lock = _thread.allocate_lock()
+            self._waiters = queue.Queue(max_in_flight)
+            for _ in range(max_in_flight):
+                self._waiters.put(Queue())
+
+        # CALLs of the Actions of the journal are appended to it before they
+        # are sent. Once one of them isn't delivered the ChargePoint is
+        # offline: they are only appended until replay() has sent them all.
+        self._journal = journal
+        self._offline = journal is not None and len(journal) > 0
+        self._offline_lock = _thread.allocate_lock()
+
+        self._workers = workers
+        self._metrics = metrics
+
         # Function used to generate unique ids for CALLs. By default
         # uuid.uuid4() is used, but it can be changed. This is meant primarily
         # for testing purposes to have predictable unique ids.
         self._unique_id_generator = uuid.uuid4
 
+    def bind(self, connection):
+        """
+        Use a new connection, e.g. after a reconnect. The routes, the
+        payload caches and the journal are kept.
+        """
+        self._connection = connection
+
+    def connection_lost(self):
+        """
+        Detach the connection which has been lost. The calls waiting for a
+        response fail at once instead of waiting for their timeout, and
+        calls are refused until bind() is called.
+        """
+        lost = _Lost(self._connection)
+        self._connection = None
+        if self._journal is not None:
+            with self._offline_lock:
+                self._offline = True
+        if self._pending is None:
+            self._response_queue.put(lost)
+        else:
+            with self._pending_lock:
+                for waiter in self._pending.values():
+                    waiter.put(lost)
+
     def start(self):
+        if self._workers is not None:
+            self._workers.start()
         while True:
-            message = self._connection.recv()
-            LOGGER.info("%s: receive message %s" % (self.id, message))
+            if self._streamed:
+                # The receive buffer itself, valid until the next recv().
+                message = self._connection.recv(False)
+                LOGGER.info("%s: receive message of %s bytes", self.id, len(message) if message else 0)
+            else:
+                message = self._connection.recv()
+                LOGGER.info("%s: receive message %s", self.id, message)
 
             self.route_message(message)
 
@@ -232,26 +252,59 @@ class ChargePoint:
         to the call() function via the response_queue.
         """
         if raw_msg:
+            start = utime.ticks_us()
             try:
-                msg = unpack(raw_msg)
+                msg = unpack(raw_msg, self._streamed)
             except OCPPError as e:
                 LOGGER.error(
                     "Unable to parse message: '%s', it doesn't seem "
-                    "to be valid OCPP: %s" % (raw_msg, e)
+                    "to be valid OCPP: %s", raw_msg, e
                 )
                 return
+            if self._metrics is not None:
+                self._lap(msg.action if msg.message_type_id == MessageType.Call else OTHER, UNPACK, start)
 
             if msg.message_type_id == MessageType.Call:
-                try:
-                    self._handle_call(msg)
-                except OCPPError as error:
-                    sys.print_exception(error)
-                    LOGGER.error("Error while handling request '%s'" % msg)
-                    response = msg.create_call_error(error).to_json()
-                    self._send(response)
+                if self._workers is None:
+                    self._dispatch(msg)
+                else:
+                    self._submit(msg)
 
             if msg.message_type_id in [MessageType.CallResult, MessageType.CallError]:
-                self._response_queue.put(msg)
+                if self._pending is None:
+                    self._response_queue.put(msg)
+                else:
+                    self._complete_pending(msg)
+
+    def _dispatch(self, msg):
+        try:
+            self._handle_call(msg)
+        except OCPPError as error:
+            sys.print_exception(error)
+            LOGGER.error("Error while handling request '%s'", msg)
+            response = msg.create_call_error(error).to_json()
+            self._send(response)
+
+    def _submit(self, msg):
+        """Hand a CALL over to the worker pool, refuse it when the pool is full."""
+        if msg.streamed is not None:
+            # The streamed array is read from the receive buffer, which the
+            # next recv() overwrites.
+            buf, start, end = msg.streamed
+            msg.streamed = (bytes(buf[start:end]), 0, end - start)
+        if not self._workers.submit(msg.action, self._dispatch, msg):
+            LOGGER.warn("%s: too many requests queued, refusing %s %s", self.id, msg.action, msg.unique_id)
+            error = InternalError("Too many requests queued, try again later")
+            self._send(msg.create_call_error(error).to_json())
+
+    def _complete_pending(self, msg):
+        """Pass the response to the call() waiting for its unique id."""
+        with self._pending_lock:
+            waiter = self._pending.pop(msg.unique_id, None)
+            if waiter is not None:
+                waiter.put(msg)
+                return
+        LOGGER.error("Ignoring response with unknown unique id: %s", msg)
 
     def _handle_call(self, msg):
         """
@@ -271,16 +324,20 @@ class ChargePoint:
             _raise_key_error(msg.action, self._ocpp_version)
             return
 
-        msg.payload = camel_to_snake_case(msg.payload)
-        if not handlers.get("_skip_schema_validation", False):
-            validate_payload(msg, self._ocpp_version)
         # OCPP uses camelCase for the keys in the payload. It's more pythonic
         # to use snake_case for keyword arguments. Therefore the keys must be
         # 'translated'. Some examples:
         #
         # * chargePointVendor becomes charge_point_vendor
         # * firmwareVersion becomes firmwareVersion
-        # snake_case_payload = camel_to_snake_case(msg.payload)
+        #
+        # The nested objects become instances of their payload classes.
+        start = utime.ticks_us()
+        decode(msg, self._ocpp_version, not handlers.get("_skip_schema_validation", False))
+        if msg.streamed is not None:
+            stream_items(msg, not handlers.get("_skip_schema_validation", False))
+        if self._metrics is not None:
+            start = self._lap(msg.action, DECODE, start)
 
         try:
             handler = handlers["_on_action"]
@@ -296,34 +353,29 @@ class ChargePoint:
                 response = handler(**msg.payload)
             # if inspect.isawaitable(response):
             #     response = await response
+            if self._metrics is not None:
+                start = self._lap(msg.action, HANDLER, start)
         except Exception as e:
             sys.print_exception(e)
-            LOGGER.error("Error while handling request '%s'" % msg)
+            LOGGER.error("Error while handling request '%s'", msg)
             response = snake_to_camel_case(msg.create_call_error(e).to_json())
             self._send(response)
 
             return
 
-        temp_response_payload = asdict(response)
-
-        # Remove nones ensures that we strip out optional arguments
-        # which were not set and have a default value of None
-        response_payload = remove_nones(temp_response_payload)
-
-        # The response payload must be 'translated' from snake_case to
-        # camelCase. So:
+        # Optional arguments which were not set and have a default value of
+        # None are left out and the response payload is 'translated' from
+        # snake_case to camelCase, while it's written as JSON. So:
         #
         # * charge_point_vendor becomes chargePointVendor
         # * firmware_version becomes firmwareVersion
-        # camel_case_payload = snake_to_camel_case(response_payload)
-
-        response = msg.create_call_result(response_payload)
-
-        if not handlers.get("_skip_schema_validation", False):
-            validate_payload(response, self._ocpp_version)
-
-        response.payload = snake_to_camel_case(response.payload)
-        self._send(response.to_json())
+        message = encode(
+            msg.create_call_result(None), response, self._ocpp_version,
+            not handlers.get("_skip_schema_validation", False)
+        )
+        if self._metrics is not None:
+            self._lap(msg.action, ENCODE, start)
+        self._send(message, msg.action)
 
         try:
             handler = handlers["_after_action"]
@@ -357,7 +409,13 @@ class ChargePoint:
 
         When waiting for a response no other Call message can be send. So this
         function will wait before response arrives or response timeout has
-        expired. This is in line the OCPP specification
+        expired. This is in line the OCPP specification. If the ChargePoint
+        has been created with `max_in_flight` larger than 1, up to that many
+        calls can wait for their responses at the same time.
+
+        CALLs of the Actions of the journal don't raise when they can't be
+        delivered, None is returned and they are sent again by replay().
+        While offline they are only appended to the journal.
 
         Suppress is used to maintain backwards compatibility. When set to True,
         if response is a CallError, then this call will be suppressed. When
@@ -365,8 +423,6 @@ class ChargePoint:
         CallError.
 
         """
-        camel_case_payload = asdict(payload)
-
         unique_id = (
             unique_id if unique_id is not None else str(self._unique_id_generator())
         )
@@ -374,35 +430,65 @@ class ChargePoint:
         call = Call(
             unique_id=unique_id,
             action=payload.__class__.__name__[:-7],
-            payload=remove_nones(camel_case_payload),
+            payload=None,
         )
 
-        validate_payload(call, self._ocpp_version)
+        # Validated, without Nones and in camelCase, see encode().
+        start = utime.ticks_us()
+        message = encode(call, payload, self._ocpp_version)
+        if self._metrics is not None:
+            self._lap(call.action, ENCODE, start)
+
+        journaled = self._journal is not None and call.action in self._journal.actions
+        if journaled:
+            with self._offline_lock:
+                offline = self._offline
+                journaled = self._journal.append(call.unique_id, call.action, message, not offline)
+            if offline:
+                LOGGER.warn("Offline, %s %s queued in the journal.", call.action, call.unique_id)
+                return
 
-        call.payload = snake_to_camel_case(call.payload)
-        # Use a lock to prevent make sure that only 1 message can be send at a
-        # a time.
-        with self._call_lock:
-            self._send(call.to_json())
-            try:
-                response = self._get_specific_response(
-                    call.unique_id, self._response_timeout
-                )
-            except TimeoutError:
-                raise TimeoutError(
-                    "Waited {}s for response on "
-                    "{}.".format(self._response_timeout, call.to_json())
-                )
+        try:
+            if self._pending is None:
+                # Use a lock to prevent make sure that only 1 message can be
+                # send at a time.
+                with self._call_lock:
+                    connection = self._connection
+                    start = utime.ticks_us()
+                    self._send(message, call.action)
+                    response = self._get_specific_response(
+                        call.unique_id, self._response_timeout, connection
+                    )
+                    if self._metrics is not None:
+                        self._lap(call.action, RTT, start)
+            else:
+                response = self._get_pending_response(call, message)
+        except TimeoutError:
+            if journaled:
+                return self._went_offline(call, "no response")
+            raise TimeoutError(
+                "Waited {}s for response on "
+                "{}.".format(self._response_timeout, message)
+            )
+        except Exception as e:
+            if journaled:
+                return self._went_offline(call, e)
+            raise
+
+        if journaled:
+            self._journal.ack(call.unique_id)
 
         if response.message_type_id == MessageType.CallError:
-            LOGGER.warn("Received a CALLError: %s'" % response)
+            LOGGER.warn("Received a CALLError: %s'", response)
             if suppress:
                 return
             raise response.to_exception()
         else:
             response.action = call.action
-            response.payload = camel_to_snake_case(response.payload)
-            validate_payload(response, self._ocpp_version)
+            start = utime.ticks_us()
+            decode(response, self._ocpp_version)
+            if self._metrics is not None:
+                self._lap(call.action, DECODE, start)
 
         # Create the correct Payload instance based on the received payload. If
         # this method is called with a call.BootNotificationPayload, then it
@@ -412,28 +498,137 @@ class ChargePoint:
         cls = getattr(self._call_result, payload.__class__.__name__)  # noqa
         return cls(**response.payload)
 
-    def _get_specific_response(self, unique_id, timeout):
+    def _went_offline(self, call, reason):
+        """Leave a journaled CALL which hasn't been delivered to replay()."""
+        with self._offline_lock:
+            self._offline = True
+        self._journal.release(call.unique_id)
+        LOGGER.warn("%s %s not delivered (%s), queued in the journal.", call.action, call.unique_id, reason)
+
+    def replay(self, window=None):
         """
-        Return response with given unique ID or raise an asyncio.TimeoutError.
+        Send the CALLs queued in the journal, oldest first, and remove each
+        one from the journal on its response. Call it once the connection is
+        back, until it returns new journaled CALLs are queued behind.
+
+        Up to `window` CALLs, `max_in_flight` by default, are sent before
+        waiting for their responses, so a long backlog isn't sent one round
+        trip at a time. Like `max_in_flight`, only set it higher than 1 when
+        the other side is known to accept it.
+
+        Return the number of CALLs delivered. On a timeout or a connection
+        error the rest is left in the journal for the next replay().
         """
-        wait_until = utime.time() + timeout
-        try:
-            # Wait for response of the Call message.
-            response = self._response_queue.get(wait_until)
-        except TimeoutError:
-            raise
+        if self._journal is None:
+            return 0
+        window = window or self._max_in_flight
+        if self._pending is None:
+            with self._call_lock:
+                return self._replay(window, self._response_queue)
+        return self._replay(window, Queue())
+
+    def _replay(self, window, responses):
+        # Unique ids of the CALLs sent and waiting for their response.
+        sent = {}
+        delivered = 0
+        connection = self._connection
+
+        def accept(response):
+            if isinstance(response, _Lost):
+                return response.connection is connection
+            return getattr(response, "unique_id", None) in sent
 
-        if hasattr(response, "unique_id") and response.unique_id == unique_id:
-            return response
+        try:
+            while True:
+                records = self._journal.records()
+                try:
+                    for unique_id, message in records:
+                        while len(sent) >= window:
+                            delivered += self._replayed(responses, sent, accept)
+                        sent[unique_id] = True
+                        if self._pending is not None:
+                            with self._pending_lock:
+                                self._pending[unique_id] = responses
+                        self._send(message)
+                finally:
+                    records.close()
+                while sent:
+                    delivered += self._replayed(responses, sent, accept)
+                with self._offline_lock:
+                    if self._journal.backlog() <= 0:
+                        self._offline = False
+                        break
+        except Exception as e:
+            LOGGER.warn("Replay stopped after %d CALLs: %r", delivered, e)
+        finally:
+            if self._pending is not None:
+                with self._pending_lock:
+                    for unique_id in sent:
+                        self._pending.pop(unique_id, None)
+        LOGGER.info("Replayed %d CALLs, %d left in the journal.", delivered, len(self._journal))
+        return delivered
+
+    def _replayed(self, responses, sent, accept):
+        """Wait for the response to one of the CALLs replayed and acknowledge it."""
+        response = _check_lost(responses.get_until(deadline_ms(self._response_timeout), accept))
+        del sent[response.unique_id]
+        if response.message_type_id == MessageType.CallError:
+            LOGGER.warn("Received a CALLError on replay: %s", response)
+        self._journal.ack(response.unique_id)
+        return 1
 
-        LOGGER.error("Ignoring response with unknown unique id: %s" % response)
-        timeout_left = wait_until - utime.time()
+    def _get_specific_response(self, unique_id, timeout, connection=None):
+        """
+        Return response with given unique ID or raise a TimeoutError.
 
-        if timeout_left < 0:
-            raise TimeoutError
+        Responses with another unique ID are dropped, the whole wait is
+        bounded by a single deadline. Raise OSError when `connection` is
+        lost meanwhile.
+        """
+        def accept(response):
+            if isinstance(response, _Lost):
+                return response.connection is connection
+            if getattr(response, "unique_id", None) == unique_id:
+                return True
+            LOGGER.error("Ignoring response with unknown unique id: %s", response)
+            return False
 
-        return self._get_specific_response(unique_id, timeout_left)
+        return _check_lost(self._response_queue.get_until(deadline_ms(timeout), accept))
 
-    def _send(self, message):
-        LOGGER.info("%s: send %s" % (self.id, message))
+    def _get_pending_response(self, call, message):
+        """
+        Send the call, `message` being its JSON, and wait for the response
+        with its unique ID, while other calls may be waiting for their
+        responses too.
+        """
+        # Blocks until a slot of the in-flight window becomes free.
+        waiter = self._waiters.get()
+        try:
+            waiter.clear()
+            with self._pending_lock:
+                self._pending[call.unique_id] = waiter
+            start = utime.ticks_us()
+            self._send(message, call.action)
+            response = _check_lost(waiter.get(self._response_timeout))
+            if self._metrics is not None:
+                self._lap(call.action, RTT, start)
+            return response
+        finally:
+            with self._pending_lock:
+                self._pending.pop(call.unique_id, None)
+            self._waiters.put(waiter)
+
+    def _send(self, message, action=OTHER):
+        LOGGER.info("%s: send %s", self.id, message)
+        if self._connection is None:
+            raise OSError("not connected")
+        start = utime.ticks_us()
         self._connection.send(message)
+        if self._metrics is not None:
+            self._lap(action, SEND, start)
+
+    def _lap(self, action, stage, start):
+        """Record the time of `stage` since `start` (utime.ticks_us()), return the time now."""
+        now = utime.ticks_us()
+        self._metrics.record(action, stage, utime.ticks_diff(now, start))
+        return now
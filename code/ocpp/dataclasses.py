@@ -24,6 +24,8 @@
 @copyright :Copyright (c) 2024
 """
 
+import sys
+
 from usr.ocpp.exceptions import SchemaValidationError
 
 
@@ -32,8 +34,30 @@ class StrEnum:
 
 
 class dataclass:
+    # Payload classes list their fields in `__slots__`, in the order of their
+    # schema, see scripts/gen_schemas.py. On CPython their instances have no
+    # __dict__, MicroPython ignores it, asdict() walks it on both, see
+    # fields() for classes which don't list their fields.
+    __slots__ = ()
+
+    # Handlers used to get the nested objects of a payload as dicts, reading
+    # a field as an item keeps them working.
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __repr__(self):
+        return "%s(%s)" % (
+            type(self).__name__, ", ".join("%s=%r" % (key, getattr(self, key)) for key in fields(self))
+        )
 
-    def __schemas__(self):
+    @staticmethod
+    def __schemas__():
         # {"properties": {}, "required": []}
         return {}
 
@@ -45,9 +69,27 @@ class dataclass:
 #     return obj
 
 
+def fields(obj):
+    """
+    Return the names of the fields of a payload object: its `__slots__`,
+    followed by the attributes of a class which doesn't list them, e.g. a
+    subclass without `__slots__`. Attributes starting with "_" are left out.
+    """
+    slots = obj.__slots__
+    attrs = getattr(obj, "__dict__", None)
+    if not attrs or len(attrs) == len(slots) and slots[0] in attrs:
+        # No __dict__ or, on MicroPython, one holding the slots.
+        return slots
+    return tuple(slots) + tuple(key for key in attrs if key not in slots and not key.startswith("_"))
+
+
 def asdict(obj):
     if is_dataclass(obj):
-        return {key: (val if isinstance(val, (int, float, str)) else asdict(val)) for key, val in obj.__dict__.items() if not key.startswith("_")}
+        _dict_ = {}
+        for key in fields(obj):
+            val = getattr(obj, key)
+            _dict_[key] = val if val is None or isinstance(val, (int, float, str)) else asdict(val)
+        return _dict_
     elif isinstance(obj, list):
         return [asdict(i) for i in obj]
     return obj
@@ -57,48 +99,269 @@ def is_dataclass(obj):
     return isinstance(obj, dataclass)
 
 
-def validate_dataclass(data, cls):
-    if data:
+def _check_type(name, key, _type):
+    def check(val):
+        if not isinstance(val, _type):
+            raise SchemaValidationError("type", "%s %s value type is not compared." % (name, key))
+    return check
+
+
+def _check_str(name, key, max_length):
+    def check(val):
+        if not isinstance(val, str):
+            raise SchemaValidationError("type", "%s %s value type is not compared." % (name, key))
+        if len(val) > max_length:
+            raise SchemaValidationError(
+                "maxLength",
+                "%s %s value length %s is larger than maxLength %s." % (name, key, len(val), max_length)
+            )
+    return check
+
+
+def _check_enum(name, key, values):
+    def check(val):
+        if val not in values:
+            raise SchemaValidationError("type", "%s %s value is not in enums." % (name, key))
+    return check
+
+
+def _check_dataclass(validator):
+    def check(val):
+        validator.validate(val)
+    return check
+
+
+def _check_str_items(name, key, max_length):
+    def check(val):
+        if val:
+            for item in val:
+                if not isinstance(item, str):
+                    raise SchemaValidationError("type", "%s %s items type is not string." % (name, key))
+                if max_length and len(item) > max_length:
+                    raise SchemaValidationError(
+                        "maxLength",
+                        "%s %s item length %s is larger than maxLength %s." % (name, key, len(item), max_length)
+                    )
+    return check
+
+
+def _check_dataclass_items(validator):
+    def check(val):
+        if val:
+            for item in val:
+                validator.validate(item)
+    return check
+
+
+def _skip(val):
+    pass
+
+
+def enum_values(enum):
+    """Return the values of a StrEnum class as a frozenset."""
+    return frozenset(v for k, v in enum.__dict__.items() if not k.startswith("_"))
+
+
+class SchemaValidator:
+    """
+    Flat validator of a payload class, compiled once from its `__schemas__`.
+
+    The required keys are kept in a tuple and every property is turned into a
+    check function, so validating a payload doesn't rebuild the schema dict or
+    the enum values again.
+    """
+
+    def __init__(self, cls):
+        self.name = cls.__name__
+        self.required = ()
+        self.checks = None
+        # Payload classes of the nested properties, key: (cls, is list).
+        self.classes = {}
         _schemas_ = cls.__schemas__()
         if _schemas_:
-            for key in _schemas_["required"]:
-                if key not in data.keys():
-                    raise SchemaValidationError("required", "%s required filed %s" % (cls.__name__, key))
-            for key, val in data.items():
-                if key not in _schemas_["properties"].keys():
-                    raise SchemaValidationError("NotExist", "%s %s is not in properties." % (cls.__name__, key))
-                if _schemas_["properties"][key]["type"] in (int, float, str):
-                    if not isinstance(val, _schemas_["properties"][key]["type"]):
-                        raise SchemaValidationError("type", "%s %s value type is not compared." % (cls.__name__, key))
-                if _schemas_["properties"][key]["type"] is str:
-                    if _schemas_["properties"][key].get("maxLength"):
-                        if len(val) > _schemas_["properties"][key]["maxLength"]:
-                            raise SchemaValidationError(
-                                "maxLength",
-                                "%s %s value length %s is larger than maxLength %s." % (
-                                    cls.__name__, key, len(val), _schemas_["properties"][key]["maxLength"]
-                                )
-                            )
-                if _schemas_["properties"][key]["type"] is StrEnum:
-                    _enum_obj = _schemas_["properties"][key]["enum"]
-                    if val not in [v for k, v in _enum_obj.__dict__.items() if not k.startswith("_")]:
-                        raise SchemaValidationError("type", "%s %s value is not in enums." % (cls.__name__, key))
-                if _schemas_["properties"][key]["type"] is dataclass:
-                    validate_dataclass(val, _schemas_["properties"][key]["cls"])
-                if _schemas_["properties"][key]["type"] is list:
-                    if val:
-                        if _schemas_["properties"][key]["items"]["type"] is str:
-                            for item in val:
-                                if not isinstance(item, str):
-                                    raise SchemaValidationError("type", "%s %s items type is not string." % (cls.__name__, key))
-                                if _schemas_["properties"][key]["items"].get("maxLength"):
-                                    if len(item) > _schemas_["properties"][key]["items"].get("maxLength"):
-                                        raise SchemaValidationError(
-                                            "maxLength",
-                                            "%s %s item length %s is larger than maxLength %s." % (
-                                                cls.__name__, key, len(item), _schemas_["properties"][key]["items"]["maxLength"]
-                                            )
-                                        )
-                        if _schemas_["properties"][key]["items"]["type"] is dataclass:
-                            for item in val:
-                                validate_dataclass(item, _schemas_["properties"][key]["items"]["cls"])
+            self.required = tuple(_schemas_["required"])
+            self.checks = {key: self._compile(key, prop) for key, prop in _schemas_["properties"].items()}
+
+    def _compile(self, key, prop):
+        _type = prop["type"]
+        if _type is str:
+            if prop.get("maxLength"):
+                return _check_str(self.name, key, prop["maxLength"])
+            return _check_type(self.name, key, str)
+        if _type in (int, float):
+            return _check_type(self.name, key, _type)
+        if _type is StrEnum:
+            return _check_enum(self.name, key, enum_values(prop["enum"]))
+        if _type is dataclass:
+            self.classes[key] = (prop["cls"], False)
+            return _check_dataclass(get_validator(prop["cls"]))
+        if _type is list:
+            if prop["items"]["type"] is str:
+                return _check_str_items(self.name, key, prop["items"].get("maxLength"))
+            if prop["items"]["type"] is dataclass:
+                self.classes[key] = (prop["items"]["cls"], True)
+                return _check_dataclass_items(get_validator(prop["items"]["cls"]))
+        return _skip
+
+    def keys(self):
+        """Return the snake_case keys of the properties."""
+        return self.checks or ()
+
+    def validate(self, data):
+        if not data or self.checks is None:
+            return
+        for key in self.required:
+            if key not in data:
+                raise SchemaValidationError("required", "%s required filed %s" % (self.name, key))
+        checks = self.checks
+        for key, val in data.items():
+            try:
+                check = checks[key]
+            except KeyError:
+                raise SchemaValidationError("NotExist", "%s %s is not in properties." % (self.name, key))
+            check(val)
+
+    def check(self, key, val):
+        """Validate the value of a single property, as validate() does."""
+        if self.checks is None:
+            return
+        try:
+            check = self.checks[key]
+        except KeyError:
+            raise SchemaValidationError("NotExist", "%s %s is not in properties." % (self.name, key))
+        check(val)
+
+
+# Kinds of the properties of the constant schema tables.
+ANY = 0
+STR = 1
+INT = 2
+FLOAT = 3
+ENUM = 4
+OBJECT = 5
+STR_LIST = 6
+OBJECT_LIST = 7
+
+
+def use_tables(namespace, prefix, tables):
+    """
+    Validate the payload classes found in `namespace`, the globals() of
+    their module, with the constant tables of the generated module `tables`
+    (e.g. `usr.ocpp.v16.schemas`) rather than their `__schemas__`. The table
+    of a class is named `prefix` followed by the name of the class.
+    """
+    for name, cls in namespace.items():
+        if isinstance(cls, type) and issubclass(cls, dataclass) and hasattr(tables, prefix + name):
+            cls.__table__ = (tables, prefix + name)
+
+
+class TableValidator:
+    """
+    Validator of a payload class reading its constant schema table, which is
+    None for an empty schema or (required keys, properties), a property
+    being (key, kind, argument). The argument is the maxLength of a string
+    (0 for none), the name of the tuple of values of an enum in the module
+    of the tables, or the name of the class of an object in the module
+    named by its DATATYPES.
+
+    The table is read as it is, validating a payload allocates nothing, so
+    the tables can be frozen into the firmware and stay in flash. Only a
+    dict from the keys to the properties of the table is built in RAM, once
+    per class, so a key is looked up without scanning the properties.
+    """
+
+    def __init__(self, cls, tables, table):
+        self.name = cls.__name__
+        self.tables = tables
+        self.required, self.properties = getattr(tables, table) or ((), None)
+        # key: (key, kind, argument) of the table.
+        self._index = {}
+        # Payload classes of the nested properties, key: (cls, is list).
+        self.classes = {}
+        for prop in self.properties or ():
+            key, kind, arg = prop
+            self._index[key] = prop
+            if kind == OBJECT or kind == OBJECT_LIST:
+                __import__(tables.DATATYPES)
+                self.classes[key] = (getattr(sys.modules[tables.DATATYPES], arg), kind == OBJECT_LIST)
+
+    def keys(self):
+        """Return the snake_case keys of the properties."""
+        return [prop[0] for prop in self.properties or ()]
+
+    def validate(self, data):
+        if not data or self.properties is None:
+            return
+        for key in self.required:
+            if key not in data:
+                raise SchemaValidationError("required", "%s required filed %s" % (self.name, key))
+        index = self._index
+        for key, val in data.items():
+            prop = index.get(key)
+            if prop is None:
+                raise SchemaValidationError("NotExist", "%s %s is not in properties." % (self.name, key))
+            self._check(key, prop[1], prop[2], val)
+
+    def check(self, key, val):
+        """Validate the value of a single property, as validate() does."""
+        if self.properties is None:
+            return
+        prop = self._index.get(key)
+        if prop is None:
+            raise SchemaValidationError("NotExist", "%s %s is not in properties." % (self.name, key))
+        self._check(key, prop[1], prop[2], val)
+
+    def _check(self, key, kind, arg, val):
+        if kind == STR:
+            if not isinstance(val, str):
+                raise SchemaValidationError("type", "%s %s value type is not compared." % (self.name, key))
+            if arg and len(val) > arg:
+                raise SchemaValidationError(
+                    "maxLength",
+                    "%s %s value length %s is larger than maxLength %s." % (self.name, key, len(val), arg)
+                )
+        elif kind == INT or kind == FLOAT:
+            if not isinstance(val, int if kind == INT else float):
+                raise SchemaValidationError("type", "%s %s value type is not compared." % (self.name, key))
+        elif kind == ENUM:
+            if val not in getattr(self.tables, arg):
+                raise SchemaValidationError("type", "%s %s value is not in enums." % (self.name, key))
+        elif kind == OBJECT:
+            get_validator(self.classes[key][0]).validate(val)
+        elif kind == STR_LIST:
+            if val:
+                for item in val:
+                    if not isinstance(item, str):
+                        raise SchemaValidationError("type", "%s %s items type is not string." % (self.name, key))
+                    if arg and len(item) > arg:
+                        raise SchemaValidationError(
+                            "maxLength",
+                            "%s %s item length %s is larger than maxLength %s." % (self.name, key, len(item), arg)
+                        )
+        elif kind == OBJECT_LIST:
+            if val:
+                validator = get_validator(self.classes[key][0])
+                for item in val:
+                    validator.validate(item)
+
+
+_validators = {}
+
+
+def get_validator(cls):
+    """
+    Return the validator of the payload class, created on first use. It
+    reads the constant table of the class if it has one, see use_tables(),
+    or is compiled from its `__schemas__`.
+    """
+    try:
+        return _validators[cls]
+    except KeyError:
+        table = getattr(cls, "__table__", None)
+        validator = SchemaValidator(cls) if table is None else TableValidator(cls, *table)
+        _validators[cls] = validator
+        return validator
+
+
+def validate_dataclass(data, cls):
+    get_validator(cls).validate(data)
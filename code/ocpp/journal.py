@@ -0,0 +1,313 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :journal.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Durable queue of the transaction related CALLs.
+@version   :1.0.0
+@date      :2024-05-17 10:06:41
+@copyright :Copyright (c) 2024
+"""
+
+try:
+    import uos
+except ImportError:
+    import os as uos
+
+import _thread
+
+from usr.tools import logging
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _exists(path):
+    try:
+        uos.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def _remove(path):
+    if _exists(path):
+        uos.remove(path)
+
+
+def _flush(f):
+    """Push what has been written to `f` to the storage, as far as the port can."""
+    f.flush()
+    if hasattr(uos, "fsync"):
+        uos.fsync(f.fileno())
+    elif hasattr(uos, "sync"):
+        uos.sync()
+
+
+class Journal(object):
+    """
+    Append-only file of the CALLs which must reach the Central System even
+    if the connection is lost, StartTransaction, StopTransaction and
+    MeterValues by default. See `ChargePoint(journal=...)`.
+
+    Every line holds the unique id and the JSON text of a CALL. The CALLs
+    are removed from the head of the file when they are acknowledged, the
+    offset of the head is kept in a second file. MeterValues are written to
+    the file every `sync_every` CALLs or on `sync()`, the ones acknowledged
+    before that never reach the file system. Other CALLs are written at
+    once. Every write is flushed to the storage, so a power cut loses at
+    most the `sync_every` - 1 MeterValues not written yet, none with
+    `sync_every` 1. A line torn by a power cut is dropped on loading. The
+    file is deleted once all CALLs have been acknowledged and rewritten
+    without its head when that takes more than half of it. Delivery is at
+    least once: CALLs sent but not acknowledged at the head of the file
+    when the module restarts are sent again.
+
+    When the CALLs queued take `max_size` bytes, further MeterValues are
+    dropped. StartTransaction and StopTransaction are always kept.
+
+    :param path: file of the journal
+    :param actions: Actions of the CALLs kept in the journal
+    :param max_size: bytes of CALLs queued before MeterValues are dropped
+    :param sync_every: number of MeterValues appended or of acknowledgements
+        written at once
+    """
+
+    ACTIONS = ("StartTransaction", "StopTransaction", "MeterValues")
+
+    def __init__(self, path="/usr/ocpp_journal", actions=ACTIONS, max_size=0x40000, sync_every=16):
+        self.path = path
+        self.actions = actions
+        self.max_size = max_size
+        self.sync_every = sync_every
+        self._lock = _thread.allocate_lock()
+
+        # Offset of the first CALL not acknowledged and size of the file.
+        self._head = 0
+        self._size = 0
+        # Lines appended but not written to the file yet.
+        self._unsynced = []
+        # Unique ids acknowledged behind the head, or in `_unsynced`.
+        self._acked = set()
+        # Unique ids being sent by ChargePoint.call(), skipped by records().
+        self._inflight = set()
+        # Unique ids handed out by records() and not acknowledged yet.
+        self._yielded = set()
+        # Number of CALLs not acknowledged.
+        self._count = 0
+        # Set while records() reads the file, which mustn't be rewritten.
+        self._reading = False
+
+        self._load()
+
+    def _load(self):
+        if not _exists(self.path):
+            _remove(self.path + ".head")
+            return
+        self._size = uos.stat(self.path)[6]
+        if _exists(self.path + ".head"):
+            with open(self.path + ".head") as f:
+                self._head = min(int(f.read() or 0), self._size)
+        size = self._head
+        with open(self.path, "rb") as f:
+            f.seek(self._head)
+            for line in f:
+                if line[-1:] != b"\n":
+                    break
+                size += len(line)
+                self._count += 1
+        if size < self._size:
+            LOGGER.warn("Journal %s ends with a torn CALL, dropped.", self.path)
+            self._size = size
+            self._compact()
+        if self._count:
+            LOGGER.info("Journal %s holds %d CALLs.", self.path, self._count)
+
+    def __len__(self):
+        return self._count
+
+    def backlog(self):
+        """Return the number of CALLs waiting for records()."""
+        return self._count - len(self._inflight)
+
+    def append(self, unique_id, action, message, inflight=False):
+        """
+        Append a CALL, `message` being its JSON text. With `inflight` the
+        caller sends it and records() skips it until it's released. Return
+        False when the journal is full and the CALL has been dropped.
+        """
+        line = ("%s %s\n" % (unique_id, message)).encode()
+        with self._lock:
+            if (action == "MeterValues" and
+                    self._size - self._head + sum(len(i) for i in self._unsynced) + len(line) > self.max_size):
+                LOGGER.warn("Journal %s is full, dropped %s", self.path, unique_id)
+                return False
+            self._unsynced.append(line)
+            self._count += 1
+            if inflight:
+                self._inflight.add(unique_id)
+            if len(self._unsynced) >= self.sync_every or action != "MeterValues":
+                self._sync()
+        return True
+
+    def release(self, unique_id):
+        """Give a CALL which couldn't be sent by the caller to records()."""
+        with self._lock:
+            self._inflight.discard(unique_id)
+            self._sync()
+
+    def ack(self, unique_id):
+        """
+        Remove a CALL which has been responded to. Return False when it's
+        neither in flight nor handed out by records(), e.g. it has been
+        acknowledged already.
+        """
+        with self._lock:
+            if unique_id in self._inflight:
+                self._inflight.discard(unique_id)
+            elif unique_id in self._yielded:
+                self._yielded.discard(unique_id)
+            else:
+                LOGGER.warn("Journal %s holds no CALL %s to acknowledge.", self.path, unique_id)
+                return False
+            self._acked.add(unique_id)
+            self._count -= 1
+            if self._count <= 0 or len(self._acked) >= self.sync_every:
+                self._sync()
+        return True
+
+    def sync(self):
+        """Write the CALLs appended and the head to the file system."""
+        with self._lock:
+            self._sync()
+
+    def _sync(self):
+        if self._count <= 0:
+            self._reset()
+            return
+
+        head = self._advance()
+        if self._unsynced:
+            lines = [i for i in self._unsynced if i[:i.find(b" ")].decode() not in self._acked]
+            for line in self._unsynced:
+                self._acked.discard(line[:line.find(b" ")].decode())
+            self._unsynced = []
+            if lines:
+                with open(self.path, "ab") as f:
+                    for line in lines:
+                        f.write(line)
+                        self._size += len(line)
+                    _flush(f)
+        if head != self._head:
+            self._head = head
+            if self._head * 2 > self._size and not self._reading:
+                self._compact()
+            else:
+                self._write_head(self._head)
+
+    def _write_head(self, head):
+        with open(self.path + ".head", "w") as f:
+            f.write(str(head))
+            _flush(f)
+
+    def _advance(self):
+        """Return the head after the CALLs acknowledged at the head."""
+        head = self._head
+        if not self._acked or head >= self._size:
+            return head
+        with open(self.path, "rb") as f:
+            f.seek(head)
+            for line in f:
+                unique_id = line[:line.find(b" ")].decode()
+                if unique_id not in self._acked:
+                    break
+                self._acked.discard(unique_id)
+                head += len(line)
+        return head
+
+    def _compact(self):
+        tmp = self.path + ".tmp"
+        with open(self.path, "rb") as src, open(tmp, "wb") as dst:
+            src.seek(self._head)
+            # Up to `_size`, which leaves a torn last line out.
+            pos = self._head
+            while pos < self._size:
+                line = src.readline()
+                if not line:
+                    break
+                dst.write(line)
+                pos += len(line)
+            _flush(dst)
+        # The head of the new file is written first: a reset in between
+        # leaves the old file read from its start, which sends the CALLs
+        # acknowledged again rather than skipping ones which aren't.
+        self._write_head(0)
+        uos.rename(tmp, self.path)
+        self._size -= self._head
+        self._head = 0
+
+    def _reset(self):
+        self._count = 0
+        self._unsynced = []
+        self._acked = set()
+        self._inflight = set()
+        self._yielded = set()
+        if self._reading:
+            # records() still reads the file, it's deleted when it's done.
+            self._head = self._size
+            return
+        self._head = 0
+        self._size = 0
+        _remove(self.path)
+        _remove(self.path + ".head")
+
+    def records(self):
+        """
+        Iterate in order over (unique id, JSON text) of the CALLs which are
+        neither acknowledged nor in flight. CALLs appended while iterating
+        are included.
+        """
+        self.sync()
+        self._reading = True
+        try:
+            pos = self._head
+            while True:
+                with self._lock:
+                    self._sync()
+                    if pos < self._head:
+                        pos = self._head
+                    size = self._size
+                if pos >= size:
+                    return
+                with open(self.path, "rb") as f:
+                    f.seek(pos)
+                    while pos < size:
+                        line = f.readline()
+                        if line[-1:] != b"\n":
+                            break
+                        pos += len(line)
+                        sep = line.find(b" ")
+                        unique_id = line[:sep].decode()
+                        with self._lock:
+                            if unique_id in self._acked or unique_id in self._inflight:
+                                continue
+                            self._yielded.add(unique_id)
+                        yield unique_id, line[sep + 1:-1].decode()
+        finally:
+            self._reading = False
+            with self._lock:
+                self._sync()
@@ -0,0 +1,208 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : keys.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Payload key translation between camelCase and snake_case.
+@version   : v1.0.0
+@date      : 2024-05-08 10:12:45
+@copyright : Copyright (c) 2024
+"""
+
+try:
+    import ure
+except ImportError:
+    import re as ure
+
+import _thread
+
+from usr.ocpp.dataclasses import dataclass, get_validator
+
+# OCPP uses camelCase for the keys in the payload, the payload classes use
+# snake_case. The whole key vocabulary is known from the `__schemas__` of the
+# payload classes, so both directions are kept in lookup tables which are
+# filled once by `register_schemas()`. Keys which are not part of the schemas
+# (vendor specific keys) are converted by the algorithm below and kept in a
+# small LRU cache.
+_SNAKE_TO_CAMEL = {}
+_CAMEL_TO_SNAKE = {}
+_registered = []
+# Payload classes and datatypes whose keys are in the tables.
+_seen = set()
+
+# Lazily loaded payload modules (usr.ocpp.lazy.LazyModule) aren't modules,
+# they register every class when it's looked up.
+_MODULE = type(ure)
+
+_LRU_SIZE = 64
+
+
+class LRUCache:
+    """
+    Shared by the receive thread, the threads calling call() and the
+    worker pool, so every access holds the lock.
+    """
+
+    def __init__(self, size=_LRU_SIZE):
+        self._size = size
+        self._data = {}
+        self._order = []
+        self._lock = _thread.allocate_lock()
+
+    def get(self, key):
+        with self._lock:
+            val = self._data.get(key)
+            if val is not None and self._order[-1] != key:
+                self._order.remove(key)
+                self._order.append(key)
+            return val
+
+    def put(self, key, val):
+        with self._lock:
+            if key not in self._data:
+                if len(self._order) >= self._size:
+                    self._data.pop(self._order.pop(0))
+                self._order.append(key)
+            self._data[key] = val
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._order.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_snake_cache = LRUCache()
+_camel_cache = LRUCache()
+
+
+def camel_to_snake_items(data):
+    codes = []
+    _code_ = ""
+    for index, item in enumerate(data):
+        if ure.match(r"[A-Z]", item):
+            if index + 1 < len(data):
+                if not ure.match(r"[A-Z]", data[index + 1]):
+                    if index != 0:
+                        codes.append(_code_)
+                        _code_ = ""
+                else:
+                    if ure.match(r"[A-Z]*([a-z0-9]+)", _code_):
+                        codes.append(_code_)
+                        _code_ = ""
+        _code_ += item
+
+    if _code_:
+        codes.append(_code_)
+
+    return codes
+
+
+def camel_to_snake_key(key):
+    """Convert a single camelCase key to snake_case."""
+    try:
+        return _CAMEL_TO_SNAKE[key]
+    except KeyError:
+        pass
+    snake = _snake_cache.get(key)
+    if snake is None:
+        snake = "_".join(camel_to_snake_items(key)).lower()
+        _snake_cache.put(key, snake)
+    return snake
+
+
+def snake_to_camel_key(key):
+    """Convert a single snake_case key to camelCase."""
+    try:
+        return _SNAKE_TO_CAMEL[key]
+    except KeyError:
+        pass
+    camel = _camel_cache.get(key)
+    if camel is None:
+        camel = _snake_to_camel(key)
+        _camel_cache.put(key, camel)
+    return camel
+
+
+def _snake_to_camel(key):
+    components = key.replace("soc", "SoC").replace("_v2x", "V2X").split("_")
+    return components[0] + "".join(x[:1].upper() + x[1:] for x in components[1:])
+
+
+def register_class(cls):
+    """Add the keys of a payload class and the datatypes it refers to."""
+    if cls in _seen:
+        return
+    _seen.add(cls)
+    validator = get_validator(cls)
+    for key in validator.keys():
+        if key not in _SNAKE_TO_CAMEL:
+            camel = _snake_to_camel(key)
+            _SNAKE_TO_CAMEL[key] = camel
+            _CAMEL_TO_SNAKE[camel] = key
+    for _cls, _ in validator.classes.values():
+        register_class(_cls)
+
+
+def register_schemas(*modules):
+    """
+    Fill the translation tables with all keys of the payload classes of the
+    given modules (e.g. `ocpp.v16.call`, `ocpp.v16.call_result`), including
+    the datatypes they refer to. Modules which have been registered before
+    are skipped, so this can be called for every new ChargePoint.
+    """
+    for module in modules:
+        if module is None or not isinstance(module, _MODULE) or module.__name__ in _registered:
+            continue
+        for name in dir(module):
+            cls = getattr(module, name)
+            if isinstance(cls, type) and cls is not dataclass and issubclass(cls, dataclass):
+                register_class(cls)
+        _registered.append(module.__name__)
+
+
+def camel_to_snake_case(data):
+    """
+    Convert all keys of all dictionaries inside the given argument from
+    camelCase to snake_case.
+
+    Inspired by: https://stackoverflow.com/a/1176023/1073222
+
+    """
+    if isinstance(data, dict):
+        return {camel_to_snake_key(key): camel_to_snake_case(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [camel_to_snake_case(value) for value in data]
+
+    return data
+
+
+def snake_to_camel_case(data):
+    """
+    Convert all keys of all dictionaries inside given argument from
+    snake_case to camelCase.
+
+    Inspired by: https://stackoverflow.com/a/19053800/1073222
+    """
+    if isinstance(data, dict):
+        return {snake_to_camel_key(key): snake_to_camel_case(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [snake_to_camel_case(value) for value in data]
+
+    return data
@@ -0,0 +1,65 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : lazy.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Loading of the payload classes on first use.
+@version   : v1.0.0
+@date      : 2024-05-22 10:17:45
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+
+from usr.ocpp.keys import register_class
+
+
+class LazyModule(object):
+    """
+    Stands for a module of payload classes, e.g. `usr.ocpp.v16.call`, which
+    is only imported when the first payload class is looked up.
+
+    The classes are looked up once per Action. The keys of the schema of a
+    class are added to the camelCase / snake_case tables at that time, so
+    only the schemas of the Actions used are ever built.
+
+    With `actions` set, only the payload classes of these Actions are found,
+    the others raise AttributeError as if they didn't exist.
+    """
+
+    def __init__(self, name, actions=None):
+        self.__name__ = name
+        self.actions = actions
+        self._module = None
+        self._classes = {}
+
+    def __getattr__(self, name):
+        try:
+            return self._classes[name]
+        except KeyError:
+            pass
+        if self.actions is not None and name[:-7] not in self.actions:
+            raise AttributeError(name)
+        if self._module is None:
+            __import__(self.__name__)
+            self._module = sys.modules[self.__name__]
+        cls = getattr(self._module, name)
+        register_class(cls)
+        self._classes[name] = cls
+        return cls
+
+    def loaded(self):
+        """Return the names of the classes looked up so far."""
+        return list(self._classes)
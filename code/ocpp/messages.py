@@ -21,13 +21,25 @@
 @copyright : Copyright (c) 2024
 """
 
-import ujson
+try:
+    import ujson
+except ImportError:
+    import json as ujson
 
-from usr.ocpp.v16 import call, call_result
-from usr.ocpp.dataclasses import asdict, is_dataclass, validate_dataclass
+try:
+    from uio import StringIO
+except ImportError:
+    from io import StringIO
+
+from usr.tools import jsonstream
+from usr.ocpp.v16.payloads import call, call_result
+from usr.ocpp.keys import camel_to_snake_case, camel_to_snake_key, snake_to_camel_case, snake_to_camel_key
+from usr.ocpp.dataclasses import asdict, fields, is_dataclass, get_validator
 
 from usr.ocpp.exceptions import (
     FormatViolationError,
+    NotImplementedError,
+    NotSupportedError,
     OCPPError,
     PropertyConstraintViolationError,
     ProtocolError,
@@ -54,12 +66,30 @@ class MessageType:
     CallError = 4
 
 
-def unpack(msg):
+# Arrays of CALL payloads which can be passed to the handler item by item,
+# see `on(stream_items=True)`. Paths of the camelCase keys by Action.
+STREAMED_ITEMS = {
+    "SendLocalList": ("localAuthorizationList",),
+    "SetChargingProfile": ("csChargingProfiles", "chargingSchedule", "chargingSchedulePeriod"),
+}
+
+
+def unpack(msg, streamed=None):
     """
     Unpacks a message into either a Call, CallError or CallResult.
+
+    `msg` is a str or a bytes like buffer. For a CALL of an Action in
+    `streamed` read from a buffer, the array of STREAMED_ITEMS isn't decoded:
+    the payload holds an empty list in its place and `Call.streamed` its
+    position in the buffer, see `stream_items()`.
     """
+    if streamed and not isinstance(msg, str):
+        _call = _unpack_streamed(msg, streamed)
+        if _call is not None:
+            return _call
+
     try:
-        msg = ujson.loads(msg)
+        msg = jsonstream.loads(msg)
     except Exception:
         raise FormatViolationError(
             None, {"cause": "Message is not valid JSON", "ocpp_message": msg}
@@ -93,6 +123,98 @@ def unpack(msg):
     )
 
 
+def _unpack_streamed(buf, streamed):
+    """
+    Decode a CALL of an Action in `streamed` without its streamed array.
+    Return None for other messages and for messages which aren't well
+    formed, unpack() decodes those as a whole.
+    """
+    try:
+        reader = jsonstream.Reader(buf)
+        elements = reader.items()
+        next(elements)
+        if reader.read() != MessageType.Call:
+            return None
+        next(elements)
+        unique_id = reader.read()
+        next(elements)
+        action = reader.read()
+        if action not in streamed:
+            return None
+        next(elements)
+        if reader.peek() != 0x7b:
+            return None
+        payload, span = _read_streamed(reader, STREAMED_ITEMS[action])
+        for _ in elements:
+            return None
+    except (ValueError, TypeError, StopIteration):
+        return None
+
+    _call = Call(unique_id, action, payload)
+    if span is not None:
+        _call.streamed = (buf, span[0], span[1])
+    return _call
+
+
+def _read_streamed(reader, path):
+    """
+    Decode the object at the cursor except the array at `path`, which is
+    skipped. Return the object and the (start, end) of the array or None.
+    """
+    data = {}
+    span = None
+    for key in reader.keys():
+        if key != path[0]:
+            data[key] = reader.read()
+        elif len(path) == 1 and reader.peek() == 0x5b:
+            span = reader.skip()
+            data[key] = []
+        elif len(path) > 1 and reader.peek() == 0x7b:
+            data[key], span = _read_streamed(reader, path[1:])
+        else:
+            # Not of the type of the schema, left to the validation.
+            data[key] = reader.read()
+    return data, span
+
+
+def stream_items(message, validate=True):
+    """
+    Put an iterator over the streamed array into the payload of a CALL
+    unpacked with `streamed`, in place of the empty list.
+
+    The items are decoded, translated to snake_case, validated and turned
+    into instances of their payload class (e.g. AuthorizationData) one at a
+    time. The iterator must be used before the next message is received, as
+    it reads from the receive buffer.
+
+    The payload is the one of decode(), the objects on the path may be
+    instances of their payload classes or dicts.
+    """
+    path = STREAMED_ITEMS[message.action]
+    _cls = getattr(call, message.action + "Payload")
+    data = message.payload
+    for key in path:
+        key = camel_to_snake_key(key)
+        _cls = get_validator(_cls).classes[key][0]
+        parent = data
+        data = data[key] if isinstance(data, dict) else getattr(data, key)
+    items = _iter_items(message, _cls, validate)
+    if isinstance(parent, dict):
+        parent[key] = items
+    else:
+        setattr(parent, key, items)
+
+
+def _iter_items(message, _cls, validate):
+    buf, start, end = message.streamed
+    validator = get_validator(_cls)
+    for item in jsonstream.Reader(buf, start, end).values():
+        try:
+            yield _instance(_cls, _decode(item, validator, validate))
+        except SchemaValidationError as e:
+            raise _schema_error(e, message)
+
+
 def pack(msg):
     """
     Returns the JSON representation of a Call, CallError or CallResult.
@@ -103,6 +225,50 @@ def pack(msg):
     return msg.to_json()
 
 
+def remove_nones(data):
+    if isinstance(data, dict):
+        return {k: remove_nones(v) for k, v in data.items() if v is not None}
+
+    elif isinstance(data, list):
+        return [remove_nones(v) for v in data if v is not None]
+
+    return data
+
+
+def _raise_key_error(action, version):
+    """
+    Checks whether a keyerror returned by _handle_call
+    is supported by the OCPP version or is simply
+    not implemented by the server/client and raises
+    the appropriate error.
+    """
+
+    from usr.ocpp.v16.enums import Action as v16_Action
+    # from ocpp.v201.enums import Action as v201_Action
+
+    if version == "1.6":
+        if hasattr(v16_Action, action):
+            raise NotImplementedError(
+                None, {"cause": "No handler for {action} registered.".format(action=action)}
+            )
+        else:
+            raise NotSupportedError(
+                None, {"cause": "{action} not supported by OCPP{version}.".format(action=action, version=version)}
+            )
+    else:
+        # elif version in ["2.0", "2.0.1"]:
+        #     if hasattr(v201_Action, action):
+        #         raise NotImplementedError(
+        #             None, {"cause": f"No handler for {action} registered."}
+        #         )
+        #     else:
+        raise NotSupportedError(
+            None, {"cause": "{action} not supported by OCPP{version}.".format(action=action, version=version)}
+        )
+
+    return
+
+
 def validate_payload(message, ocpp_version):
     """Validate the payload of the message using JSON schemas."""
     if type(message) not in [Call, CallResult]:
@@ -114,38 +280,269 @@ def validate_payload(message, ocpp_version):
         )
 
     try:
-        _cls = None
-        if type(message) is Call:
-            _cls = getattr(call, message.action + "Payload")
-        elif type(message) is CallResult:
-            _cls = getattr(call_result, message.action + "Payload")
-        validate_dataclass(message.payload, _cls)
+        get_validator(_payload_class(message)).validate(message.payload)
     except SchemaValidationError as e:
-        if e.validator == "type":
-            raise TypeConstraintViolationError(
-                None, {"cause": e.message, "ocpp_message": message}
-            )
-        elif e.validator == "additionalProperties":
-            raise FormatViolationError(
-                None, {"cause": e.message, "ocpp_message": message}
-            )
-        elif e.validator == "required":
-            raise ProtocolError(None, {"cause": e.message})
+        raise _schema_error(e, message)
+
+
+def _payload_class(message, required=True):
+    """
+    Return the payload class of a Call or CallResult by its Action. For an
+    Action left out by payloads.use_actions(), raise NotImplementedError or
+    return None if not `required`.
+    """
+    _cls = None
+    if type(message) is Call:
+        _cls = getattr(call, message.action + "Payload", None)
+    elif type(message) is CallResult:
+        _cls = getattr(call_result, message.action + "Payload", None)
+    if _cls is None and required:
+        raise NotImplementedError(
+            None, {"cause": "{action} is not used.".format(action=message.action)}
+        )
+    return _cls
+
+
+def decode(message, ocpp_version, validate=True):
+    """
+    Turn the camelCase payload of an unpacked Call or CallResult into the
+    snake_case keyword arguments of its payload class, in one walk.
+
+    The keys are translated, with `validate` every value is validated on
+    the way, raising the OCPPErrors of validate_payload(), and the objects
+    nested in the payload become instances of their payload classes, e.g.
+    IdTagInfo or MeterValue, rather than dicts. Objects which don't fit
+    their class stay dicts, they are only found with `validate` off.
+    """
+    _cls = _payload_class(message, validate)
+    if _cls is None or not isinstance(message.payload, dict):
+        message.payload = camel_to_snake_case(message.payload)
+        if validate:
+            validate_payload(message, ocpp_version)
+        return
+    try:
+        message.payload = _decode(message.payload, get_validator(_cls), validate)
+    except SchemaValidationError as e:
+        # The error quotes the payload as validate_payload() does.
+        message.payload = camel_to_snake_case(message.payload)
+        raise _schema_error(e, message)
+
 
-        elif e.validator == "maxLength":
-            raise TypeConstraintViolationError(
-                None, {"cause": e.message, "ocpp_message": message}
-            ) from e
+def _decode(data, validator, validate):
+    """
+    Return the snake_case dict of the camelCase object `data` of the class
+    of `validator`, the objects nested in it decoded too.
+
+    The errors are raised in the order validate() finds them: a missing
+    required key first, then the first property which isn't valid.
+    """
+    result = {}
+    error = None
+    for key, val in data.items():
+        key = camel_to_snake_key(key)
+        try:
+            if val is None or isinstance(val, (str, int, float)):
+                if validate:
+                    validator.check(key, val)
+                result[key] = val
+                continue
+            nested = validator.classes.get(key)
+            if nested is not None and nested[1] and isinstance(val, list):
+                items = get_validator(nested[0])
+                val = [
+                    _instance(nested[0], _decode(item, items, validate)) if isinstance(item, dict)
+                    else _check_item(items, camel_to_snake_case(item), validate)
+                    for item in val
+                ]
+            elif nested is not None and not nested[1] and isinstance(val, dict):
+                val = _instance(nested[0], _decode(val, get_validator(nested[0]), validate))
+            else:
+                val = camel_to_snake_case(val)
+                if validate:
+                    validator.check(key, val)
+        except SchemaValidationError as e:
+            if error is None:
+                error = e
+        result[key] = val
+    if validate and result:
+        for key in validator.required:
+            if key not in result:
+                raise SchemaValidationError("required", "%s required filed %s" % (validator.name, key))
+        if error is not None:
+            raise error
+    return result
+
+
+def _check_item(validator, item, validate):
+    """An item of an array of objects which isn't an object."""
+    if validate:
+        validator.validate(item)
+    return item
+
+
+def _instance(cls, kwargs):
+    """Return an instance of the payload class, or `kwargs` if they don't fit it."""
+    try:
+        return cls(**kwargs)
+    except (TypeError, ValueError):
+        return kwargs
+
+
+def encode(message, payload, ocpp_version, validate=True):
+    """
+    Return the JSON of the Call or CallResult `message` with the payload
+    object `payload`, e.g. a call.BootNotificationPayload.
+
+    The payload is walked once: None fields are left out, the camelCase keys
+    and the values are written straight into the output and, with
+    `validate`, every value is validated on the way, raising the OCPPErrors
+    of validate_payload(). The JSON is byte for byte the one of asdict(),
+    remove_nones(), validate_payload(), snake_to_camel_case() and to_json()
+    in turn, without their copies of the payload, see
+    tests/test_encoder.py.
+    """
+    if not is_dataclass(payload):
+        message.payload = remove_nones(asdict(payload))
+        if validate:
+            validate_payload(message, ocpp_version)
+        message.payload = snake_to_camel_case(message.payload)
+        return message.to_json()
+
+    validator = get_validator(_payload_class(message)) if validate else None
+    out = StringIO()
+    out.write("[%d, " % message.message_type_id)
+    _dump(message.unique_id, out)
+    out.write(", ")
+    if type(message) is Call:
+        _dump(message.action, out)
+        out.write(", ")
+    try:
+        _encode_object(out, payload, validator)
+    except SchemaValidationError as e:
+        # The error quotes the payload as validate_payload() does.
+        message.payload = remove_nones(asdict(payload))
+        raise _schema_error(e, message)
+    out.write("]")
+    return out.getvalue()
+
+
+# '"camelCase": ' of the keys of the payload classes by snake_case key.
+_JSON_KEYS = {}
+
+if hasattr(ujson, "JSONEncoder"):
+    # CPython, its json.dump() encodes in Python and json.dumps() in C.
+    def _dump(val, out):
+        out.write(ujson.dumps(val))
+else:
+    # MicroPython writes into the stream without a string in between.
+    _dump = ujson.dump
+
+
+def _json_key(key):
+    try:
+        return _JSON_KEYS[key]
+    except KeyError:
+        text = _JSON_KEYS[key] = '"%s": ' % snake_to_camel_key(key)
+        return text
+
+
+def _encode_object(out, obj, validator):
+    """Write a payload object, validated by `validator` unless it's None."""
+    keys = fields(obj)
+    if validator is not None:
+        for key in keys:
+            if getattr(obj, key) is not None:
+                break
         else:
-            raise FormatViolationError(
-                None,
-                {
-                    "cause": "Payload '{}' for action '{}' is not valid: {}".format(
-                        message.payload, message.action, e
-                    ),
-                    "ocpp_message": message
-                }
-            )
+            # Nothing but Nones, which validate() skips as an empty dict.
+            validator = None
+    if validator is not None:
+        for key in validator.required:
+            if getattr(obj, key, None) is None:
+                raise SchemaValidationError("required", "%s required filed %s" % (validator.name, key))
+
+    out.write("{")
+    first = True
+    for key in keys:
+        val = getattr(obj, key)
+        if val is None:
+            continue
+        if not first:
+            out.write(", ")
+        first = False
+        out.write(_json_key(key))
+        _encode_value(out, key, val, validator)
+    out.write("}")
+
+
+def _encode_value(out, key, val, validator):
+    if isinstance(val, (str, int, float)):
+        if validator is not None:
+            validator.check(key, val)
+        _dump(val, out)
+        return
+
+    # Class of the payload objects of the property, (cls, is list).
+    nested = None if validator is None else validator.classes.get(key)
+    if is_dataclass(val) and (validator is None or nested is not None and not nested[1]):
+        _encode_object(out, val, None if validator is None else get_validator(nested[0]))
+    elif isinstance(val, list) and (validator is None or nested is not None and nested[1]):
+        items = None if validator is None else get_validator(nested[0])
+        out.write("[")
+        first = True
+        for item in val:
+            if item is None:
+                continue
+            if not first:
+                out.write(", ")
+            first = False
+            if is_dataclass(item):
+                _encode_object(out, item, items)
+            else:
+                item = remove_nones(asdict(item))
+                if items is not None:
+                    items.validate(item)
+                _dump(snake_to_camel_case(item), out)
+        out.write("]")
+    else:
+        # Dicts and values not of the type of the schema, as they are handled
+        # by the steps encode() stands for.
+        val = remove_nones(asdict(val))
+        if validator is not None:
+            validator.check(key, val)
+        _dump(snake_to_camel_case(val), out)
+
+
+def _schema_error(e, message):
+    """
+    Return the OCPPError for the SchemaValidationError of the message. The
+    details go into the CallError, so the message is quoted as a string.
+    """
+    if e.validator == "type":
+        return TypeConstraintViolationError(
+            None, {"cause": e.message, "ocpp_message": repr(message)}
+        )
+    elif e.validator == "additionalProperties":
+        return FormatViolationError(
+            None, {"cause": e.message, "ocpp_message": repr(message)}
+        )
+    elif e.validator == "required":
+        return ProtocolError(None, {"cause": e.message})
+
+    elif e.validator == "maxLength":
+        return TypeConstraintViolationError(
+            None, {"cause": e.message, "ocpp_message": repr(message)}
+        )
+    else:
+        return FormatViolationError(
+            None,
+            {
+                "cause": "Payload '{}' for action '{}' is not valid: {}".format(
+                    message.payload, message.action, e
+                ),
+                "ocpp_message": repr(message)
+            }
+        )
 
 
 class Call:
@@ -182,6 +579,10 @@ class Call:
         self.action = action
         self.payload = payload
 
+        # (buffer, start, end) of the array left out of the payload by
+        # unpack(), see stream_items().
+        self.streamed = None
+
         if is_dataclass(payload):
             self.payload = asdict(payload)
 
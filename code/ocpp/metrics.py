@@ -0,0 +1,162 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : metrics.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Counts and timing histograms of the stages of the messages a
+             ChargePoint handles, by Action.
+@version   : v1.0.0
+@date      : 2024-05-30 14:36:08
+@copyright : Copyright (c) 2024
+"""
+
+try:
+    import ujson
+except ImportError:
+    import json as ujson
+
+try:
+    from utime import ticks_ms, ticks_diff
+except ImportError:
+    # CPython, e.g. the asyncio ChargePoint of a central system.
+    import time
+
+    def ticks_ms():
+        return int(time.monotonic() * 1000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+import array
+import _thread
+
+# The stages of a message, see Metrics.record().
+UNPACK = 0   # Parsing the JSON of a received message.
+DECODE = 1   # Translating the keys, validating and building the payload objects, see messages.decode().
+HANDLER = 2  # The @on handler of a CALL received.
+ENCODE = 3   # Validating and writing the JSON of a message sent, see messages.encode().
+SEND = 4     # Writing a message to the connection.
+RTT = 5      # From sending a call() until its response has been received.
+
+STAGES = ("unpack", "decode", "handler", "encode", "send", "rtt")
+
+# Upper bounds of the histogram buckets in microseconds, the last bucket
+# takes the longer times.
+BUCKETS = (250, 1000, 4000, 16000, 64000, 256000, 1024000, 4096000)
+
+# The row of the responses, whose Action isn't known when they are
+# unpacked, and of the Actions beyond `max_actions`.
+OTHER = "*"
+
+
+class Metrics(object):
+    """
+    Collector of the timings a ChargePoint reports, see
+    `ChargePoint(metrics=...)`. Any object with a record() method like this
+    one's can take its place.
+
+    For every Action and stage it keeps the count, the total and the
+    maximum time and a histogram over BUCKETS. They are kept in arrays
+    allocated once, recording a time allocates no memory. Up to
+    `max_actions` Actions get a row, the first time they are seen, the
+    others share the row of OTHER.
+
+    dump() returns them as a dict, e.g. to send them in a DataTransfer, and
+    save() writes them to a JSON file.
+    """
+
+    def __init__(self, max_actions=32, buckets=BUCKETS):
+        self.buckets = buckets
+        self.max_actions = max_actions
+        self._rows = {OTHER: 0}
+        cells = (max_actions + 1) * len(STAGES)
+        self._counts = array.array("L", [0] * cells)
+        # Totals in seconds and microseconds, so neither gets large.
+        self._seconds = array.array("L", [0] * cells)
+        self._micros = array.array("L", [0] * cells)
+        self._max = array.array("L", [0] * cells)
+        self._histogram = array.array("L", [0] * (cells * (len(buckets) + 1)))
+        self._lock = _thread.allocate_lock()
+        self._since = ticks_ms()
+
+    def record(self, action, stage, us):
+        """Record that `stage` of a message of `action` took `us` microseconds."""
+        row = self._rows.get(action)
+        if row is None:
+            row = self._row(action)
+        cell = row * len(STAGES) + stage
+        bucket = 0
+        for bound in self.buckets:
+            if us <= bound:
+                break
+            bucket += 1
+        with self._lock:
+            self._counts[cell] += 1
+            micros = self._micros[cell] + us
+            if micros >= 1000000:
+                self._seconds[cell] += micros // 1000000
+                micros %= 1000000
+            self._micros[cell] = micros
+            if us > self._max[cell]:
+                self._max[cell] = us
+            self._histogram[cell * (len(self.buckets) + 1) + bucket] += 1
+
+    def _row(self, action):
+        with self._lock:
+            row = self._rows.get(action)
+            if row is None:
+                row = len(self._rows) if len(self._rows) <= self.max_actions else 0
+                if row:
+                    self._rows[action] = row
+            return row
+
+    def reset(self):
+        with self._lock:
+            for values in (self._counts, self._seconds, self._micros, self._max, self._histogram):
+                for i in range(len(values)):
+                    values[i] = 0
+            self._since = ticks_ms()
+
+    def dump(self):
+        """
+        Return the metrics recorded since the creation or the last reset(),
+        as `{"since_ms": ..., "buckets_us": [...], "actions": {action:
+        {stage: {"count", "total_ms", "max_us", "histogram"}}}}`. Stages
+        without any record are left out.
+        """
+        actions = {}
+        size = len(self.buckets) + 1
+        with self._lock:
+            for action, row in self._rows.items():
+                stages = {}
+                for stage, name in enumerate(STAGES):
+                    cell = row * len(STAGES) + stage
+                    if not self._counts[cell]:
+                        continue
+                    stages[name] = {
+                        "count": self._counts[cell],
+                        "total_ms": self._seconds[cell] * 1000 + self._micros[cell] // 1000,
+                        "max_us": self._max[cell],
+                        "histogram": list(self._histogram[cell * size:(cell + 1) * size]),
+                    }
+                if stages:
+                    actions[action] = stages
+            since = ticks_diff(ticks_ms(), self._since)
+        return {"since_ms": since, "buckets_us": list(self.buckets), "actions": actions}
+
+    def save(self, path):
+        """Write dump() to the file `path` as JSON."""
+        with open(path, "w") as f:
+            f.write(ujson.dumps(self.dump()))
@@ -23,19 +23,116 @@
 
 routables = []
 
+# Route tables by class, see class_routes().
+_class_routes = {}
+
+
+class _Probe(object):
+
+    def __get__(self, obj, objtype=None):
+        return True
+
+
+class _Host(object):
+    probe = _Probe()
+
+
+# Whether the port calls __get__ (MICROPY_PY_DESCRIPTORS), which binds a
+# handler looked up on an instance to it.
+_DESCRIPTORS = _Host().probe is True
+
 
 class InnerBase:
 
     def __init__(self, func):
         self.func = func
-        self.func_name = repr(self.func).split(" ")[1]
-        self.parent = None
+        # CPython reprs the qualified name, e.g. "ChargePoint.on_boot".
+        self.func_name = repr(self.func).split(" ")[1].split(".")[-1]
 
     def __call__(self, *args, **kwargs):
-        return self.func(self.parent, *args, **kwargs)
+        if not _DESCRIPTORS:
+            # `cp.on_boot()` isn't bound to `cp`, the instance is unknown.
+            raise TypeError(
+                "%s can't be called through an instance on this port, call "
+                "create_route_map(obj)[action]['_on_action'] instead" % self.func_name
+            )
+        # Looked up on the class, e.g. `ChargePoint.on_boot(cp)`.
+        return self.func(*args, **kwargs)
+
+    def __get__(self, obj, objtype=None):
+        # Looked up on an instance, e.g. `cp.on_boot_notification`, where
+        # descriptors are supported.
+        if obj is None:
+            return self
+        return BoundHandler(self, obj)
 
 
-def on(action, skip_schema_validation=False, call_unique_id_required=False):
+class BoundHandler(object):
+    """A handler of the route table of a class bound to an instance."""
+
+    def __init__(self, inner, parent):
+        self.inner = inner
+        self.parent = parent
+
+    def __call__(self, *args, **kwargs):
+        return self.inner.func(self.parent, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # The options of the decorator, e.g. `_call_unique_id_required`.
+        return getattr(self.inner, name)
+
+
+class RouteMap(object):
+    """
+    The route table of a class seen from one of its instances, what
+    create_route_map() returns.
+
+    The table itself is built once per class, see class_routes(). The
+    handlers of an Action are bound to the instance on its first lookup,
+    so creating an instance costs next to nothing and instances of
+    different classes don't share any state.
+    """
+
+    def __init__(self, obj, routes):
+        self.obj = obj
+        # The route table of the class, which mustn't be changed.
+        self.routes = routes
+        self._bound = {}
+
+    def __getitem__(self, action):
+        try:
+            return self._bound[action]
+        except KeyError:
+            pass
+        handlers = dict(self.routes[action])
+        for option in ("_on_action", "_after_action"):
+            if option in handlers:
+                handlers[option] = BoundHandler(handlers[option], self.obj)
+        self._bound[action] = handlers
+        return handlers
+
+    def __contains__(self, action):
+        return action in self.routes
+
+    def __iter__(self):
+        return iter(self.routes)
+
+    def __len__(self):
+        return len(self.routes)
+
+    def get(self, action, default=None):
+        if action in self.routes:
+            return self[action]
+        return default
+
+    def keys(self):
+        return self.routes.keys()
+
+    def items(self):
+        return [(action, self[action]) for action in self.routes]
+
+
+def on(action, skip_schema_validation=False, call_unique_id_required=False, stream_items=False):
     """
     Function decorator to mark function as handler for specific action. The
     wrapped function may be async or sync.
@@ -72,12 +169,19 @@ def on(action, skip_schema_validation=False, call_unique_id_required=False):
     defaults to False. Setting this argument to `True` will disable schema
     validation of the request and the response of the specific route.
 
+    Setting `stream_items` to `True` for an Action of
+    `usr.ocpp.messages.STREAMED_ITEMS`, e.g. SendLocalList, passes its large
+    array as an iterator of payload class instances (e.g. AuthorizationData)
+    which are decoded from the receive buffer one at a time. The iterator can
+    only be used once and only inside the handler.
+
     """
 
     def decorator(func):
         inner = InnerBase(func)
         inner._on_action = action
         inner._skip_schema_validation = skip_schema_validation
+        inner._stream_items = stream_items
         inner._call_unique_id_required = call_unique_id_required
 
         if inner.func_name not in routables:
@@ -114,9 +218,10 @@ def after(action, call_unique_id_required=False):
 
 def create_route_map(obj):
     """
-    Iterates of all attributes of the class looking for attributes which
-    have been decorated by the @on() decorator It returns a dictionary where
-    the action name are the keys and the decorated functions are the values.
+    Return the route table of the class of `obj` bound to `obj`, a RouteMap
+    which looks like a dictionary where the action name are the keys and
+    the decorated functions are the values. The table of the class is built
+    on its first instance, see class_routes().
 
     To illustrate this with an example, consider the following function:
 
@@ -138,18 +243,32 @@ def create_route_map(obj):
                 '_on_action': <reference to 'on_boot_notification'>,
                 '_after_action': <reference to 'after_boot_notification'>,
                 '_skip_schema_validation': False,
+                '_stream_items': False,
             },
         }
 
     """
+    return RouteMap(obj, class_routes(type(obj)))
+
+
+def class_routes(cls):
+    """
+    Return the route table of a class, built on the first call for the
+    class and shared by all its instances. The handlers in it are not bound
+    to any instance.
+    """
+    try:
+        return _class_routes[cls]
+    except KeyError:
+        pass
+
     routes = {}
 
     for attr_name in routables:
+        attr = getattr(cls, attr_name, None)
         for option in ["_on_action", "_after_action"]:
             try:
-                attr = getattr(obj, attr_name)
                 action = getattr(attr, option)
-                attr.parent = obj
 
                 if action not in routes:
                     routes[action] = {}
@@ -161,10 +280,14 @@ def create_route_map(obj):
                     routes[action]["_skip_schema_validation"] = getattr(
                         attr, "_skip_schema_validation", False
                     )
+                    routes[action]["_stream_items"] = getattr(
+                        attr, "_stream_items", False
+                    )
 
                 routes[action][option] = attr
 
             except AttributeError:
                 continue
 
+    _class_routes[cls] = routes
     return routes
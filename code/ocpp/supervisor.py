@@ -0,0 +1,212 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :supervisor.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Keeps a ChargePoint connected to the Central System.
+@version   :1.0.0
+@date      :2024-05-20 09:52:18
+@copyright :Copyright (c) 2024
+"""
+
+import utime
+import urandom
+import _thread
+
+from usr.tools import logging
+from usr.tools.uwebsocket import Client
+# The v16 package first, it imports usr.ocpp.charge_point.
+from usr.ocpp.v16.enums import RegistrationStatus
+from usr.ocpp.charge_point import Queue
+from usr.ocpp.exceptions import TimeoutError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Supervisor(object):
+    """
+    Owns the connection of a ChargePoint: connects it, runs its receive loop
+    and reconnects when the connection is lost, with an exponential backoff
+    of `min_backoff` to `max_backoff` seconds and a random jitter.
+
+    The same ChargePoint is bound to every new connection. After connecting,
+    `boot` (e.g. a function sending BootNotification and returning its
+    response) is called until the Central System accepts it, then the CALLs
+    queued in the journal are replayed. That's done on every connection, as
+    the Central System may have restarted meanwhile. A Pending or Rejected
+    boot is retried after the interval of the response, a failed one after
+    the backoff.
+
+    A recv() error ends a connection, so does `lost()`. With `ping_interval`
+    (the WebSocketPingInterval configuration key, in seconds) every
+    connection pings the Central System when idle and is dropped when the
+    pings aren't answered, see `uwebsocket.Websocket.keepalive()`. `wake()`
+    cuts the current backoff short, call it when the network is back
+    (dataCall.setCallback() on QuecPython) to reconnect at once.
+
+    The other keyword arguments are passed to `uwebsocket.Client.connect()`.
+    """
+
+    def __init__(self, charge_point, uri, boot=None, min_backoff=1, max_backoff=30, ping_interval=0, **kwargs):
+        self.charge_point = charge_point
+        self.uri = uri
+        self.boot = boot
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.ping_interval = ping_interval
+        self.connect_kwargs = kwargs
+
+        self.connection = None
+        # Whether the boot has been accepted on the last connection.
+        self.booted = False
+        self.connects = 0
+        # Milliseconds from the loss of the last connection until the
+        # ChargePoint had booted and replayed its journal on the next one.
+        self.recovery_ms = None
+
+        self._running = False
+        self._lost_at = None
+        self._wakeup = Queue()
+        # Wakes _resume() waiting to retry the boot when the connection is lost.
+        self._retry = Queue()
+        # Held by _resume(), the one of a new connection waits for the one of
+        # the last connection, which may still be in boot().
+        self._resume_lock = _thread.allocate_lock()
+
+    def start(self):
+        """Run the supervisor in a new thread."""
+        self._running = True
+        return _thread.start_new_thread(self.run, ())
+
+    def stop(self):
+        self._running = False
+        self.wake()
+        self._retry.put(True)
+        self.lost()
+
+    def wake(self):
+        """Reconnect now if waiting for the next attempt."""
+        self._wakeup.put(True)
+
+    def lost(self):
+        """Drop the current connection, a new one is made."""
+        connection = self.connection
+        if connection is not None:
+            connection.abort()
+
+    def set_ping_interval(self, interval):
+        """Change the ping interval of the connection and of the next ones."""
+        self.ping_interval = interval
+        connection = self.connection
+        if connection is not None:
+            connection.keepalive(interval)
+
+    def backoff(self, attempt):
+        """Return the seconds to wait before the connection attempt `attempt`."""
+        delay = min(self.max_backoff, self.min_backoff * (1 << min(attempt, 16)))
+        # Half of it fixed, half of it random, so charge points which lost the
+        # connection at the same time don't reconnect at the same time.
+        return delay / 2 + delay * urandom.getrandbits(8) / 512
+
+    def _sleep(self, seconds, queue=None):
+        try:
+            (queue or self._wakeup).get(seconds)
+        except TimeoutError:
+            pass
+
+    def run(self):
+        self._running = True
+        attempt = 0
+        while self._running:
+            try:
+                connection = Client.connect(self.uri, **self.connect_kwargs)
+            except Exception as e:
+                delay = self.backoff(attempt)
+                attempt += 1
+                LOGGER.warn("Connecting to %s failed (%r), retry in %d ms.", self.uri, e, delay * 1000)
+                self._sleep(delay)
+                continue
+
+            attempt = 0
+            self.connects += 1
+            LOGGER.info("Connected to %s, phases in ms: %s", self.uri, connection.timings)
+            self.connection = connection
+            connection.keepalive(self.ping_interval)
+            self._wakeup.clear()
+            self._retry.clear()
+            self.charge_point.bind(connection)
+            _thread.start_new_thread(self._resume, (connection,))
+
+            try:
+                self.charge_point.start()
+            except Exception as e:
+                LOGGER.warn("Connection to %s lost: %r", self.uri, e)
+            self.connection = None
+            self._lost_at = utime.ticks_ms()
+            self.charge_point.connection_lost()
+            connection.abort()
+            self._retry.put(True)
+
+    def _connected(self, connection):
+        """Return whether `connection` is still the open current connection."""
+        return self._running and self.connection is connection and connection.open
+
+    def _resume(self, connection):
+        """
+        Boot until the boot is accepted and replay the journal on a new
+        connection. Return when the connection is lost meanwhile.
+        """
+        with self._resume_lock:
+            self._boot_and_replay(connection)
+
+    def _boot_and_replay(self, connection):
+        if not self._connected(connection):
+            return
+        self.booted = False
+        attempt = 0
+        while self.boot is not None:
+            try:
+                response = self.boot()
+            except Exception as e:
+                delay = self.backoff(attempt)
+                attempt += 1
+                LOGGER.warn("BootNotification on %s failed (%r), retry in %d ms.", self.uri, e, delay * 1000)
+            else:
+                # Lost while booting, the next connection boots again.
+                if not self._connected(connection):
+                    return
+                self.booted = getattr(response, "status", None) == RegistrationStatus.accepted
+                if self.booted:
+                    break
+                delay = getattr(response, "interval", 0) or self.backoff(attempt)
+                attempt += 1
+                LOGGER.warn("BootNotification not accepted: %s, retry in %d ms.", response, delay * 1000)
+            self._sleep(delay, self._retry)
+            if not self._connected(connection):
+                return
+        if not self._connected(connection):
+            return
+        try:
+            self.charge_point.replay()
+        except Exception as e:
+            LOGGER.warn("Resuming on %s failed: %r", self.uri, e)
+            return
+        if self._lost_at is not None:
+            self.recovery_ms = utime.ticks_diff(utime.ticks_ms(), self._lost_at)
+            self._lost_at = None
+            LOGGER.info("Recovered in %d ms after %d connections.", self.recovery_ms, self.connects)
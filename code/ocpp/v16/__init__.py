@@ -21,8 +21,21 @@
 @copyright : Copyright (c) 2024
 """
 
-from usr.ocpp.charge_point import ChargePoint as cp
-from usr.ocpp.v16 import call, call_result
+# The backend is chosen by osTimer alone, so an error importing the
+# ChargePoint of QuecPython isn't hidden by the asyncio one.
+try:
+    import osTimer  # noqa: F401
+    _QUECPYTHON = True
+except ImportError:
+    # No osTimer outside of QuecPython, use the asyncio ChargePoint (CPython).
+    _QUECPYTHON = False
+
+if _QUECPYTHON:
+    from usr.ocpp.charge_point import ChargePoint as cp
+else:
+    from usr.ocpp.async_charge_point import ChargePoint as cp
+# Imported on first use, see `payloads.use_actions()` to restrict them.
+from usr.ocpp.v16.payloads import call, call_result
 
 
 class ChargePoint(cp):
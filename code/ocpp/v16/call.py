@@ -21,7 +21,8 @@
 @copyright : Copyright (c) 2024
 """
 
-from usr.ocpp.dataclasses import dataclass
+from usr.ocpp.dataclasses import dataclass, use_tables
+from usr.ocpp.v16 import schemas
 
 from usr.ocpp.v16.enums import (
     StrEnum,
@@ -71,6 +72,8 @@ from usr.ocpp.v16.datatypes import (
 class CancelReservationPayload(dataclass):
     # reservation_id: int
 
+    __slots__ = ("reservation_id",)
+
     def __init__(self, reservation_id):
         self.reservation_id = reservation_id
 
@@ -91,6 +94,8 @@ class CancelReservationPayload(dataclass):
 class CertificateSignedPayload(dataclass):
     # certificate_chain: str
 
+    __slots__ = ("certificate_chain",)
+
     def __init__(self, certificate_chain):
         self.certificate_chain = certificate_chain
 
@@ -113,6 +118,8 @@ class ChangeAvailabilityPayload(dataclass):
     # connector_id: int
     # type: AvailabilityType
 
+    __slots__ = ("connector_id", "type")
+
     def __init__(self, connector_id, type):
         self.connector_id = connector_id
         self.type = type
@@ -140,6 +147,8 @@ class ChangeConfigurationPayload(dataclass):
     # key: str
     # value: str
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -165,7 +174,7 @@ class ChangeConfigurationPayload(dataclass):
 
 
 class ClearCachePayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class ClearChargingProfilePayload(dataclass):
@@ -174,6 +183,8 @@ class ClearChargingProfilePayload(dataclass):
     # charging_profile_purpose: Optional[ChargingProfilePurposeType] = None
     # stack_level: Optional[int] = None
 
+    __slots__ = ("id", "connector_id", "charging_profile_purpose", "stack_level")
+
     def __init__(self, id=None, connector_id=None, charging_profile_purpose=None, stack_level=None):
         self.id = id
         self.connector_id = connector_id
@@ -205,6 +216,8 @@ class ClearChargingProfilePayload(dataclass):
 class DeleteCertificatePayload(dataclass):
     # certificate_hash_data: Dict
 
+    __slots__ = ("certificate_hash_data",)
+
     def __init__(self, certificate_hash_data):
         self.certificate_hash_data = certificate_hash_data
 
@@ -227,6 +240,8 @@ class ExtendedTriggerMessagePayload(dataclass):
     # requested_message: MessageTrigger
     # connector_id: Optional[int] = None
 
+    __slots__ = ("requested_message", "connector_id")
+
     def __init__(self, requested_message, connector_id=None):
         self.requested_message = requested_message
         self.connector_id = connector_id
@@ -254,6 +269,8 @@ class GetCompositeSchedulePayload(dataclass):
     # duration: int
     # charging_rate_unit: Optional[ChargingRateUnitType] = None
 
+    __slots__ = ("connector_id", "duration", "charging_rate_unit")
+
     def __init__(self, connector_id, duration, charging_rate_unit=None):
         self.connector_id = connector_id
         self.duration = duration
@@ -284,6 +301,8 @@ class GetCompositeSchedulePayload(dataclass):
 class GetConfigurationPayload(dataclass):
     # key: Optional[List] = None
 
+    __slots__ = ("key",)
+
     def __init__(self, key=None):
         self.key = key
 
@@ -310,6 +329,8 @@ class GetDiagnosticsPayload(dataclass):
     # start_time: Optional[str] = None
     # stop_time: Optional[str] = None
 
+    __slots__ = ("location", "retries", "retry_interval", "start_time", "stop_time")
+
     def __init__(self, location, retries=None, retry_interval=None, start_time=None, stop_time=None):
         self.location = location
         self.retries = retries
@@ -349,6 +370,8 @@ class GetDiagnosticsPayload(dataclass):
 class GetInstalledCertificateIdsPayload(dataclass):
     # certificate_type: CertificateUse
 
+    __slots__ = ("certificate_type",)
+
     def __init__(self, certificate_type):
         self.certificate_type = certificate_type
 
@@ -368,7 +391,7 @@ class GetInstalledCertificateIdsPayload(dataclass):
 
 
 class GetLocalListVersionPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class GetLogPayload(dataclass):
@@ -378,6 +401,8 @@ class GetLogPayload(dataclass):
     # retries: Optional[int] = None
     # retry_interval: Optional[int] = None
 
+    __slots__ = ("log", "log_type", "request_id", "retries", "retry_interval")
+
     def __init__(self, log, log_type, request_id, retries=None, retry_interval=None):
         self.log = log
         self.log_type = log_type
@@ -419,6 +444,8 @@ class InstallCertificatePayload(dataclass):
     # certificate_type: CertificateUse
     # certificate: str
 
+    __slots__ = ("certificate_type", "certificate")
+
     def __init__(self, certificate_type, certificate):
         self.certificate_type = certificate_type
         self.certificate = certificate
@@ -448,6 +475,8 @@ class RemoteStartTransactionPayload(dataclass):
     # connector_id: Optional[int] = None
     # charging_profile: Optional[Dict] = None
 
+    __slots__ = ("id_tag", "connector_id", "charging_profile")
+
     def __init__(self, id_tag, connector_id=None, charging_profile=None):
         self.id_tag = id_tag
         self.connector_id = connector_id
@@ -478,6 +507,8 @@ class RemoteStartTransactionPayload(dataclass):
 class RemoteStopTransactionPayload(dataclass):
     # transaction_id: int
 
+    __slots__ = ("transaction_id",)
+
     def __init__(self, transaction_id):
         self.transaction_id = transaction_id
 
@@ -502,6 +533,8 @@ class ReserveNowPayload(dataclass):
     # reservation_id: int
     # parent_id_tag: Optional[str] = None
 
+    __slots__ = ("connector_id", "expiry_date", "id_tag", "reservation_id", "parent_id_tag")
+
     def __init__(self, connector_id, expiry_date, id_tag, reservation_id, parent_id_tag=None):
         self.connector_id = connector_id
         self.expiry_date = expiry_date
@@ -544,6 +577,8 @@ class ReserveNowPayload(dataclass):
 class ResetPayload(dataclass):
     # type: ResetType
 
+    __slots__ = ("type",)
+
     def __init__(self, type):
         self.type = type
 
@@ -567,6 +602,8 @@ class SendLocalListPayload(dataclass):
     # update_type: UpdateType
     # local_authorization_list: List = field(default_factory=list)
 
+    __slots__ = ("list_version", "update_type", "local_authorization_list")
+
     def __init__(self, list_version, update_type, local_authorization_list=[]):
         self.list_version = list_version
         self.update_type = update_type
@@ -602,6 +639,8 @@ class SetChargingProfilePayload(dataclass):
     # connector_id: int
     # cs_charging_profiles: Dict
 
+    __slots__ = ("connector_id", "cs_charging_profiles")
+
     def __init__(self, connector_id, cs_charging_profiles):
         self.connector_id = connector_id
         self.cs_charging_profiles = cs_charging_profiles
@@ -631,6 +670,8 @@ class SignedUpdateFirmwarePayload(dataclass):
     # retries: Optional[int] = None
     # retry_interval: Optional[int] = None
 
+    __slots__ = ("request_id", "firmware", "retries", "retry_interval")
+
     def __init__(self, request_id, firmware, retries=None, retry_interval=None):
         self.request_id = request_id
         self.firmware = firmware
@@ -666,6 +707,8 @@ class TriggerMessagePayload(dataclass):
     # requested_message: MessageTrigger
     # connector_id: Optional[int] = None
 
+    __slots__ = ("requested_message", "connector_id")
+
     def __init__(self, requested_message, connector_id=None):
         self.requested_message = requested_message
         self.connector_id = connector_id
@@ -691,6 +734,8 @@ class TriggerMessagePayload(dataclass):
 class UnlockConnectorPayload(dataclass):
     # connector_id: int
 
+    __slots__ = ("connector_id",)
+
     def __init__(self, connector_id):
         self.connector_id = connector_id
 
@@ -714,6 +759,8 @@ class UpdateFirmwarePayload(dataclass):
     # retries: Optional[int] = None
     # retry_interval: Optional[int] = None
 
+    __slots__ = ("location", "retrieve_date", "retries", "retry_interval")
+
     def __init__(self, location, retrieve_date, retries=None, retry_interval=None):
         self.location = location
         self.retrieve_date = retrieve_date
@@ -753,6 +800,8 @@ class UpdateFirmwarePayload(dataclass):
 class AuthorizePayload(dataclass):
     # id_tag: str
 
+    __slots__ = ("id_tag",)
+
     def __init__(self, id_tag):
         self.id_tag = id_tag
 
@@ -782,6 +831,8 @@ class BootNotificationPayload(dataclass):
     # meter_serial_number: Optional[str] = None
     # meter_type: Optional[str] = None
 
+    __slots__ = ("charge_point_model", "charge_point_vendor", "charge_box_serial_number", "charge_point_serial_number", "firmware_version", "iccid", "imsi", "meter_serial_number", "meter_type")
+
     def __init__(self, charge_point_model, charge_point_vendor, charge_box_serial_number=None,
                  charge_point_serial_number=None, firmware_version=None, iccid=None, imsi=None,
                  meter_serial_number=None, meter_type=None):
@@ -846,6 +897,8 @@ class BootNotificationPayload(dataclass):
 class DiagnosticsStatusNotificationPayload(dataclass):
     # status: DiagnosticsStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -867,6 +920,8 @@ class DiagnosticsStatusNotificationPayload(dataclass):
 class FirmwareStatusNotificationPayload(dataclass):
     # status: FirmwareStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -886,13 +941,15 @@ class FirmwareStatusNotificationPayload(dataclass):
 
 
 class HeartbeatPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class LogStatusNotificationPayload(dataclass):
     # status: UploadLogStatus
     # request_id: int
 
+    __slots__ = ("status", "request_id")
+
     def __init__(self, status, request_id):
         self.status = status
         self.request_id = request_id
@@ -921,6 +978,8 @@ class MeterValuesPayload(dataclass):
     # meter_value: List = field(default_factory=list)
     # transaction_id: Optional[int] = None
 
+    __slots__ = ("connector_id", "meter_value", "transaction_id")
+
     def __init__(self, connector_id, meter_value, transaction_id=None):
         self.connector_id = connector_id
         self.meter_value = meter_value
@@ -956,6 +1015,8 @@ class SecurityEventNotificationPayload(dataclass):
     # timestamp: str
     # tech_info: Optional[str]
 
+    __slots__ = ("type", "timestamp", "tech_info")
+
     def __init__(self, type, timestamp, tech_info=None):
         self.type = type
         self.timestamp = timestamp
@@ -988,6 +1049,8 @@ class SecurityEventNotificationPayload(dataclass):
 class SignCertificatePayload(dataclass):
     # csr: str
 
+    __slots__ = ("csr",)
+
     def __init__(self, csr):
         self.csr = csr
 
@@ -1010,6 +1073,8 @@ class SignedFirmwareStatusNotificationPayload(dataclass):
     # status: FirmwareStatus
     # request_id: int
 
+    __slots__ = ("status", "request_id")
+
     def __init__(self, status, request_id):
         self.status = status
         self.request_id = request_id
@@ -1040,6 +1105,8 @@ class StartTransactionPayload(dataclass):
     # timestamp: str
     # reservation_id: Optional[int] = None
 
+    __slots__ = ("connector_id", "id_tag", "meter_start", "timestamp", "reservation_id")
+
     def __init__(self, connector_id, id_tag, meter_start, timestamp, reservation_id=None):
         self.connector_id = connector_id
         self.id_tag = id_tag
@@ -1086,6 +1153,8 @@ class StopTransactionPayload(dataclass):
     # id_tag: Optional[str] = None
     # transaction_data: Optional[List] = None
 
+    __slots__ = ("meter_stop", "timestamp", "transaction_id", "reason", "id_tag", "transaction_data")
+
     def __init__(self, meter_stop, timestamp, transaction_id, reason=None, id_tag=None, transaction_data=None):
         self.meter_stop = meter_stop
         self.timestamp = timestamp
@@ -1141,6 +1210,8 @@ class StatusNotificationPayload(dataclass):
     # vendor_id: Optional[str] = None
     # vendor_error_code: Optional[str] = None
 
+    __slots__ = ("connector_id", "error_code", "status", "timestamp", "info", "vendor_id", "vendor_error_code")
+
     def __init__(self, connector_id, error_code, status, timestamp=None, info=None, vendor_id=None, vendor_error_code=None):
         self.connector_id = connector_id
         self.error_code = error_code
@@ -1199,6 +1270,8 @@ class DataTransferPayload(dataclass):
     # message_id: Optional[str] = None
     # data: Optional[str] = None
 
+    __slots__ = ("vendor_id", "message_id", "data")
+
     def __init__(self, vendor_id, message_id=None, data=None):
         self.vendor_id = vendor_id
         self.message_id = message_id
@@ -1224,3 +1297,7 @@ class DataTransferPayload(dataclass):
                 "vendor_id"
             ]
         }
+
+
+# Validate with the constant schema tables, see scripts/gen_schemas.py.
+use_tables(globals(), "call_", schemas)
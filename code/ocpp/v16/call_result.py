@@ -21,7 +21,8 @@
 @copyright : Copyright (c) 2024
 """
 
-from usr.ocpp.dataclasses import dataclass
+from usr.ocpp.dataclasses import dataclass, use_tables
+from usr.ocpp.v16 import schemas
 
 from usr.ocpp.v16.datatypes import (
     IdTagInfo,
@@ -78,6 +79,8 @@ from usr.ocpp.v16.enums import (
 class AuthorizePayload(dataclass):
     # id_tag_info: IdTagInfo
 
+    __slots__ = ("id_tag_info",)
+
     def __init__(self, id_tag_info):
         self.id_tag_info = id_tag_info
 
@@ -101,6 +104,8 @@ class BootNotificationPayload(dataclass):
     # interval: int
     # status: RegistrationStatus
 
+    __slots__ = ("current_time", "interval", "status")
+
     def __init__(self, current_time, interval, status):
         self.current_time = current_time
         self.interval = interval
@@ -131,16 +136,18 @@ class BootNotificationPayload(dataclass):
 
 
 class DiagnosticsStatusNotificationPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class FirmwareStatusNotificationPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class HeartbeatPayload(dataclass):
     # current_time: str
 
+    __slots__ = ("current_time",)
+
     def __init__(self, current_time):
         self.current_time = current_time
 
@@ -160,16 +167,18 @@ class HeartbeatPayload(dataclass):
 
 
 class LogStatusNotificationPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class SecurityEventNotificationPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class SignCertificatePayload(dataclass):
     # status: GenericStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -189,13 +198,15 @@ class SignCertificatePayload(dataclass):
 
 
 class MeterValuesPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class StartTransactionPayload(dataclass):
     # transaction_id: int
     # id_tag_info: IdTagInfo
 
+    __slots__ = ("transaction_id", "id_tag_info")
+
     def __init__(self, transaction_id, id_tag_info):
         self.transaction_id = transaction_id
         self.id_tag_info = id_tag_info
@@ -220,12 +231,14 @@ class StartTransactionPayload(dataclass):
 
 
 class StatusNotificationPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class StopTransactionPayload(dataclass):
     # id_tag_info: Optional[IdTagInfo] = None
 
+    __slots__ = ("id_tag_info",)
+
     def __init__(self, id_tag_info=None):
         self.id_tag_info = id_tag_info
 
@@ -248,6 +261,8 @@ class StopTransactionPayload(dataclass):
 class CancelReservationPayload(dataclass):
     # status: CancelReservationStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -269,6 +284,8 @@ class CancelReservationPayload(dataclass):
 class CertificateSignedPayload(dataclass):
     # status: CertificateSignedStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -290,6 +307,8 @@ class CertificateSignedPayload(dataclass):
 class ChangeAvailabilityPayload(dataclass):
     # status: AvailabilityStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -311,6 +330,8 @@ class ChangeAvailabilityPayload(dataclass):
 class ChangeConfigurationPayload(dataclass):
     # status: ConfigurationStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -332,6 +353,8 @@ class ChangeConfigurationPayload(dataclass):
 class ClearCachePayload(dataclass):
     # status: ClearCacheStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -353,6 +376,8 @@ class ClearCachePayload(dataclass):
 class ClearChargingProfilePayload(dataclass):
     # status: ClearChargingProfileStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -374,6 +399,8 @@ class ClearChargingProfilePayload(dataclass):
 class DeleteCertificatePayload(dataclass):
     # status: DeleteCertificateStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -395,6 +422,8 @@ class DeleteCertificatePayload(dataclass):
 class ExtendedTriggerMessagePayload(dataclass):
     # status: TriggerMessageStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -417,6 +446,8 @@ class GetInstalledCertificateIdsPayload(dataclass):
     # status: GetInstalledCertificateStatus
     # certificate_hash_data: Optional[List] = None
 
+    __slots__ = ("status", "certificate_hash_data")
+
     def __init__(self, status, certificate_hash_data=None):
         self.status = status
         self.certificate_hash_data = certificate_hash_data
@@ -449,6 +480,8 @@ class GetCompositeSchedulePayload(dataclass):
     # schedule_start: Optional[str] = None
     # charging_schedule: Optional[Dict] = None
 
+    __slots__ = ("status", "connector_id", "schedule_start", "charging_schedule")
+
     def __init__(self, status, connector_id=None, schedule_start=None, charging_schedule=None):
         self.status = status
         self.connector_id = connector_id
@@ -485,6 +518,8 @@ class GetConfigurationPayload(dataclass):
     # configuration_key: Optional[List] = None
     # unknown_key: Optional[List] = None
 
+    __slots__ = ("configuration_key", "unknown_key")
+
     def __init__(self, configuration_key=None, unknown_key=None):
         self.configuration_key = configuration_key
         self.unknown_key = unknown_key
@@ -515,6 +550,8 @@ class GetConfigurationPayload(dataclass):
 class GetDiagnosticsPayload(dataclass):
     # file_name: Optional[str] = None
 
+    __slots__ = ("file_name",)
+
     def __init__(self, file_name=None):
         self.file_name = file_name
 
@@ -536,6 +573,8 @@ class GetDiagnosticsPayload(dataclass):
 class GetLocalListVersionPayload(dataclass):
     # list_version: int
 
+    __slots__ = ("list_version",)
+
     def __init__(self, list_version):
         self.list_version = list_version
 
@@ -557,6 +596,8 @@ class GetLogPayload(dataclass):
     # status: LogStatus
     # filename: Optional[str] = None
 
+    __slots__ = ("status", "filename")
+
     def __init__(self, status, filename=None):
         self.status = status
         self.filename = filename
@@ -583,6 +624,8 @@ class GetLogPayload(dataclass):
 class InstallCertificatePayload(dataclass):
     # status: CertificateStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -604,6 +647,8 @@ class InstallCertificatePayload(dataclass):
 class RemoteStartTransactionPayload(dataclass):
     # status: RemoteStartStopStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -625,6 +670,8 @@ class RemoteStartTransactionPayload(dataclass):
 class RemoteStopTransactionPayload(dataclass):
     # status: RemoteStartStopStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -646,6 +693,8 @@ class RemoteStopTransactionPayload(dataclass):
 class ReserveNowPayload(dataclass):
     # status: ReservationStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -667,6 +716,8 @@ class ReserveNowPayload(dataclass):
 class ResetPayload(dataclass):
     # status: ResetStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -688,6 +739,8 @@ class ResetPayload(dataclass):
 class SendLocalListPayload(dataclass):
     # status: UpdateStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -709,6 +762,8 @@ class SendLocalListPayload(dataclass):
 class SetChargingProfilePayload(dataclass):
     # status: ChargingProfileStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -728,12 +783,14 @@ class SetChargingProfilePayload(dataclass):
 
 
 class SignedFirmwareStatusNotificationPayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 class SignedUpdateFirmwarePayload(dataclass):
     # status: UpdateFirmwareStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -755,6 +812,8 @@ class SignedUpdateFirmwarePayload(dataclass):
 class TriggerMessagePayload(dataclass):
     # status: TriggerMessageStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -776,6 +835,8 @@ class TriggerMessagePayload(dataclass):
 class UnlockConnectorPayload(dataclass):
     # status: UnlockStatus
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
@@ -795,7 +856,7 @@ class UnlockConnectorPayload(dataclass):
 
 
 class UpdateFirmwarePayload(dataclass):
-    pass
+    __slots__ = ()
 
 
 # The DataTransfer CALLRESULT can be send both from Central System as well as
@@ -806,6 +867,8 @@ class DataTransferPayload(dataclass):
     # status: DataTransferStatus
     # data: Optional[str] = None
 
+    __slots__ = ("status", "data")
+
     def __init__(self, status, data=None):
         self.status = status
         self.data = data
@@ -826,3 +889,7 @@ class DataTransferPayload(dataclass):
                 "status"
             ]
         }
+
+
+# Validate with the constant schema tables, see scripts/gen_schemas.py.
+use_tables(globals(), "call_result_", schemas)
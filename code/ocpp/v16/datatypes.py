@@ -21,7 +21,8 @@
 @copyright : Copyright (c) 2024
 """
 
-from usr.ocpp.dataclasses import dataclass
+from usr.ocpp.dataclasses import dataclass, use_tables
+from usr.ocpp.v16 import schemas
 
 from usr.ocpp.v16.enums import (
     StrEnum,
@@ -53,6 +54,8 @@ class IdTagInfo(dataclass):
     # parent_id_tag: Optional[str] = None
     # expiry_date: Optional[str] = None
 
+    __slots__ = ("status", "parent_id_tag", "expiry_date")
+
     def __init__(self, status, parent_id_tag=None, expiry_date=None):
         self.status = status
         self.parent_id_tag = parent_id_tag
@@ -89,6 +92,8 @@ class AuthorizationData(dataclass):
     # id_tag: str
     # id_tag_info: Optional[IdTagInfo] = None
 
+    __slots__ = ("id_tag", "id_tag_info")
+
     def __init__(self, id_tag, id_tag_info=None):
         self.id_tag = id_tag
         self.id_tag_info = id_tag_info
@@ -117,6 +122,8 @@ class ChargingSchedulePeriod(dataclass):
     # limit: float
     # number_phases: Optional[int] = None
 
+    __slots__ = ("start_period", "limit", "number_phases")
+
     def __init__(self, start_period, limit, number_phases=None):
         self.start_period = start_period
         self.limit = limit
@@ -151,6 +158,8 @@ class ChargingSchedule(dataclass):
     # start_schedule: Optional[str] = None
     # min_charging_rate: Optional[float] = None
 
+    __slots__ = ("charging_rate_unit", "charging_schedule_period", "duration", "start_schedule", "min_charging_rate")
+
     def __init__(self, charging_rate_unit, charging_schedule_period, duration=None, start_schedule=None, min_charging_rate=None):
         self.charging_rate_unit = charging_rate_unit
         self.charging_schedule_period = charging_schedule_period
@@ -208,6 +217,8 @@ class ChargingProfile(dataclass):
     # valid_from: Optional[str] = None
     # valid_to: Optional[str] = None
 
+    __slots__ = ("charging_profile_id", "stack_level", "charging_profile_purpose", "charging_profile_kind", "charging_schedule", "transaction_id", "recurrency_kind", "valid_from", "valid_to")
+
     def __init__(self, charging_profile_id, stack_level, charging_profile_purpose,
                  charging_profile_kind, charging_schedule, transaction_id=None,
                  recurrency_kind=None, valid_from=None, valid_to=None):
@@ -279,6 +290,8 @@ class KeyValue(dataclass):
     # readonly: bool
     # value: Optional[str] = None
 
+    __slots__ = ("key", "readonly", "value")
+
     def __init__(self, key, readonly, value=None):
         self.key = key
         self.readonly = readonly
@@ -327,6 +340,8 @@ class SampledValue(dataclass):
     # location: Optional[Location] = None
     # unit: Optional[UnitOfMeasure] = None
 
+    __slots__ = ("value", "context", "format", "measurand", "phase", "location", "unit")
+
     def __init__(self, value, context=None, format=None, measurand=None, phase=None, location=None, unit=None):
         self.value = value
         self.context = context
@@ -383,6 +398,8 @@ class MeterValue(dataclass):
     # timestamp: str
     # sampled_value: List[SampledValue]
 
+    __slots__ = ("timestamp", "sampled_value")
+
     def __init__(self, timestamp, sampled_value):
         self.timestamp = timestamp
         self.sampled_value = sampled_value
@@ -424,6 +441,8 @@ class CertificateHashData(dataclass):
     # issuer_key_hash: str
     # serial_number: str
 
+    __slots__ = ("hash_algorithm", "issuer_name_hash", "issuer_key_hash", "serial_number")
+
     def __init__(self, hash_algorithm, issuer_name_hash, issuer_key_hash, serial_number):
         self.hash_algorithm = hash_algorithm
         self.issuer_name_hash = issuer_name_hash
@@ -472,6 +491,8 @@ class Firmware(dataclass):
     # install_date_time: Optional[str] = None
     # signature: Optional[str] = None
 
+    __slots__ = ("location", "retrieve_date_time", "signing_certificate", "signature", "install_date_time")
+
     def __init__(self, location, retrieve_date_time, signing_certificate, signature, install_date_time=None):
         self.location = location
         self.retrieve_date_time = retrieve_date_time
@@ -523,6 +544,8 @@ class LogParameters(dataclass):
     # oldest_timestamp: Optional[str] = None
     # latest_timestamp: Optional[str] = None
 
+    __slots__ = ("remote_location", "oldest_timestamp", "latest_timestamp")
+
     def __init__(self, remote_location, oldest_timestamp=None, latest_timestamp=None):
         self.remote_location = remote_location
         self.oldest_timestamp = oldest_timestamp
@@ -549,3 +572,7 @@ class LogParameters(dataclass):
                 "remote_location"
             ]
         }
+
+
+# Validate with the constant schema tables, see scripts/gen_schemas.py.
+use_tables(globals(), "datatypes_", schemas)
@@ -0,0 +1,40 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : payloads.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Payload classes of OCPP 1.6, loaded on first use.
+@version   : v1.0.0
+@date      : 2024-05-22 10:17:45
+@copyright : Copyright (c) 2024
+"""
+
+from usr.ocpp.lazy import LazyModule
+
+# `call` and `call_result` stand for the modules of the same name, which are
+# imported when the first payload class is looked up.
+call = LazyModule("usr.ocpp.v16.call")
+call_result = LazyModule("usr.ocpp.v16.call_result")
+
+
+def use_actions(actions):
+    """
+    Restrict the payload classes to the ones of `actions`, e.g. the Actions
+    a deployment implements, None for all of them. Call it before the first
+    ChargePoint is created. CALLs of other Actions are answered with a
+    NotImplemented CallError.
+    """
+    call.actions = actions
+    call_result.actions = actions
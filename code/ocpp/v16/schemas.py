@@ -0,0 +1,809 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : schemas.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Schemas of the OCPP 1.6 payload classes as constant tables.
+@version   : v1.0.0
+@date      : 2024-05-23 09:41:16
+@copyright : Copyright (c) 2024
+"""
+
+# Generated by scripts/gen_schemas.py from the `__schemas__` of the payload
+# classes, don't edit it. Read by usr.ocpp.dataclasses.TableValidator.
+#
+# Only tuples, strings and ints, so it can be frozen into the firmware, where
+# the tables stay in flash. A table is None for an empty schema or
+# (required keys, properties), a property is (key, kind, argument):
+#
+#   1 str        maxLength, 0 for none
+#   2 int
+#   3 float
+#   4 enum       name of the tuple of its values below
+#   5 object     name of its class in DATATYPES
+#   6 str list   maxLength of the items, 0 for none
+#   7 object list  name of the class of the items in DATATYPES
+#   0 any other type, not checked
+
+DATATYPES = "usr.ocpp.v16.datatypes"
+
+enum_AuthorizationStatus = ("Accepted", "Blocked", "Expired", "Invalid", "ConcurrentTx",)
+
+enum_AvailabilityStatus = ("Accepted", "Rejected", "Scheduled",)
+
+enum_AvailabilityType = ("Inoperative", "Operative",)
+
+enum_CancelReservationStatus = ("Accepted", "Rejected",)
+
+enum_CertificateSignedStatus = ("Accepted", "Rejected",)
+
+enum_CertificateStatus = ("Accepted", "Rejected", "Failed",)
+
+enum_CertificateUse = ("CentralSystemRootCertificate", "ManufacturerRootCertificate",)
+
+enum_ChargePointErrorCode = ("ConnectorLockFailure", "EVCommunicationError", "GroundFailure", "HighTemperature", "InternalError", "LocalListConflict", "NoError", "OtherError", "OverCurrentFailure", "OverVoltage", "PowerMeterFailure", "PowerSwitchFailure", "ReaderFailure", "ResetFailure", "UnderVoltage", "WeakSignal",)
+
+enum_ChargePointStatus = ("Available", "Preparing", "Charging", "SuspendedEVSE", "SuspendedEV", "Finishing", "Reserved", "Unavailable", "Faulted",)
+
+enum_ChargingProfileKindType = ("Absolute", "Recurring", "Relative",)
+
+enum_ChargingProfilePurposeType = ("ChargePointMaxProfile", "TxDefaultProfile", "TxProfile",)
+
+enum_ChargingProfileStatus = ("Accepted", "Rejected", "NotSupported",)
+
+enum_ChargingRateUnitType = ("W", "A",)
+
+enum_ClearCacheStatus = ("Accepted", "Rejected",)
+
+enum_ClearChargingProfileStatus = ("Accepted", "Unknown",)
+
+enum_ConfigurationStatus = ("Accepted", "Rejected", "RebootRequired", "NotSupported",)
+
+enum_DataTransferStatus = ("Accepted", "Rejected", "UnknownMessageId", "UnknownVendorId",)
+
+enum_DeleteCertificateStatus = ("Accepted", "Failed", "NotFound",)
+
+enum_DiagnosticsStatus = ("Idle", "Uploaded", "UploadFailed", "Uploading",)
+
+enum_FirmwareStatus = ("Downloaded", "DownloadFailed", "Downloading", "Idle", "InstallationFailed", "Installing", "Installed", "DownloadScheduled", "DownloadPaused", "InstallRebooting", "InstallScheduled", "InstallVerificationFailed", "InvalidSignature", "SignatureVerified",)
+
+enum_GenericStatus = ("Accepted", "Rejected",)
+
+enum_GetCompositeScheduleStatus = ("Accepted", "Rejected",)
+
+enum_GetInstalledCertificateStatus = ("Accepted", "NotFound",)
+
+enum_HashAlgorithm = ("SHA256", "SHA384", "SHA512",)
+
+enum_Location = ("Inlet", "Outlet", "Body", "Cable", "EV",)
+
+enum_Log = ("DiagnosticsLog", "SecurityLog",)
+
+enum_LogStatus = ("Accepted", "Rejected", "AcceptedCanceled",)
+
+enum_Measurand = ("Current.Export", "Current.Import", "Current.Offered", "Energy.Active.Export.Register", "Energy.Active.Import.Register", "Energy.Reactive.Export.Register", "Energy.Reactive.Import.Register", "Energy.Active.Export.Interval", "Energy.Active.Import.Interval", "Energy.Reactive.Export.Interval", "Energy.Reactive.Import.Interval", "Frequency", "Power.Active.Export", "Power.Active.Import", "Power.Factor", "Power.Offered", "Power.Reactive.Export", "Power.Reactive.Import", "RPM", "SoC", "Temperature", "Voltage",)
+
+enum_MessageTrigger = ("BootNotification", "FirmwareStatusNotification", "Heartbeat", "MeterValues", "StatusNotification", "DiagnosticsStatusNotification", "LogStatusNotification", "SignChargePointCertificate",)
+
+enum_Phase = ("L1", "L2", "L3", "N", "L1-N", "L2-N", "L3-N", "L1-L2", "L2-L3", "L3-L1",)
+
+enum_ReadingContext = ("Interruption.Begin", "Interruption.End", "Other", "Sample.Clock", "Sample.Periodic", "Transaction.Begin", "Transaction.End", "Trigger",)
+
+enum_Reason = ("EmergencyStop", "EVDisconnected", "HardReset", "Local", "Other", "PowerLoss", "Reboot", "Remote", "SoftReset", "UnlockCommand", "DeAuthorized",)
+
+enum_RecurrencyKind = ("Daily", "Weekly",)
+
+enum_RegistrationStatus = ("Accepted", "Pending", "Rejected",)
+
+enum_RemoteStartStopStatus = ("Accepted", "Rejected",)
+
+enum_ReservationStatus = ("Accepted", "Faulted", "Occupied", "Rejected", "Unavailable",)
+
+enum_ResetStatus = ("Accepted", "Rejected",)
+
+enum_ResetType = ("Hard", "Soft",)
+
+enum_TriggerMessageStatus = ("Accepted", "Rejected", "NotImplemented",)
+
+enum_UnitOfMeasure = ("Wh", "kWh", "varh", "kvarh", "W", "kW", "VA", "kVA", "var", "kvar", "A", "V", "Celsius", "Fahrenheit", "K", "Percent", "Hertz",)
+
+enum_UnlockStatus = ("Unlocked", "UnlockFailed", "NotSupported",)
+
+enum_UpdateFirmwareStatus = ("Accepted", "Rejected", "AcceptedCanceled", "InvalidCertificate", "RevokedCertificate",)
+
+enum_UpdateStatus = ("Accepted", "Failed", "NotSupported", "VersionMismatch",)
+
+enum_UpdateType = ("Differential", "Full",)
+
+enum_UploadLogStatus = ("BadMessage", "Idle", "NotSupportedOperation", "PermissionDenied", "Uploaded", "UploadFailure", "Uploading",)
+
+enum_ValueFormat = ("Raw", "SignedData",)
+
+datatypes_AuthorizationData = (
+    ("id_tag",),
+    (
+        ("id_tag", 1, 20),
+        ("id_tag_info", 5, "IdTagInfo"),
+    ),
+)
+
+datatypes_CertificateHashData = (
+    ("hash_algorithm", "issuer_name_hash", "issuer_key_hash", "serial_number",),
+    (
+        ("hash_algorithm", 4, "enum_HashAlgorithm"),
+        ("issuer_name_hash", 1, 128),
+        ("issuer_key_hash", 1, 128),
+        ("serial_number", 1, 40),
+    ),
+)
+
+datatypes_ChargingProfile = (
+    ("charging_profile_id", "stack_level", "charging_profile_purpose", "charging_profile_kind", "charging_schedule",),
+    (
+        ("charging_profile_id", 2, 0),
+        ("stack_level", 2, 0),
+        ("charging_profile_purpose", 4, "enum_ChargingProfilePurposeType"),
+        ("charging_profile_kind", 4, "enum_ChargingProfileKindType"),
+        ("charging_schedule", 5, "ChargingSchedule"),
+        ("transaction_id", 2, 0),
+        ("recurrency_kind", 4, "enum_RecurrencyKind"),
+        ("valid_from", 1, 0),
+        ("valid_to", 1, 0),
+    ),
+)
+
+datatypes_ChargingSchedule = (
+    ("charging_rate_unit", "charging_schedule_period",),
+    (
+        ("charging_rate_unit", 4, "enum_ChargingRateUnitType"),
+        ("charging_schedule_period", 7, "ChargingSchedulePeriod"),
+        ("duration", 2, 0),
+        ("start_schedule", 1, 0),
+        ("min_charging_rate", 3, 0),
+    ),
+)
+
+datatypes_ChargingSchedulePeriod = (
+    ("start_period", "limit",),
+    (
+        ("start_period", 2, 0),
+        ("limit", 3, 0),
+        ("number_phases", 2, 0),
+    ),
+)
+
+datatypes_Firmware = (
+    ("location", "retrieve_date_time", "signing_certificate", "signature",),
+    (
+        ("location", 1, 512),
+        ("retrieve_date_time", 1, 0),
+        ("signing_certificate", 1, 5500),
+        ("signature", 1, 800),
+        ("install_date_time", 1, 0),
+    ),
+)
+
+datatypes_IdTagInfo = (
+    ("status",),
+    (
+        ("status", 4, "enum_AuthorizationStatus"),
+        ("parent_id_tag", 1, 20),
+        ("expiry_date", 1, 0),
+    ),
+)
+
+datatypes_KeyValue = (
+    ("key", "readonly",),
+    (
+        ("key", 1, 0),
+        ("readonly", 0, 0),
+        ("value", 1, 0),
+    ),
+)
+
+datatypes_LogParameters = (
+    ("remote_location",),
+    (
+        ("remote_location", 1, 512),
+        ("oldest_timestamp", 1, 0),
+        ("latest_timestamp", 1, 0),
+    ),
+)
+
+datatypes_MeterValue = (
+    ("timestamp", "sampled_value",),
+    (
+        ("timestamp", 1, 0),
+        ("sampled_value", 7, "SampledValue"),
+    ),
+)
+
+datatypes_SampledValue = (
+    ("value",),
+    (
+        ("value", 1, 0),
+        ("context", 4, "enum_ReadingContext"),
+        ("format", 4, "enum_ValueFormat"),
+        ("measurand", 4, "enum_Measurand"),
+        ("phase", 4, "enum_Phase"),
+        ("location", 4, "enum_Location"),
+        ("unit", 4, "enum_UnitOfMeasure"),
+    ),
+)
+
+call_AuthorizePayload = (
+    ("id_tag",),
+    (
+        ("id_tag", 1, 20),
+    ),
+)
+
+call_BootNotificationPayload = (
+    ("charge_point_model", "charge_point_vendor",),
+    (
+        ("charge_point_model", 1, 20),
+        ("charge_point_vendor", 1, 20),
+        ("charge_box_serial_number", 1, 25),
+        ("charge_point_serial_number", 1, 25),
+        ("firmware_version", 1, 50),
+        ("iccid", 1, 20),
+        ("imsi", 1, 20),
+        ("meter_serial_number", 1, 25),
+        ("meter_type", 1, 25),
+    ),
+)
+
+call_CancelReservationPayload = (
+    ("reservation_id",),
+    (
+        ("reservation_id", 2, 0),
+    ),
+)
+
+call_CertificateSignedPayload = (
+    ("certificate_chain",),
+    (
+        ("certificate_chain", 1, 10000),
+    ),
+)
+
+call_ChangeAvailabilityPayload = (
+    ("connector_id", "type",),
+    (
+        ("connector_id", 2, 0),
+        ("type", 4, "enum_AvailabilityType"),
+    ),
+)
+
+call_ChangeConfigurationPayload = (
+    ("key", "value",),
+    (
+        ("key", 1, 50),
+        ("value", 1, 500),
+    ),
+)
+
+call_ClearCachePayload = None
+
+call_ClearChargingProfilePayload = (
+    (),
+    (
+        ("id", 2, 0),
+        ("connector_id", 2, 0),
+        ("charging_profile_purpose", 4, "enum_ChargingProfilePurposeType"),
+        ("stack_level", 2, 0),
+    ),
+)
+
+call_DataTransferPayload = (
+    ("vendor_id",),
+    (
+        ("vendor_id", 1, 255),
+        ("message_id", 1, 50),
+        ("data", 1, 0),
+    ),
+)
+
+call_DeleteCertificatePayload = (
+    ("certificate_hash_data",),
+    (
+        ("certificate_hash_data", 5, "CertificateHashData"),
+    ),
+)
+
+call_DiagnosticsStatusNotificationPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_DiagnosticsStatus"),
+    ),
+)
+
+call_ExtendedTriggerMessagePayload = (
+    ("requested_message",),
+    (
+        ("requested_message", 4, "enum_MessageTrigger"),
+        ("connector_id", 2, 0),
+    ),
+)
+
+call_FirmwareStatusNotificationPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_FirmwareStatus"),
+    ),
+)
+
+call_GetCompositeSchedulePayload = (
+    ("connector_id", "duration",),
+    (
+        ("connector_id", 2, 0),
+        ("duration", 2, 0),
+        ("charging_rate_unit", 4, "enum_ChargingRateUnitType"),
+    ),
+)
+
+call_GetConfigurationPayload = (
+    (),
+    (
+        ("key", 6, 50),
+    ),
+)
+
+call_GetDiagnosticsPayload = (
+    ("location",),
+    (
+        ("location", 1, 0),
+        ("retries", 2, 0),
+        ("retry_interval", 2, 0),
+        ("start_time", 1, 0),
+        ("stop_time", 1, 0),
+    ),
+)
+
+call_GetInstalledCertificateIdsPayload = (
+    ("certificate_type",),
+    (
+        ("certificate_type", 4, "enum_CertificateUse"),
+    ),
+)
+
+call_GetLocalListVersionPayload = None
+
+call_GetLogPayload = (
+    ("log", "log_type", "request_id",),
+    (
+        ("log", 5, "LogParameters"),
+        ("log_type", 4, "enum_Log"),
+        ("request_id", 2, 0),
+        ("retries", 2, 0),
+        ("retry_interval", 2, 0),
+    ),
+)
+
+call_HeartbeatPayload = None
+
+call_InstallCertificatePayload = (
+    ("certificate_type", "certificate",),
+    (
+        ("certificate_type", 4, "enum_CertificateUse"),
+        ("certificate", 1, 5500),
+    ),
+)
+
+call_LogStatusNotificationPayload = (
+    ("status", "request_id",),
+    (
+        ("status", 4, "enum_UploadLogStatus"),
+        ("request_id", 2, 0),
+    ),
+)
+
+call_MeterValuesPayload = (
+    ("connector_id", "meter_value",),
+    (
+        ("connector_id", 2, 0),
+        ("meter_value", 7, "MeterValue"),
+        ("transaction_id", 2, 0),
+    ),
+)
+
+call_RemoteStartTransactionPayload = (
+    ("id_tag",),
+    (
+        ("id_tag", 1, 20),
+        ("connector_id", 2, 0),
+        ("charging_profile", 5, "ChargingProfile"),
+    ),
+)
+
+call_RemoteStopTransactionPayload = (
+    ("transaction_id",),
+    (
+        ("transaction_id", 2, 0),
+    ),
+)
+
+call_ReserveNowPayload = (
+    ("connector_id", "expiry_date", "id_tag", "reservation_id",),
+    (
+        ("connector_id", 2, 0),
+        ("expiry_date", 1, 0),
+        ("id_tag", 1, 20),
+        ("reservation_id", 2, 0),
+        ("parent_id_tag", 1, 20),
+    ),
+)
+
+call_ResetPayload = (
+    ("type",),
+    (
+        ("type", 4, "enum_ResetType"),
+    ),
+)
+
+call_SecurityEventNotificationPayload = (
+    ("type", "timestamp",),
+    (
+        ("type", 1, 50),
+        ("timestamp", 1, 0),
+        ("tech_info", 1, 255),
+    ),
+)
+
+call_SendLocalListPayload = (
+    ("list_version", "update_type",),
+    (
+        ("list_version", 2, 0),
+        ("update_type", 4, "enum_UpdateType"),
+        ("local_authorization_list", 7, "AuthorizationData"),
+    ),
+)
+
+call_SetChargingProfilePayload = (
+    ("connector_id", "cs_charging_profiles",),
+    (
+        ("connector_id", 2, 0),
+        ("cs_charging_profiles", 5, "ChargingProfile"),
+    ),
+)
+
+call_SignCertificatePayload = (
+    ("csr",),
+    (
+        ("csr", 1, 5500),
+    ),
+)
+
+call_SignedFirmwareStatusNotificationPayload = (
+    ("status", "request_id",),
+    (
+        ("status", 4, "enum_FirmwareStatus"),
+        ("request_id", 2, 0),
+    ),
+)
+
+call_SignedUpdateFirmwarePayload = (
+    ("request_id", "firmware",),
+    (
+        ("request_id", 2, 0),
+        ("firmware", 5, "Firmware"),
+        ("retries", 2, 0),
+        ("retry_interval", 2, 0),
+    ),
+)
+
+call_StartTransactionPayload = (
+    ("connector_id", "id_tag", "meter_start", "timestamp",),
+    (
+        ("connector_id", 2, 0),
+        ("id_tag", 1, 20),
+        ("meter_start", 2, 0),
+        ("timestamp", 1, 0),
+        ("reservation_id", 2, 0),
+    ),
+)
+
+call_StatusNotificationPayload = (
+    ("connector_id", "error_code", "status",),
+    (
+        ("connector_id", 2, 0),
+        ("error_code", 4, "enum_ChargePointErrorCode"),
+        ("status", 4, "enum_ChargePointStatus"),
+        ("timestamp", 1, 0),
+        ("info", 1, 50),
+        ("vendor_id", 1, 255),
+        ("vendor_error_code", 1, 50),
+    ),
+)
+
+call_StopTransactionPayload = (
+    ("meter_stop", "timestamp", "transaction_id",),
+    (
+        ("meter_stop", 2, 0),
+        ("timestamp", 1, 0),
+        ("transaction_id", 2, 0),
+        ("reason", 4, "enum_Reason"),
+        ("id_tag", 1, 20),
+        ("transaction_data", 7, "MeterValue"),
+    ),
+)
+
+call_TriggerMessagePayload = (
+    ("requested_message",),
+    (
+        ("requested_message", 4, "enum_MessageTrigger"),
+        ("connector_id", 2, 0),
+    ),
+)
+
+call_UnlockConnectorPayload = (
+    ("connector_id",),
+    (
+        ("connector_id", 2, 0),
+    ),
+)
+
+call_UpdateFirmwarePayload = (
+    ("location", "retrieve_date",),
+    (
+        ("location", 1, 0),
+        ("retrieve_date", 1, 0),
+        ("retries", 2, 0),
+        ("retry_interval", 2, 0),
+    ),
+)
+
+call_result_AuthorizePayload = (
+    ("id_tag_info",),
+    (
+        ("id_tag_info", 5, "IdTagInfo"),
+    ),
+)
+
+call_result_BootNotificationPayload = (
+    ("current_time", "interval", "status",),
+    (
+        ("current_time", 1, 0),
+        ("interval", 2, 0),
+        ("status", 4, "enum_RegistrationStatus"),
+    ),
+)
+
+call_result_CancelReservationPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_CancelReservationStatus"),
+    ),
+)
+
+call_result_CertificateSignedPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_CertificateSignedStatus"),
+    ),
+)
+
+call_result_ChangeAvailabilityPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_AvailabilityStatus"),
+    ),
+)
+
+call_result_ChangeConfigurationPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_ConfigurationStatus"),
+    ),
+)
+
+call_result_ClearCachePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_ClearCacheStatus"),
+    ),
+)
+
+call_result_ClearChargingProfilePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_ClearChargingProfileStatus"),
+    ),
+)
+
+call_result_DataTransferPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_DataTransferStatus"),
+        ("data", 1, 0),
+    ),
+)
+
+call_result_DeleteCertificatePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_DeleteCertificateStatus"),
+    ),
+)
+
+call_result_DiagnosticsStatusNotificationPayload = None
+
+call_result_ExtendedTriggerMessagePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_TriggerMessageStatus"),
+    ),
+)
+
+call_result_FirmwareStatusNotificationPayload = None
+
+call_result_GetCompositeSchedulePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_GetCompositeScheduleStatus"),
+        ("connector_id", 2, 0),
+        ("schedule_start", 1, 0),
+        ("charging_schedule", 5, "ChargingSchedule"),
+    ),
+)
+
+call_result_GetConfigurationPayload = (
+    (),
+    (
+        ("configuration_key", 7, "KeyValue"),
+        ("unknown_key", 6, 50),
+    ),
+)
+
+call_result_GetDiagnosticsPayload = (
+    ("file_name",),
+    (
+        ("file_name", 1, 255),
+    ),
+)
+
+call_result_GetInstalledCertificateIdsPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_GetInstalledCertificateStatus"),
+        ("certificate_hash_data", 7, "CertificateHashData"),
+    ),
+)
+
+call_result_GetLocalListVersionPayload = (
+    ("list_version",),
+    (
+        ("list_version", 2, 0),
+    ),
+)
+
+call_result_GetLogPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_LogStatus"),
+        ("filename", 1, 255),
+    ),
+)
+
+call_result_HeartbeatPayload = (
+    ("current_time",),
+    (
+        ("current_time", 1, 0),
+    ),
+)
+
+call_result_InstallCertificatePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_CertificateStatus"),
+    ),
+)
+
+call_result_LogStatusNotificationPayload = None
+
+call_result_MeterValuesPayload = None
+
+call_result_RemoteStartTransactionPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_RemoteStartStopStatus"),
+    ),
+)
+
+call_result_RemoteStopTransactionPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_RemoteStartStopStatus"),
+    ),
+)
+
+call_result_ReserveNowPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_ReservationStatus"),
+    ),
+)
+
+call_result_ResetPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_ResetStatus"),
+    ),
+)
+
+call_result_SecurityEventNotificationPayload = None
+
+call_result_SendLocalListPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_UpdateStatus"),
+    ),
+)
+
+call_result_SetChargingProfilePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_ChargingProfileStatus"),
+    ),
+)
+
+call_result_SignCertificatePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_GenericStatus"),
+    ),
+)
+
+call_result_SignedFirmwareStatusNotificationPayload = None
+
+call_result_SignedUpdateFirmwarePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_UpdateFirmwareStatus"),
+    ),
+)
+
+call_result_StartTransactionPayload = (
+    ("transaction_id", "id_tag_info",),
+    (
+        ("transaction_id", 2, 0),
+        ("id_tag_info", 5, "IdTagInfo"),
+    ),
+)
+
+call_result_StatusNotificationPayload = None
+
+call_result_StopTransactionPayload = (
+    (),
+    (
+        ("id_tag_info", 5, "IdTagInfo"),
+    ),
+)
+
+call_result_TriggerMessagePayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_TriggerMessageStatus"),
+    ),
+)
+
+call_result_UnlockConnectorPayload = (
+    ("status",),
+    (
+        ("status", 4, "enum_UnlockStatus"),
+    ),
+)
+
+call_result_UpdateFirmwarePayload = None
@@ -0,0 +1,172 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : workers.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Bounded pool of threads running the handlers of the CALLs a
+             ChargePoint receives, off its receive loop.
+@version   : v1.0.0
+@date      : 2024-05-29 10:12:45
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+import queue
+import _thread
+
+from usr.tools import logging
+
+LOGGER = logging.getLogger(__name__)
+
+# Groups of OCPP 1.6 Actions whose CALLs are handled one at a time, in the
+# order they have been received: each one acts on the state the one before
+# has left, e.g. a RemoteStopTransaction on the transaction started by the
+# RemoteStartTransaction received just before.
+SEQUENTIAL = (
+    ("RemoteStartTransaction", "RemoteStopTransaction", "UnlockConnector", "ChangeAvailability", "Reset"),
+    ("ChangeConfiguration",),
+    ("SetChargingProfile", "ClearChargingProfile"),
+    ("SendLocalList",),
+    ("UpdateFirmware",),
+    ("GetDiagnostics",),
+)
+
+
+class WorkerPool(object):
+    """
+    Runs the handlers of the CALLs a ChargePoint receives on `size` threads,
+    so a slow handler (e.g. collecting the logs of GetDiagnostics) neither
+    holds up the other CALLs nor the responses an ongoing call() waits for.
+
+    Up to `max_queued` CALLs wait for a free thread, submit() refuses more
+    instead of blocking the receive loop.
+
+    `limits` maps an Action to the number of its CALLs handled at the same
+    time at most. The CALLs of the Actions of a group of `sequential` are
+    handled one at a time in the order they have been submitted, see
+    SEQUENTIAL. An Action can't be in both, ValueError is raised then: pass
+    `sequential` without its group to give it a limit. Other CALLs start in
+    the order they have been submitted and may run side by side.
+
+    The threads are started by start(), with the stack size set by
+    `_thread.stack_size()` beforehand.
+    """
+
+    def __init__(self, size=2, max_queued=8, limits=None, sequential=SEQUENTIAL):
+        self.size = size
+        self.max_queued = max_queued
+
+        # Lanes by Action: [limit, CALLs running, CALLs waiting for the lane].
+        self._lanes = {}
+        for action, limit in (limits or {}).items():
+            self._lanes[action] = [limit, 0, []]
+        for group in sequential:
+            lane = [1, 0, []]
+            for action in group:
+                if action in self._lanes:
+                    raise ValueError("%s is in a sequential group and in limits or another group" % action)
+                self._lanes[action] = lane
+
+        self._ready = queue.Queue()
+        self._lock = _thread.allocate_lock()
+        self._started = False
+
+        # Queue depth metrics, see stats().
+        self.queued = 0
+        self.running = 0
+        self.peak_queued = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.done = 0
+
+    def start(self):
+        """Start the threads, once."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for _ in range(self.size):
+            _thread.start_new_thread(self._run, ())
+
+    def stop(self):
+        """End the threads once the CALLs submitted have been handled."""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+        for _ in range(self.size):
+            self._ready.put(None)
+
+    def submit(self, action, func, *args):
+        """
+        Run `func(*args)` for a CALL of `action` on one of the threads.
+        Return False when `max_queued` CALLs are already waiting.
+        """
+        with self._lock:
+            if self.queued >= self.max_queued:
+                self.rejected += 1
+                return False
+            self.queued += 1
+            self.submitted += 1
+            if self.queued > self.peak_queued:
+                self.peak_queued = self.queued
+            lane = self._lanes.get(action)
+            job = (lane, func, args)
+            if lane is not None:
+                if lane[1] >= lane[0]:
+                    # Queued behind the CALLs running in the lane.
+                    lane[2].append(job)
+                    return True
+                lane[1] += 1
+        self._ready.put(job)
+        return True
+
+    def stats(self):
+        """Return the queue depth metrics."""
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "peak_queued": self.peak_queued,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "done": self.done,
+        }
+
+    def _run(self):
+        while True:
+            job = self._ready.get()
+            if job is None:
+                return
+            lane, func, args = job
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            try:
+                func(*args)
+            except Exception as e:
+                sys.print_exception(e)
+                LOGGER.error("Error in worker: %r", e)
+            with self._lock:
+                self.running -= 1
+                self.done += 1
+                job = None
+                if lane is not None:
+                    if lane[2]:
+                        # The lane stays taken by the next CALL of it.
+                        job = lane[2].pop(0)
+                    else:
+                        lane[1] -= 1
+            if job is not None:
+                self._ready.put(job)
@@ -0,0 +1,167 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : jsonstream.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Incremental reading of a JSON document in a bytes buffer.
+@version   : v1.0.0
+@date      : 2024-05-16 09:12:37
+@copyright : Copyright (c) 2024
+"""
+
+try:
+    import ujson
+except ImportError:
+    import json as ujson
+
+_QUOTE = 0x22
+_BACKSLASH = 0x5c
+_COMMA = 0x2c
+_COLON = 0x3a
+_OPEN = (0x5b, 0x7b)  # [ {
+_CLOSE = (0x5d, 0x7d)  # ] }
+_SPACE = (0x20, 0x09, 0x0a, 0x0d)
+
+
+def loads(buf):
+    """ujson.loads() of a bytes like buffer, CPython's json needs bytes."""
+    try:
+        return ujson.loads(buf)
+    except TypeError:
+        return ujson.loads(bytes(buf))
+
+
+class Reader(object):
+    """
+    Cursor over a JSON document in a bytes, bytearray or memoryview buffer.
+
+    Containers are walked value by value, every value read is decoded on its
+    own with ujson.loads(), so only the value being read is ever held as
+    Python objects. Values can also be skipped, which only scans the buffer.
+    Malformed documents raise ValueError.
+    """
+
+    def __init__(self, buf, pos=0, end=None):
+        self.buf = memoryview(buf)
+        self.pos = pos
+        self.end = len(self.buf) if end is None else end
+
+    def _skip_space(self):
+        buf = self.buf
+        pos = self.pos
+        while pos < self.end and buf[pos] in _SPACE:
+            pos += 1
+        self.pos = pos
+
+    def peek(self):
+        """Return the next byte which isn't white space, or None at the end."""
+        self._skip_space()
+        if self.pos < self.end:
+            return self.buf[self.pos]
+        return None
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError("expected %s at %d" % (chr(char), self.pos))
+        self.pos += 1
+
+    def _string_end(self, pos):
+        buf = self.buf
+        pos += 1
+        while pos < self.end:
+            c = buf[pos]
+            if c == _QUOTE:
+                return pos + 1
+            pos += 2 if c == _BACKSLASH else 1
+        raise ValueError("unterminated string")
+
+    def _value_end(self, pos):
+        buf = self.buf
+        end = self.end
+        depth = 0
+        while pos < end:
+            c = buf[pos]
+            if c == _QUOTE:
+                pos = self._string_end(pos)
+                if depth == 0:
+                    return pos
+                continue
+            if c in _OPEN:
+                depth += 1
+            elif c in _CLOSE:
+                if depth == 0:
+                    # Closes the container of a scalar, e.g. the 1 of [0, 1].
+                    break
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+            elif depth == 0 and (c == _COMMA or c in _SPACE):
+                break
+            pos += 1
+        if depth:
+            raise ValueError("unterminated value")
+        return pos
+
+    def skip(self):
+        """Skip the next value, return its (start, end) in the buffer."""
+        self._skip_space()
+        start = self.pos
+        self.pos = self._value_end(start)
+        if self.pos == start:
+            raise ValueError("expected a value at %d" % start)
+        return start, self.pos
+
+    def read(self):
+        """Decode and return the next value."""
+        start, end = self.skip()
+        return loads(self.buf[start:end])
+
+    def _next(self, close, first):
+        c = self.peek()
+        if c == close:
+            self.pos += 1
+            return False
+        if not first:
+            self.expect(_COMMA)
+        return True
+
+    def items(self):
+        """
+        Iterate over an array, yield before each element with the cursor on
+        it. The element must be read or skipped before the next one.
+        """
+        self.expect(0x5b)
+        first = True
+        while self._next(0x5d, first):
+            first = False
+            yield
+
+    def keys(self):
+        """
+        Iterate over the keys of an object, the cursor is on the value of the
+        key yielded, which must be read or skipped before the next key.
+        """
+        self.expect(0x7b)
+        first = True
+        while self._next(0x7d, first):
+            first = False
+            key = self.read()
+            self.expect(_COLON)
+            yield key
+
+    def values(self):
+        """Iterate over the decoded elements of an array."""
+        for _ in self.items():
+            yield self.read()
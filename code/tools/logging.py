@@ -24,19 +24,38 @@
 @copyright :Copyright (c) 2022
 """
 
-import uos
-import utime
-import ql_fs
+try:
+    import uos
+except ImportError:
+    import os as uos
+
+try:
+    import utime
+except ImportError:
+    import time as utime
+
+try:
+    import osTimer
+except ImportError:
+    osTimer = None
+
+import queue
 import _thread
-import usys as sys
 
 _LOG_LOCK = _thread.allocate_lock()
+
+DEBUG = 0
+INFO = 1
+WARN = 2
+ERROR = 3
+CRITICAL = 4
+
 _LOG_LEVEL_CODE = {
-    "debug": 0,
-    "info": 1,
-    "warn": 2,
-    "error": 3,
-    "critical": 4,
+    "debug": DEBUG,
+    "info": INFO,
+    "warn": WARN,
+    "error": ERROR,
+    "critical": CRITICAL,
 }
 
 _log_dict = {}
@@ -48,64 +67,287 @@ _log_size = 0x2000
 _log_back = 8
 _log_level = "debug"
 _log_debug = True
+# The lowest level code logged, see _update_level(). Checked before
+# anything is formatted.
+_log_min = DEBUG
+# The LogWriter of the log file while the log is saved, see setSaveLog().
+_log_writer = None
+_log_buffer = 0x1000
+_log_interval = 5
+_log_flush_level = ERROR
+
+
+def _update_level():
+    global _log_min
+    if _log_debug:
+        _log_min = DEBUG
+    else:
+        # Debug messages aren't logged out of debug mode, even at level debug.
+        _log_min = max(_LOG_LEVEL_CODE[_log_level], INFO)
+
+
+def _dropped(count):
+    return ("... %d log lines dropped\n" % count).encode()
+
+
+def _failed(count):
+    return ("... %d log file errors, lines lost\n" % count).encode()
+
+
+class _Ticker(object):
+    """Stand-in of osTimer on CPython, calls back from a thread."""
+
+    def __init__(self):
+        self._period = None
+
+    def start(self, period, periodic, callback):
+        self._period = period
+        _thread.start_new_thread(self._run, (period, callback))
+
+    def stop(self):
+        self._period = None
+
+    def _run(self, period, callback):
+        while self._period == period:
+            utime.sleep(period / 1000)
+            if self._period == period:
+                callback(None)
+
+
+class LogWriter(object):
+    """
+    Appends the log lines to the log file from a thread of its own, so
+    logging costs a copy into a buffer in RAM rather than a write to flash.
+
+    The lines are collected in a buffer of `buffer_size` bytes and written
+    every `interval` seconds, once half the buffer is filled or at once
+    after a line of `flush_level` or higher, e.g. ERROR. While the buffer
+    is full the lines are dropped and counted, the count is written in
+    their place. A line longer than the buffer is written at once, after
+    the lines buffered.
+
+    A failed rotation or write is counted in `errors`. The first one of a
+    run of failures is printed, the count of the run is written in the
+    file once a write succeeds again.
+
+    The size of the file and the number of backups are looked up once, by
+    start(), and then kept in memory. When the next write would make the
+    file reach `max_size` bytes it becomes backup 1, the older backups
+    move up by one and the one past `backups` is removed.
+    """
+
+    def __init__(self, path, max_size=0x2000, backups=8, buffer_size=0x1000, interval=5, flush_level=ERROR):
+        self.path = path
+        self.max_size = max_size
+        self.backups = backups
+        self.interval = interval
+        self.flush_level = flush_level
+        self.dropped = 0
+        self.errors = 0
+
+        # Filled by write() while the other one is written by flush().
+        self._buf = bytearray(buffer_size)
+        self._spare = bytearray(buffer_size)
+        self._len = 0
+        self._lock = _thread.allocate_lock()
+        self._flush_lock = _thread.allocate_lock()
+        self._wakeup = queue.Queue()
+        self._waking = False
+        self._timer = osTimer() if osTimer is not None else _Ticker()
+        self._running = False
+        # The failures since the last write which succeeded.
+        self._failing = 0
+
+        self._size = 0
+        self._backup_count = 0
+
+    def start(self):
+        """Look up the file and its backups, start the writer thread and its timer."""
+        folder = self.path[:self.path.rfind("/")]
+        if folder and not self._exists(folder):
+            uos.mkdir(folder)
+        self._scan()
+        self._running = True
+        _thread.start_new_thread(self._run, ())
+        self._timer.start(self.interval * 1000, 1, self._tick)
+
+    def stop(self):
+        """Write the lines buffered and end the writer thread."""
+        self._running = False
+        self._timer.stop()
+        self._wakeup.put(True)
+        self.flush()
+
+    def write(self, line, level=INFO):
+        """Buffer a line of the level code `level`, it's written by the writer thread."""
+        data = line.encode()
+        if len(data) > len(self._buf):
+            with self._flush_lock:
+                self._flush()
+                self._append(data)
+            return
+        with self._lock:
+            if self.dropped:
+                # The count goes in the place of the lines dropped, with the
+                # next line which fits.
+                count = _dropped(self.dropped)
+                if self._len + len(count) + len(data) <= len(self._buf):
+                    self._put(count)
+                    self._put(data)
+                    self.dropped = 0
+                else:
+                    self.dropped += 1
+            elif not self._put(data):
+                self.dropped += 1
+            wake = not self._waking and (
+                level >= self.flush_level or self.dropped or self._len * 2 >= len(self._buf)
+            )
+            if wake:
+                self._waking = True
+        if wake:
+            self._wakeup.put(True)
+
+    def _put(self, data):
+        end = self._len + len(data)
+        if end > len(self._buf):
+            return False
+        self._buf[self._len:end] = data
+        self._len = end
+        return True
+
+    def flush(self):
+        """Write the lines buffered to the file."""
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self):
+        with self._lock:
+            buf, length, dropped = self._buf, self._len, self.dropped
+            self._buf, self._len, self.dropped = self._spare, 0, 0
+            self._spare = buf
+            self._waking = False
+        if length:
+            self._append(memoryview(buf)[:length])
+        if dropped:
+            self._append(_dropped(dropped))
+
+    def _append(self, data):
+        if self._size and self._size + len(data) >= self.max_size:
+            try:
+                self._rotate()
+            except Exception as e:
+                self._error("Rotating the log %s failed: %r" % (self.path, e))
+                # Changed behind our back, look the files up again.
+                self._scan()
+        try:
+            with open(self.path, "ab") as f:
+                if self._failing:
+                    count = _failed(self._failing)
+                    f.write(count)
+                    self._size += len(count)
+                    self._failing = 0
+                f.write(data)
+            self._size += len(data)
+        except Exception as e:
+            self._error("Writing the log to %s failed: %r" % (self.path, e))
+
+    def _error(self, message):
+        self.errors += 1
+        if not self._failing:
+            print(message)
+        self._failing += 1
+
+    def _scan(self):
+        self._size = uos.stat(self.path)[6] if self._exists(self.path) else 0
+        self._backup_count = 0
+        while self._backup_count < self.backups and self._exists(self._backup(self._backup_count + 1)):
+            self._backup_count += 1
+
+    def _rotate(self):
+        count = self._backup_count
+        if count >= self.backups:
+            count = self.backups - 1
+            if self.backups:
+                uos.remove(self._backup(self.backups))
+        for i in range(count, 0, -1):
+            uos.rename(self._backup(i), self._backup(i + 1))
+        if self.backups:
+            uos.rename(self.path, self._backup(1))
+            self._backup_count = count + 1
+        else:
+            uos.remove(self.path)
+        self._size = 0
+
+    def _backup(self, i):
+        return self.path + "." + str(i)
+
+    @staticmethod
+    def _exists(path):
+        try:
+            uos.stat(path)
+            return True
+        except OSError:
+            return False
+
+    def _tick(self, args):
+        if self._len and not self._waking:
+            self._waking = True
+            self._wakeup.put(True)
+
+    def _run(self):
+        while self._running:
+            self._wakeup.get()
+            self.flush()
 
 
 class Logger:
+    """
+    The messages are formatted lazily: `LOGGER.info("send %s", message)`
+    only builds the string `"send %s" % (message,)` when info messages are
+    logged. Use isEnabledFor() to skip preparing the arguments too.
+    """
+
     def __init__(self, name):
         self.__name = name
 
-    def __save_log(self, msg):
-        global _log_path
-        global _log_file
-        try:
-            log_size = 0
-            if not ql_fs.path_exists(_log_path):
-                uos.mkdir(_log_path[:-1])
-            if ql_fs.path_exists(_log_file):
-                log_size = ql_fs.path_getsize(_log_file)
-                if log_size + len(msg) >= _log_size:
-                    for i in range(_log_back, 0, -1):
-                        bak_file = _log_file + "." + str(i)
-                        if ql_fs.path_exists(bak_file):
-                            if i == _log_back:
-                                uos.remove(bak_file)
-                            else:
-                                uos.rename(bak_file, _log_file + "." + str(i + 1))
-                    uos.rename(_log_file, _log_file + ".1")
-            with open(_log_file, "a") as lf:
-                lf.write(msg)
-        except Exception as e:
-            sys.print_exception(e)
+    def isEnabledFor(self, level):
+        """Return whether messages of the level code `level`, e.g. INFO, are logged."""
+        return level >= _log_min
 
-    def __log(self, level, *message):
-        global _log_save
+    def __log(self, level, code, message, args):
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                # Not a format, join the arguments as print() does.
+                message = " ".join([str(message)] + [str(arg) for arg in args])
+        _time = "{}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}".format(*utime.localtime())
+        msg = "[{}][{}][{}]".format(_time, self.__name, level)
         with _LOG_LOCK:
-            if _log_debug is False:
-                if _log_level == "debug" and level == "debug":
-                    return
-                if _LOG_LEVEL_CODE.get(level) < _LOG_LEVEL_CODE.get(_log_level):
-                    return
-            _time = "{}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}".format(*utime.localtime())
-            msg = "[{}][{}][{}]".format(_time, self.__name, level)
-            print(msg, *message)
-            if _log_save:
-                msg = msg + " " + " ".join(message) if message else msg
-                self.__save_log(msg)
+            print(msg, message)
+            writer = _log_writer
+            if writer is not None:
+                writer.write(msg + " " + str(message) + "\n", code)
 
-    def critical(self, *message):
-        self.__log("critical", *message)
+    def critical(self, message, *args):
+        if _log_min <= CRITICAL:
+            self.__log("critical", CRITICAL, message, args)
 
-    def error(self, *message):
-        self.__log("error", *message)
+    def error(self, message, *args):
+        if _log_min <= ERROR:
+            self.__log("error", ERROR, message, args)
 
-    def warn(self, *message):
-        self.__log("warn", *message)
+    def warn(self, message, *args):
+        if _log_min <= WARN:
+            self.__log("warn", WARN, message, args)
 
-    def info(self, *message):
-        self.__log("info", *message)
+    def info(self, message, *args):
+        if _log_min <= INFO:
+            self.__log("info", INFO, message, args)
 
-    def debug(self, *message):
-        self.__log("debug", *message)
+    def debug(self, message, *args):
+        if _log_min <= DEBUG:
+            self.__log("debug", DEBUG, message, args)
 
 
 def getLogger(name):
@@ -115,6 +357,20 @@ def getLogger(name):
     return _log_dict[name]
 
 
+def _restart_writer():
+    """Replace the LogWriter after the log file or its settings have changed."""
+    global _log_writer
+    with _LOG_LOCK:
+        writer = _log_writer
+        _log_writer = None
+    if writer is not None:
+        writer.stop()
+    if _log_save:
+        writer = LogWriter(_log_file, _log_size, _log_back, _log_buffer, _log_interval, _log_flush_level)
+        writer.start()
+        _log_writer = writer
+
+
 def setLogFile(path, name):
     global _log_path, _log_name, _log_file
     if not path.endswith("/"):
@@ -122,6 +378,8 @@ def setLogFile(path, name):
     _log_path = path
     _log_name = name
     _log_file = _log_path + _log_name
+    if _log_writer is not None:
+        _restart_writer()
     return 0
 
 
@@ -137,6 +395,7 @@ def setSaveLog(save, size=None, backups=None):
         if not isinstance(backups, int):
             return (3, "backups is not int.")
         _log_back = backups
+    _restart_writer()
     return (0, "success.")
 
 
@@ -144,12 +403,37 @@ def getSaveLog():
     return _log_save
 
 
+def setLogBuffer(size, interval, level="error"):
+    """
+    Set the bytes of log lines buffered in RAM, the seconds between writes
+    of the log file and the level whose lines are written at once.
+    """
+    global _log_buffer, _log_interval, _log_flush_level
+    level = level.lower()
+    if level not in _LOG_LEVEL_CODE.keys():
+        return False
+    _log_buffer = size
+    _log_interval = interval
+    _log_flush_level = _LOG_LEVEL_CODE[level]
+    if _log_writer is not None:
+        _restart_writer()
+    return True
+
+
+def flushLog():
+    """Write the log lines buffered to the log file now, e.g. before a reset."""
+    writer = _log_writer
+    if writer is not None:
+        writer.flush()
+
+
 def setLogLevel(level):
     global _log_level
     level = level.lower()
     if level not in _LOG_LEVEL_CODE.keys():
         return False
     _log_level = level
+    _update_level()
     return True
 
 
@@ -161,6 +445,7 @@ def setLogDebug(debug):
     global _log_debug
     if isinstance(debug, bool):
         _log_debug = debug
+        _update_level()
         return True
     return False
 
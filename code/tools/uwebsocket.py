@@ -22,13 +22,20 @@
 """
 
 import log
+import utime
+import osTimer
+import _thread
 import ure as re
 import usocket as socket
 import urandom as random
 import ustruct as struct
+import uhashlib as hashlib
 import ubinascii as binascii
 from ucollections import namedtuple
 
+from usr.tools import wsdeflate
+from usr.tools.wsmask import mask as apply_mask
+
 LOGGER = log.getLogger(__name__)
 
 # Opcodes
@@ -50,6 +57,28 @@ CLOSE_TOO_BIG = 1009
 CLOSE_MISSING_EXTN = 1010
 CLOSE_BAD_CONDITION = 1011
 
+# Payloads up to this size are read into a buffer kept by the connection,
+# larger ones into a buffer of their own, which is released afterwards.
+RECV_BUF_SIZE = 0x800
+
+# The same for frames written, the payload is put after HEADER_ROOM bytes
+# reserved for the frame header.
+SEND_BUF_SIZE = 0x800
+HEADER_ROOM = 16
+
+# Default limit of a received message, fragmented messages included.
+MAX_MESSAGE_SIZE = 0x10000
+
+# Largest head of a handshake response read.
+MAX_RESPONSE_SIZE = 0x1000
+
+# Appended to Sec-WebSocket-Key to compute Sec-WebSocket-Accept.
+GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+# Seconds a resolved address is used before it's resolved again. An expired
+# one is still used when the resolution fails.
+DNS_TTL = 300
+
 URL_RE = re.compile(r'(wss|ws)://([A-Za-z0-9-\.]+)(?:\:([0-9]+))?(/.+)?')
 URI = namedtuple('URI', ('protocol', 'hostname', 'port', 'path'))
 
@@ -75,6 +104,64 @@ def urlparse(uri):
         return URI(protocol, host, int(port), path)
 
 
+# (hostname, port): [addresses, utime.time() of the resolution]. Seconds of
+# the RTC rather than ticks, which wrap after 12 days and would make an old
+# entry look fresh.
+_DNS_CACHE = {}
+
+
+def resolve(hostname, port, ttl=DNS_TTL):
+    """
+    Return the addresses of `hostname`, cached for `ttl` seconds. The
+    address which could be connected to last is first.
+    """
+    key = (hostname, port)
+    entry = _DNS_CACHE.get(key)
+    # The RTC set back makes the age negative, resolved again then.
+    if entry is not None and 0 <= utime.time() - entry[1] < ttl:
+        return entry[0]
+    try:
+        addresses = []
+        for info in socket.getaddrinfo(hostname, port):
+            if info[4] not in addresses:
+                addresses.append(info[4])
+    except OSError:
+        if entry is None:
+            raise
+        LOGGER.info("Resolving %s failed, using the expired addresses", hostname)
+        return entry[0]
+    _DNS_CACHE[key] = [addresses, utime.time()]
+    return addresses
+
+
+def forget(hostname, port):
+    """Drop the cached addresses of a host."""
+    _DNS_CACHE.pop((hostname, port), None)
+
+
+def _connect(hostname, port, addresses):
+    """
+    Connect to the first address which accepts the connection, it's moved
+    to the front of the cached addresses.
+    """
+    error = None
+    for addr in addresses:
+        sock = socket.socket()
+        try:
+            sock.connect(addr)
+        except OSError as e:
+            sock.close()
+            error = e
+            continue
+        if addr is not addresses[0]:
+            addresses.remove(addr)
+            addresses.insert(0, addr)
+        return sock
+    # None of them answers, maybe the host has moved.
+    forget(hostname, port)
+    raise error or OSError('no address for %s' % hostname)
+
+
 class NoDataException(Exception):
     pass
 
@@ -83,6 +170,115 @@ class ConnectionClosed(Exception):
     pass
 
 
+class HandshakeError(Exception):
+    """The server didn't upgrade the connection as requested."""
+    pass
+
+
+def parse_response(head):
+    """
+    Parse the head of an HTTP response, without the empty line ending it.
+    Return its status code and a dict of its headers, with lower case names.
+    The values of repeated headers are joined with commas.
+    """
+    lines = bytes(head).decode().split('\r\n')
+    status = lines[0].split(' ', 2)
+    if len(status) < 2 or not status[0].startswith('HTTP/') or not status[1].isdigit():
+        raise HandshakeError('not an HTTP response: %s' % lines[0])
+    headers = {}
+    for line in lines[1:]:
+        i = line.find(':')
+        if i <= 0:
+            raise HandshakeError('bad header: %s' % line)
+        name = line[:i].strip().lower()
+        value = line[i + 1:].strip()
+        headers[name] = headers[name] + ', ' + value if name in headers else value
+    return int(status[1]), headers
+
+
+def parse_extensions(value):
+    """
+    Parse a Sec-WebSocket-Extensions value into a list of (name, params),
+    params being a list of (name, value), value None for a bare parameter.
+    """
+    extensions = []
+    for extension in value.split(','):
+        params = [p.strip() for p in extension.split(';')]
+        if not params[0]:
+            continue
+        parsed = []
+        for param in params[1:]:
+            i = param.find('=')
+            if i < 0:
+                parsed.append((param, None))
+            else:
+                parsed.append((param[:i].strip(), param[i + 1:].strip().strip('"')))
+        extensions.append((params[0], parsed))
+    return extensions
+
+
+def accept_key(key):
+    """
+    Return the Sec-WebSocket-Accept of the Sec-WebSocket-Key `key` (bytes),
+    None when the firmware has no SHA-1.
+    """
+    if not hasattr(hashlib, 'sha1'):
+        return None
+    return binascii.b2a_base64(hashlib.sha1(key + GUID).digest())[:-1].decode()
+
+
+def _read_response(sock):
+    """
+    Read the head of the handshake response into one buffer. Return it
+    without the empty line ending it, and the bytes read after it.
+    """
+    # recv() returns what has arrived so far, read() would wait for as many
+    # bytes as asked. Sockets without recv() are read line by line.
+    recv = getattr(sock, 'recv', None)
+    buf = b''
+    pos = 0
+    while True:
+        end = buf.find(b'\r\n\r\n', pos)
+        if end >= 0:
+            return buf[:end], buf[end + 4:]
+        if len(buf) > MAX_RESPONSE_SIZE:
+            raise HandshakeError('response too long')
+        pos = max(0, len(buf) - 3)
+        data = recv(0x200) if recv is not None else sock.readline()
+        if not data:
+            raise HandshakeError('connection closed')
+        buf += data
+
+
+class _ReadAhead(object):
+    """
+    Socket with bytes read after the handshake response, e.g. a message the
+    server sent at once, which are returned first.
+    """
+
+    def __init__(self, sock, data):
+        self.sock = sock
+        self.data = data
+
+    def read(self, n):
+        data = self.data[:n]
+        self.data = self.data[n:]
+        if len(data) < n:
+            data += self.sock.read(n - len(data))
+        return data
+
+    def readinto(self, buf):
+        n = min(len(buf), len(self.data))
+        buf[:n] = self.data[:n]
+        self.data = self.data[n:]
+        if n < len(buf):
+            n += self.sock.readinto(memoryview(buf)[n:]) or 0
+        return n
+
+    def __getattr__(self, name):
+        return getattr(self.sock, name)
+
+
 class Websocket(object):
     """
     Basis of the Websocket protocol.
@@ -92,10 +288,69 @@ class Websocket(object):
     """
     is_client = False
 
-    def __init__(self, sock, debug=False):
+    def __init__(self, sock, debug=False, max_size=MAX_MESSAGE_SIZE, fragment_size=None, deflate=None):
+        """
+        :param sock: connected socket
+        :param debug: allow output log
+        :param max_size: largest message accepted, larger messages close the
+            connection with CLOSE_TOO_BIG
+        :param fragment_size: when set, messages sent are split into frames
+            of at most this many characters (str) or bytes (bytes)
+        :param deflate: negotiated wsdeflate.PerMessageDeflate, or None
+        """
         self.sock = sock
         self.open = True
         self.debug = debug
+        self.max_size = max_size
+        self.fragment_size = fragment_size
+        self.deflate = deflate
+        # Without a compressor messages are sent uncompressed, which
+        # permessage-deflate allows.
+        self._compress = deflate is not None and wsdeflate.can_compress()
+        self._recv_buf = None
+        self._send_buf = None
+        # Frames are written by the sender, by recv() answering PINGs and by
+        # the keepalive timer, the send buffer is used by one at a time.
+        self._write_lock = _thread.allocate_lock()
+        # Held by send() over all the frames of a message, so the frames of
+        # messages sent by several threads don't interleave. Control frames
+        # only take _write_lock, they may go between the fragments.
+        self._send_lock = _thread.allocate_lock()
+
+        # RSV1 of the last frame read, set on compressed messages.
+        self._rsv1 = False
+
+        # Reassembly of a fragmented message: opcode and RSV1 of its first
+        # frame, buffer and number of bytes received so far.
+        self._msg_opcode = None
+        self._msg_compressed = False
+        self._msg_buf = None
+        self._msg_len = 0
+
+        # Number of frames and of socket writes, writes / frames_sent is the
+        # number of writes per frame.
+        self.frames_sent = 0
+        self.writes = 0
+
+        # Milliseconds of the phases of Client.connect(): dns, tcp, tls and
+        # upgrade.
+        self.timings = None
+
+        # Subprotocol and names of the extensions negotiated in the handshake.
+        self.subprotocol = None
+        self.extensions = []
+
+        # Keepalive, see keepalive(). Ticks of the last frame received and of
+        # the PING not answered yet, RTT of the last PONG in milliseconds.
+        self.ping_interval = 0
+        self.on_dead = None
+        self.pings = 0
+        self.rtt_ms = None
+        self._ping_timer = None
+        self._ping_sent = None
+        self._ping_payload = None
+        self._ping_writing = False
+        self._last_recv = utime.ticks_ms()
 
     def __enter__(self):
         return self
@@ -118,10 +373,12 @@ class Websocket(object):
         if not two_bytes:
             raise NoDataException
 
+        self._last_recv = utime.ticks_ms()
         byte1, byte2 = struct.unpack('!BB', two_bytes)
 
         # Byte 1: FIN(1) _(1) _(1) _(1) OPCODE(4)
         fin = bool(byte1 & 0x80)
+        self._rsv1 = bool(byte1 & 0x40)
         opcode = byte1 & 0x0f
 
         # Byte 2: MASK(1) LENGTH(7)
@@ -136,8 +393,14 @@ class Websocket(object):
         if mask:  # Mask is 4 bytes
             mask_bits = self.sock.read(4)
 
+        if length > self.max_size:
+            if self.debug:
+                LOGGER.info("Frame of length %s too big. Closing", length)
+            self.close(code=CLOSE_TOO_BIG)
+            return True, OP_CLOSE, None
+
         try:
-            data = self.sock.read(length)
+            data = self._read_payload(length)
         except MemoryError:
             # We can't receive this many bytes, close the socket
             if self.debug:
@@ -146,17 +409,35 @@ class Websocket(object):
             return True, OP_CLOSE, None
 
         if mask:
-            data = bytes(b ^ mask_bits[i % 4]
-                         for i, b in enumerate(data))
+            apply_mask(data, mask_bits)
 
         return fin, opcode, data
 
-    def write_frame(self, opcode, data=b''):
+    def _read_payload(self, length):
+        """
+        Read the payload into a mutable buffer, so it can be unmasked in
+        place. The returned buffer is only valid until the next frame is read.
+        """
+        if length == 0:
+            return b''
+        if length <= RECV_BUF_SIZE:
+            if self._recv_buf is None:
+                self._recv_buf = bytearray(RECV_BUF_SIZE)
+            data = memoryview(self._recv_buf)[:length]
+        else:
+            data = bytearray(length)
+        if self.sock.readinto(data) != length:
+            raise NoDataException
+        return data
+
+    def write_frame(self, opcode, data=b'', fin=True, rsv1=False):
         """
         Write a frame to the socket.
         See https://tools.ietf.org/html/rfc6455#section-5.2 for the details.
+
+        Header, mask and payload are put in one buffer and written with a
+        single call, so a frame doesn't end up in several TCP segments.
         """
-        fin = True
         mask = self.is_client  # messages sent by client are masked
 
         length = len(data)
@@ -165,44 +446,75 @@ class Websocket(object):
         # Byte 1: FIN(1) _(1) _(1) _(1) OPCODE(4)
         byte1 = 0x80 if fin else 0
         byte1 |= opcode
+        if rsv1:
+            byte1 |= 0x40
 
         # Byte 2: MASK(1) LENGTH(7)
         byte2 = 0x80 if mask else 0
 
         if length < 126:  # 126 is magic value to use 2-byte length header
-            byte2 |= length
-            self.sock.write(struct.pack('!BB', byte1, byte2))
-
+            size = 2
         elif length < (1 << 16):  # Length fits in 2-bytes
-            byte2 |= 126  # Magic code
-            self.sock.write(struct.pack('!BBH', byte1, byte2, length))
-
+            size = 4
         elif length < (1 << 64):
-            byte2 |= 127  # Magic code
-            self.sock.write(struct.pack('!BBQ', byte1, byte2, length))
-
+            size = 10
         else:
             raise ValueError()
 
         if mask:  # Mask is 4 bytes
-            mask_bits = struct.pack('!I', random.getrandbits(32))
-            self.sock.write(mask_bits)
+            size += 4
+
+        # The header is put right before the payload, which starts at the
+        # word aligned offset HEADER_ROOM.
+        with self._write_lock:
+            buf = self._frame_buf(length)
+            start = HEADER_ROOM - size
+            if length < 126:
+                struct.pack_into('!BB', buf, start, byte1, byte2 | length)
+            elif length < (1 << 16):
+                struct.pack_into('!BBH', buf, start, byte1, byte2 | 126, length)
+            else:
+                struct.pack_into('!BBQ', buf, start, byte1, byte2 | 127, length)
+
+            frame = memoryview(buf)
+            payload = frame[HEADER_ROOM:HEADER_ROOM + length]
+            payload[:] = data
 
-            data = bytes(b ^ mask_bits[i % 4]
-                         for i, b in enumerate(data))
+            if mask:
+                mask_bits = struct.pack('!I', random.getrandbits(32))
+                buf[HEADER_ROOM - 4:HEADER_ROOM] = mask_bits
+                apply_mask(payload, mask_bits)
 
-        self.sock.write(data)
+            self.sock.write(frame[start:HEADER_ROOM + length])
+            self.frames_sent += 1
+            self.writes += 1
 
-    def recv(self):
+    def _frame_buf(self, length):
+        """
+        Return a buffer for a frame with a payload of `length` bytes. Small
+        frames reuse the buffer kept by the connection.
+        """
+        if length <= SEND_BUF_SIZE:
+            if self._send_buf is None:
+                self._send_buf = bytearray(HEADER_ROOM + SEND_BUF_SIZE)
+            return self._send_buf
+        return bytearray(HEADER_ROOM + length)
+
+    def recv(self, decode=True):
         """
         Receive data from the websocket.
 
+        With `decode` False the message is returned as the buffer it was
+        received in, without copying or decoding it. The buffer is only valid
+        until the next call of recv().
+
         This is slightly different from 'websockets' in that it doesn't
         fire off a routine to process frames and put the data in a queue.
         If you don't call recv() sufficiently often you won't process control
         frames.
         """
-        assert self.open
+        if not self.open:
+            raise ConnectionClosed()
 
         while self.open:
             try:
@@ -217,18 +529,40 @@ class Websocket(object):
                 self._close()
                 raise ConnectionClosed()
 
-            if not fin:
-                raise NotImplementedError()
-
-            if opcode == OP_TEXT:
-                return data.decode('utf-8')
-            elif opcode == OP_BYTES:
-                return data
+            if opcode == OP_TEXT or opcode == OP_BYTES:
+                if self._msg_opcode is not None:
+                    # A new message before the fragmented one has finished.
+                    self.close(code=CLOSE_PROTOCOL_ERROR)
+                    return
+                if fin:
+                    return self._message(opcode, data, self._rsv1, decode)
+                self._msg_opcode = opcode
+                self._msg_compressed = self._rsv1
+                self._msg_len = 0
+                if not self._append(data):
+                    return
+                continue
+            elif opcode == OP_CONT:
+                # This is a continuation of a previous frame
+                if self._msg_opcode is None:
+                    self.close(code=CLOSE_PROTOCOL_ERROR)
+                    return
+                if not self._append(data):
+                    return
+                if not fin:
+                    continue
+                opcode = self._msg_opcode
+                message = self._message(opcode, memoryview(self._msg_buf)[:self._msg_len], self._msg_compressed, decode)
+                self._msg_opcode = None
+                if len(self._msg_buf) > RECV_BUF_SIZE:
+                    self._msg_buf = None
+                return message
             elif opcode == OP_CLOSE:
                 self._close()
                 return
             elif opcode == OP_PONG:
-                # Ignore this frame, keep waiting for a data frame
+                # Keep waiting for a data frame
+                self._pong(data)
                 continue
             elif opcode == OP_PING:
                 # We need to send a pong frame
@@ -237,26 +571,164 @@ class Websocket(object):
                 self.write_frame(OP_PONG, data)
                 # And then wait to receive
                 continue
-            elif opcode == OP_CONT:
-                # This is a continuation of a previous frame
-                raise NotImplementedError(opcode)
             else:
                 raise ValueError(opcode)
 
+    def _message(self, opcode, data, compressed=False, decode=True):
+        if compressed:
+            if self.deflate is None:
+                self.close(code=CLOSE_PROTOCOL_ERROR)
+                return
+            try:
+                data = self.deflate.decompress(data, self.max_size)
+            except ValueError:
+                self.close(code=CLOSE_TOO_BIG)
+                return
+            except Exception as e:
+                if self.debug:
+                    LOGGER.info("Failed to decompress message: %s", e)
+                self.close(code=CLOSE_BAD_DATA)
+                return
+        if not decode:
+            return data
+        if opcode == OP_TEXT:
+            return str(data, 'utf-8')
+        return bytes(data)
+
+    def _append(self, data):
+        """
+        Append a fragment to the message being reassembled. The buffer grows
+        by doubling. Return False when the message is too big, the connection
+        is closed then.
+        """
+        length = self._msg_len + len(data)
+        if length > self.max_size:
+            if self.debug:
+                LOGGER.info("Message of length %s too big. Closing", length)
+            self._msg_opcode = None
+            self._msg_buf = None
+            self.close(code=CLOSE_TOO_BIG)
+            return False
+        if self._msg_buf is None or len(self._msg_buf) < length:
+            size = max(length, RECV_BUF_SIZE)
+            if self._msg_buf is not None:
+                size = min(max(size, len(self._msg_buf) * 2), self.max_size)
+            buf = bytearray(size)
+            if self._msg_len:
+                buf[:self._msg_len] = memoryview(self._msg_buf)[:self._msg_len]
+            self._msg_buf = buf
+        self._msg_buf[self._msg_len:length] = data
+        self._msg_len = length
+        return True
+
     def send(self, buf):
-        """Send data to the websocket."""
+        """
+        Send data to the websocket.
+
+        With `fragment_size` set, larger messages are sent as several frames
+        and a str is encoded one fragment at a time, so the whole message is
+        never encoded at once. Messages sent by several threads go out one
+        after the other, compressed in the order they are sent.
+        """
 
-        assert self.open
+        if not self.open:
+            raise ConnectionClosed()
 
         if isinstance(buf, str):
             opcode = OP_TEXT
-            buf = buf.encode('utf-8')
         elif isinstance(buf, bytes):
             opcode = OP_BYTES
         else:
             raise TypeError()
 
-        self.write_frame(opcode, buf)
+        with self._send_lock:
+            compressed = self._compress
+            if compressed:
+                if opcode == OP_TEXT:
+                    buf = buf.encode('utf-8')
+                buf = self.deflate.compress(buf)
+
+            size = self.fragment_size
+            if not size or len(buf) <= size:
+                self.write_frame(opcode, buf.encode('utf-8') if isinstance(buf, str) else buf, rsv1=compressed)
+                return
+
+            for start in range(0, len(buf), size):
+                data = buf[start:start + size]
+                if isinstance(data, str):
+                    data = data.encode('utf-8')
+                self.write_frame(opcode if start == 0 else OP_CONT, data, fin=start + size >= len(buf),
+                                 rsv1=compressed and start == 0)
+
+    def keepalive(self, interval, on_dead=None):
+        """
+        Ping the peer when no frame has been received for about `interval`
+        seconds, 0 stops the pings. Idle connections are kept open through
+        NATs that way, and a peer which sends nothing for a whole interval
+        after a PING is taken for dead: `on_dead` is called from the timer or
+        from the thread writing the PING, abort() by default, which makes a
+        blocked recv() fail.
+
+        A single periodic osTimer does all this. Its callback doesn't wait
+        for the socket, the PINGs are written by a thread started for each,
+        and a PING still being written on the next tick is taken for a dead
+        peer as well. `rtt_ms` is the round trip time of the last PONG.
+        """
+        self.ping_interval = interval
+        self.on_dead = on_dead
+        self._ping_sent = None
+        if self._ping_timer is None:
+            if not interval:
+                return
+            self._ping_timer = osTimer()
+        self._ping_timer.stop()
+        if interval and self.open:
+            self._last_recv = utime.ticks_ms()
+            self._ping_timer.start(int(interval * 1000), 1, self._keepalive)
+
+    def _keepalive(self, args):
+        if not self.open:
+            self._ping_timer.stop()
+            return
+        now = utime.ticks_ms()
+        if self._ping_sent is not None and utime.ticks_diff(self._last_recv, self._ping_sent) < 0:
+            # Nothing received since the PING of the previous tick.
+            self._dead()
+            return
+        # Frames received in the last half interval prove the peer alive.
+        if utime.ticks_diff(now, self._last_recv) < self.ping_interval * 500:
+            return
+        if self._ping_writing:
+            # The last PING hasn't gone out in a whole interval.
+            self._dead()
+            return
+        self.pings += 1
+        self._ping_payload = struct.pack('!I', self.pings)
+        self._ping_sent = now
+        self._ping_writing = True
+        _thread.start_new_thread(self._ping, (self._ping_payload,))
+
+    def _ping(self, payload):
+        try:
+            self.write_frame(OP_PING, payload)
+        except Exception as e:
+            if self.debug:
+                LOGGER.info("Failed to send PING: %s", e)
+            if self.open:
+                self._dead()
+        finally:
+            self._ping_writing = False
+
+    def _pong(self, data):
+        if self._ping_sent is not None and bytes(data) == self._ping_payload:
+            self.rtt_ms = utime.ticks_diff(utime.ticks_ms(), self._ping_sent)
+            self._ping_sent = None
+
+    def _dead(self):
+        if self.debug:
+            LOGGER.info("PING not answered. Peer dead.")
+        self._ping_timer.stop()
+        (self.on_dead or self.abort)()
 
     def close(self, code=CLOSE_OK, reason=''):
         """Close the websocket."""
@@ -268,10 +740,19 @@ class Websocket(object):
         self.write_frame(OP_CLOSE, buf)
         self._close()
 
+    def abort(self):
+        """
+        Close the socket without the closing handshake, e.g. when the peer
+        doesn't answer anymore. A recv() blocked in another thread fails.
+        """
+        self._close()
+
     def _close(self):
         if self.debug:
             LOGGER.info("Connection closed")
         self.open = False
+        if self._ping_timer is not None:
+            self._ping_timer.stop()
         self.sock.close()
 
 
@@ -282,13 +763,18 @@ class WebsocketClient(Websocket):
 class Client(object):
 
     @staticmethod
-    def connect(uri, headers=None, debug=False):
+    def connect(uri, headers=None, debug=False, max_size=MAX_MESSAGE_SIZE, fragment_size=None, deflate=None):
         """
         Connect a websocket.
         :param uri: example ws://172.16.185.123/
         :param headers: k, v of header
         :param debug: allow output log
-        :return:
+        :param max_size: largest message accepted
+        :param fragment_size: split messages sent into frames of this size
+        :param deflate: wsdeflate.PerMessageDeflate to offer permessage-deflate
+        :return: WebsocketClient, HandshakeError is raised when the server
+            doesn't upgrade the connection or answers with a wrong
+            Sec-WebSocket-Accept, a subprotocol or extension not offered
         """
         if not headers:
             headers = dict()
@@ -301,43 +787,96 @@ class Client(object):
         if debug:
             LOGGER.info("open connection %s:%s", uri.hostname, uri.port)
 
-        sock = socket.socket()
-        addr = socket.getaddrinfo(uri.hostname, uri.port)
-        sock.connect(addr[0][4])
+        timings = {}
+        start = utime.ticks_ms()
+        addresses = resolve(uri.hostname, uri.port)
+        timings['dns'] = utime.ticks_diff(utime.ticks_ms(), start)
+
+        start = utime.ticks_ms()
+        sock = _connect(uri.hostname, uri.port, addresses)
+        timings['tcp'] = utime.ticks_diff(utime.ticks_ms(), start)
 
         if uri.protocol == 'wss':
+            # ussl has no sessions to resume, every connection does a full
+            # TLS handshake.
             import ussl
-            sock = ussl.wrap_socket(sock)
-
-        def send_header(header, *args):
-            if debug:
-                LOGGER.info(str(header), *args)
-            sock.write(header % args + '\r\n')
+            start = utime.ticks_ms()
+            try:
+                sock = ussl.wrap_socket(sock)
+            except Exception:
+                sock.close()
+                raise
+            timings['tls'] = utime.ticks_diff(utime.ticks_ms(), start)
 
+        start = utime.ticks_ms()
         # Sec-WebSocket-Key is 16 bytes of random base64 encoded
         key = binascii.b2a_base64(bytes(random.getrandbits(8) for _ in range(16)))[:-1]
-        send_header(b'GET %s HTTP/1.1', uri.path or '/')
-        send_header(b'Host: %s:%s', uri.hostname, uri.port)
-        send_header(b'Connection: Upgrade')
-        send_header(b'Upgrade: websocket')
-        send_header(b'Sec-WebSocket-Key: %s', key)
-        send_header(b'Sec-WebSocket-Version: 13')
-        send_header(b'Origin: http://{hostname}:{port}'.format(
-            hostname=uri.hostname,
-            port=uri.port)
-        )
+        # The request is written as one block.
+        lines = [
+            'GET %s HTTP/1.1' % (uri.path or '/'),
+            'Host: %s:%s' % (uri.hostname, uri.port),
+            'Connection: Upgrade',
+            'Upgrade: websocket',
+            'Sec-WebSocket-Key: %s' % key.decode(),
+            'Sec-WebSocket-Version: 13',
+            'Origin: http://{hostname}:{port}'.format(hostname=uri.hostname, port=uri.port),
+        ]
+        if deflate is not None:
+            lines.append('Sec-WebSocket-Extensions: %s' % deflate.offer())
+        protocols = []
         for k, v in headers.items():
-            send_header('{}:{}'.format(k, v).encode())
-        send_header(b'')
-
-        header = sock.readline()[:-2]
-        assert header.startswith(b'HTTP/1.1 101 '), header
+            lines.append('{}:{}'.format(k, v))
+            if k.strip().lower() == 'sec-websocket-protocol':
+                protocols = [p.strip() for p in v.split(',')]
+        request = '\r\n'.join(lines) + '\r\n\r\n'
+        if debug:
+            LOGGER.info(request)
 
-        # We don't (currently) need these headers
-        # FIXME: should we check the return key?
-        while header:
+        try:
+            sock.write(request.encode())
+            head, rest = _read_response(sock)
             if debug:
-                LOGGER.info(str(header))
-            header = sock.readline()[:-2]
+                LOGGER.info(bytes(head).decode())
+            status, response = parse_response(head)
+            subprotocol, extensions, deflate = Client._check(status, response, key, protocols, deflate)
+        except Exception:
+            sock.close()
+            raise
+        timings['upgrade'] = utime.ticks_diff(utime.ticks_ms(), start)
+
+        ws = WebsocketClient(_ReadAhead(sock, rest) if rest else sock, debug, max_size, fragment_size, deflate)
+        ws.subprotocol = subprotocol
+        ws.extensions = extensions
+        ws.timings = timings
+        if debug:
+            LOGGER.info("Connected in %s ms", timings)
+        return ws
 
-        return WebsocketClient(sock, debug)
+    @staticmethod
+    def _check(status, headers, key, protocols, deflate):
+        """
+        Validate the handshake response, see RFC 6455 section 4.1. Return the
+        subprotocol, the names of the extensions and `deflate` if accepted.
+        """
+        if status != 101:
+            raise HandshakeError('status %d' % status)
+        if (headers.get('upgrade', '').lower() != 'websocket' or
+                'upgrade' not in headers.get('connection', '').lower()):
+            raise HandshakeError('connection not upgraded to websocket')
+        expected = accept_key(key)
+        if expected is not None and headers.get('sec-websocket-accept') != expected:
+            raise HandshakeError('wrong Sec-WebSocket-Accept')
+
+        subprotocol = headers.get('sec-websocket-protocol')
+        if subprotocol is not None and subprotocol not in protocols:
+            raise HandshakeError('subprotocol %s not offered' % subprotocol)
+
+        extensions = parse_extensions(headers.get('sec-websocket-extensions', ''))
+        for name, params in extensions:
+            # The server uses what it accepts at once, so an extension which
+            # can't be used fails the connection.
+            if name != wsdeflate.EXTENSION or deflate is None or len(extensions) > 1 or not deflate.accept(params):
+                raise HandshakeError('extension %s not supported' % name)
+        if not extensions:
+            deflate = None
+        return subprotocol, [name for name, _ in extensions], deflate
@@ -0,0 +1,179 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : wsdeflate.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : permessage-deflate WebSocket extension (RFC 7692).
+@version   : v1.0.0
+@date      : 2024-05-15 10:32:08
+@copyright : Copyright (c) 2024
+"""
+
+try:
+    import zlib
+    # MicroPython's zlib can only decompress whole streams.
+    if not hasattr(zlib, 'compressobj'):
+        zlib = None
+except ImportError:
+    zlib = None
+
+try:
+    import io
+    import deflate
+except ImportError:
+    deflate = None
+
+try:
+    import uzlib
+except ImportError:
+    uzlib = None
+
+EXTENSION = 'permessage-deflate'
+
+# Removed from the end of a compressed message by the sender and added back by
+# the receiver, see RFC 7692 section 7.2.
+_TAIL = b'\x00\x00\xff\xff'
+# An empty final block, ends the deflate stream for decompressors which need
+# one to finish.
+_FINAL = b'\x03\x00'
+
+
+def can_compress():
+    return zlib is not None or (deflate is not None and hasattr(deflate.DeflateIO, 'write'))
+
+
+def can_decompress():
+    return zlib is not None or deflate is not None or uzlib is not None
+
+
+class PerMessageDeflate(object):
+    """
+    Compression of the messages of a WebSocket connection.
+
+    Context takeover keeps the compression state from one message to the
+    next, which compresses repetitive traffic better but keeps a window of
+    2 ** window bits bytes per direction in RAM. Only CPython (zlib) supports
+    it, on QuecPython both directions are negotiated without it.
+
+    :param client_max_window_bits: window of the messages we send, 9 - 15
+    :param server_max_window_bits: window of the messages we receive, 9 - 15
+    :param client_no_context_takeover: don't keep context for messages sent
+    :param server_no_context_takeover: don't keep context for messages received
+    :param level: compression level
+    """
+
+    def __init__(self, client_max_window_bits=15, server_max_window_bits=15,
+                 client_no_context_takeover=False, server_no_context_takeover=False, level=6):
+        if zlib is None:
+            client_no_context_takeover = True
+            server_no_context_takeover = True
+        self.client_max_window_bits = max(9, min(15, client_max_window_bits))
+        self.server_max_window_bits = max(9, min(15, server_max_window_bits))
+        self.client_no_context_takeover = client_no_context_takeover
+        self.server_no_context_takeover = server_no_context_takeover
+        self.level = level
+        self._compressor = None
+        self._decompressor = None
+
+        # Bytes before and after compression of the messages sent and
+        # received, for statistics.
+        self.raw_sent = 0
+        self.wire_sent = 0
+        self.raw_received = 0
+        self.wire_received = 0
+
+    def offer(self):
+        """Return the value of the Sec-WebSocket-Extensions request header."""
+        params = [EXTENSION]
+        if self.client_no_context_takeover:
+            params.append('client_no_context_takeover')
+        if self.server_no_context_takeover:
+            params.append('server_no_context_takeover')
+        params.append('client_max_window_bits' if self.client_max_window_bits == 15 else
+                      'client_max_window_bits=%d' % self.client_max_window_bits)
+        if self.server_max_window_bits != 15:
+            params.append('server_max_window_bits=%d' % self.server_max_window_bits)
+        return '; '.join(params)
+
+    def accept(self, params):
+        """
+        Apply the parameters the server accepted the extension with, a list
+        of (name, value) of uwebsocket.parse_extensions(). Return False when
+        they can't be supported.
+        """
+        for name, value in params:
+            if name == 'server_no_context_takeover':
+                self.server_no_context_takeover = True
+            elif name == 'client_no_context_takeover':
+                self.client_no_context_takeover = True
+            elif name in ('server_max_window_bits', 'client_max_window_bits'):
+                try:
+                    bits = int(value)
+                except (TypeError, ValueError):
+                    return False
+                if not 8 <= bits <= 15:
+                    return False
+                if name == 'server_max_window_bits':
+                    # A larger window decompresses the stream as well.
+                    self.server_max_window_bits = max(9, bits)
+                elif bits < 9:
+                    # zlib can't produce a stream for a window of 8 bits.
+                    return False
+                else:
+                    self.client_max_window_bits = bits
+            else:
+                return False
+        if zlib is None and not self.server_no_context_takeover:
+            return False
+        return True
+
+    def compress(self, data):
+        """Compress the payload of a message to be sent."""
+        if zlib is not None:
+            if self._compressor is None or self.client_no_context_takeover:
+                self._compressor = zlib.compressobj(self.level, zlib.DEFLATED, -self.client_max_window_bits)
+            out = self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        else:
+            stream = io.BytesIO()
+            writer = deflate.DeflateIO(stream, deflate.RAW, self.client_max_window_bits)
+            writer.write(data)
+            writer.close()
+            out = stream.getvalue()
+        if out.endswith(_TAIL):
+            out = out[:-4]
+        self.raw_sent += len(data)
+        self.wire_sent += len(out)
+        return out
+
+    def decompress(self, data, max_size):
+        """
+        Decompress the payload of a message received. Raise ValueError when
+        it is larger than `max_size` decompressed.
+        """
+        wire = len(data)
+        if zlib is not None:
+            if self._decompressor is None or self.server_no_context_takeover:
+                self._decompressor = zlib.decompressobj(-self.server_max_window_bits)
+            out = self._decompressor.decompress(bytes(data) + _TAIL, max_size + 1)
+        elif deflate is not None:
+            stream = io.BytesIO(bytes(data) + _TAIL + _FINAL)
+            out = deflate.DeflateIO(stream, deflate.RAW, self.server_max_window_bits).read(max_size + 1)
+        else:
+            out = uzlib.decompress(bytes(data) + _TAIL + _FINAL, -self.server_max_window_bits)
+        if len(out) > max_size:
+            raise ValueError('message too big')
+        self.raw_received += len(out)
+        self.wire_received += wire
+        return out
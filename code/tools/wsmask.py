@@ -0,0 +1,54 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : wsmask.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : In place masking of WebSocket frame payloads.
+@version   : v1.0.0
+@date      : 2024-05-13 14:05:37
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+
+
+def mask_bytes(buf, key):
+    """XOR `buf` in place with the 4 bytes `key`, without allocating."""
+    for i in range(len(buf)):
+        buf[i] ^= key[i & 3]
+
+
+def mask_int(buf, key):
+    """
+    XOR `buf` in place with the 4 bytes `key` as one big integer. Needs
+    arbitrary precision integers, it is the fastest pure Python way on CPython.
+    """
+    length = len(buf)
+    if not length:
+        return
+    words = (length + 3) >> 2
+    k = int.from_bytes(key * words, "little") & ((1 << (length << 3)) - 1)
+    buf[:] = (int.from_bytes(buf, "little") ^ k).to_bytes(length, "little")
+
+
+# The viper version lives in its own module, builds without the native
+# emitter fail to compile it.
+try:
+    from usr.tools.wsmask_viper import mask
+except Exception:
+    if sys.implementation.name == "micropython":
+        mask = mask_bytes
+    else:
+        mask = mask_int
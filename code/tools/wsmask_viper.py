@@ -0,0 +1,46 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : wsmask_viper.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Viper version of the WebSocket masking, see wsmask.py.
+@version   : v1.0.0
+@date      : 2024-05-13 14:05:37
+@copyright : Copyright (c) 2024
+"""
+
+import micropython
+
+
+@micropython.viper
+def mask(buf, key):
+    """
+    XOR `buf` (a word aligned bytearray) in place with the 4 bytes `key`,
+    one 32 bit word at a time.
+    """
+    data = ptr8(buf)  # noqa: F821
+    words = ptr32(buf)  # noqa: F821
+    k = ptr8(key)  # noqa: F821
+    length = int(len(buf))
+    k32 = k[0] | (k[1] << 8) | (k[2] << 16) | (k[3] << 24)
+    n = length >> 2
+    i = 0
+    while i < n:
+        words[i] = words[i] ^ k32
+        i += 1
+    i = n << 2
+    while i < length:
+        data[i] = data[i] ^ k[i & 3]
+        i += 1
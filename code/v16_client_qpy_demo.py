@@ -28,9 +28,11 @@ import gc
 import modem
 import utime
 import _thread
+import dataCall
 
-from usr.tools import uwebsocket, logging
+from usr.tools import logging
 from usr.ocpp.routing import on
+from usr.ocpp.supervisor import Supervisor
 from usr.ocpp.v16 import ChargePoint as cp
 from usr.ocpp.v16.enums import (
     Action,
@@ -40,6 +42,7 @@ from usr.ocpp.v16.enums import (
     # AvailabilityType,
     AvailabilityStatus,
     ConfigurationStatus,
+    ConfigurationKey,
     ClearCacheStatus,
     # ChargingProfilePurposeType,
     HashAlgorithm,
@@ -112,6 +115,9 @@ def utcnow():
 
 class ChargePoint(cp):
 
+    # Set by main(), WebSocketPingInterval is applied to its connections.
+    supervisor = None
+
     def send_authorize(self):
         request = self._call.AuthorizePayload(
             id_tag="id_tag",
@@ -133,6 +139,7 @@ class ChargePoint(cp):
 
         if response.status == RegistrationStatus.accepted:
             logger.info("Connected to central system.")
+        return response
 
     def send_diagnostics_status_notification(self):
         request = self._call.DiagnosticsStatusNotificationPayload(
@@ -335,6 +342,17 @@ class ChargePoint(cp):
     def on_change_configuration(self, key, value):
         logger.info("key %s, value %s" % (key, value))
 
+        if key == ConfigurationKey.web_socket_ping_interval:
+            try:
+                interval = int(value)
+            except ValueError:
+                interval = -1
+            if interval < 0:
+                return self._call_result.ChangeConfigurationPayload(
+                    status=ConfigurationStatus.rejected
+                )
+            self.supervisor.set_ping_interval(interval)
+
         return self._call_result.ChangeConfigurationPayload(
             status=ConfigurationStatus.accepted
         )
@@ -408,7 +426,9 @@ class ChargePoint(cp):
         return self._call_result.GetConfigurationPayload(
             configuration_key=[
                 KeyValue(key="Config1", readonly=True, value="Value1"),
-                KeyValue(key="Config2", readonly=False, value="Value2")
+                KeyValue(key="Config2", readonly=False, value="Value2"),
+                KeyValue(key=ConfigurationKey.web_socket_ping_interval, readonly=False,
+                         value=str(self.supervisor.ping_interval))
             ],
             unknown_key=["Config3"]
         )
@@ -579,20 +599,28 @@ class ChargePoint(cp):
 
 def main():
     logger.debug("_thread.get_heap_size() %s, gc.mem_alloc() %s" % (_thread.get_heap_size(), gc.mem_alloc()))
-    ws = uwebsocket.Client.connect(
+    cp = ChargePoint(IMEI, None)
+    logger.debug("_thread.get_heap_size() %s, gc.mem_alloc() %s" % (_thread.get_heap_size(), gc.mem_alloc()))
+    # The supervisor connects, sends BootNotification and reconnects when
+    # the connection is lost.
+    supervisor = Supervisor(
+        cp,
         "ws://106.15.58.32:31499/%s" % IMEI,
         # "ws://xxx.xxx.xxx.xxx:xxxx/868543063288971",
+        boot=cp.send_boot_notification,
+        ping_interval=300,
         headers={"Sec-WebSocket-Protocol": "ocpp1.6.0"},
         debug=False
     )
-    logger.debug("_thread.get_heap_size() %s, gc.mem_alloc() %s" % (_thread.get_heap_size(), gc.mem_alloc()))
-    cp = ChargePoint(IMEI, ws)
-    logger.debug("_thread.get_heap_size() %s, gc.mem_alloc() %s" % (_thread.get_heap_size(), gc.mem_alloc()))
+    cp.supervisor = supervisor
+    # Reconnect at once when the data call is back, args[1] is its state.
+    dataCall.setCallback(lambda args: supervisor.wake() if args[1] == 1 else None)
 
     _thread.stack_size(0x1000)
-    tid = _thread.start_new_thread(cp.start, ())
-    logger.debug("cp start tid %s" % tid)
-    utime.sleep_ms(200)
+    tid = supervisor.start()
+    logger.debug("supervisor start tid %s" % tid)
+    while not supervisor.booted:
+        utime.sleep_ms(200)
     logger.debug("_thread.get_heap_size() %s, gc.mem_alloc() %s" % (_thread.get_heap_size(), gc.mem_alloc()))
 
     cp_send_fun = [i for i in dir(cp) if i.startswith("send_")]
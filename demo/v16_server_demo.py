@@ -24,14 +24,23 @@
 @copyright :Copyright (c) 2024
 """
 
+import os
+import sys
+import types
 import asyncio
 import logging
 import websockets
 from datetime import datetime
 
-from ocpp.routing import on
-from ocpp.v16 import ChargePoint as cp
-from ocpp.v16.enums import (
+# The library is laid out for QuecPython, where the project is mounted as
+# `usr`. Map `usr` to the `code` folder of this repository.
+_usr = types.ModuleType("usr")
+_usr.__path__ = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "code")]
+sys.modules.setdefault("usr", _usr)
+
+from usr.ocpp.routing import on  # noqa: E402
+from usr.ocpp.v16 import ChargePoint as cp  # noqa: E402
+from usr.ocpp.v16.enums import (  # noqa: E402
     Action,
     RegistrationStatus,
     CancelReservationStatus,
@@ -68,7 +77,7 @@ from ocpp.v16.enums import (
     ResetType,
     UpdateType,
 )
-from ocpp.v16.datatypes import (
+from usr.ocpp.v16.datatypes import (  # noqa: E402
     ChargingSchedule,
     ChargingSchedulePeriod,
     # KeyValue,
@@ -643,7 +652,9 @@ async def main():
         on_connect,
         '0.0.0.0',
         31499,
-        subprotocols=['ocpp1.6.0']
+        subprotocols=['ocpp1.6.0'],
+        # Accept permessage-deflate offered by the charge points.
+        compression="deflate"
     )
     logging.info("WebSocket Server Started")
     await server.wait_closed()
@@ -0,0 +1,196 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : check_log_writer.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Check usr.tools.logging.LogWriter in a temporary folder, which
+             stands in for the file system of the module: no line is lost
+             or reordered across rotations, the files stay under their
+             size, lines are dropped and counted in their place when the
+             buffer is full, lines longer than the buffer are written,
+             and the writes on level, on size and on time. Runs on CPython:
+
+                 python scripts/check_log_writer.py
+@version   : v1.0.0
+@date      : 2024-05-31 16:05:12
+@copyright : Copyright (c) 2024
+"""
+
+import os
+import sys
+import time
+import types
+import shutil
+import tempfile
+
+# Map `usr` to the `code` folder, as QuecPython mounts it.
+_usr = types.ModuleType("usr")
+_usr.__path__ = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "code")]
+sys.modules["usr"] = _usr
+
+from usr.tools import logging  # noqa: E402
+from usr.tools.logging import LogWriter, INFO, ERROR  # noqa: E402
+
+errors = []
+
+
+def check(ok, what):
+    if not ok:
+        errors.append(what)
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def logged(path, backups):
+    """The lines of the log file and its backups, oldest first."""
+    text = ""
+    for i in range(backups, 0, -1):
+        if os.path.exists("%s.%d" % (path, i)):
+            text += read("%s.%d" % (path, i))
+    if os.path.exists(path):
+        text += read(path)
+    return text.splitlines()
+
+
+def wait_for(func, seconds):
+    end = time.time() + seconds
+    while time.time() < end:
+        if func():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def check_rotation(folder):
+    path = os.path.join(folder, "rotate", "project.log")
+    writer = LogWriter(path, max_size=500, backups=3, buffer_size=256, interval=60)
+    writer.start()
+    lines = ["line %04d %s" % (i, "x" * (i % 17)) for i in range(400)]
+    for i, line in enumerate(lines):
+        writer.write(line + "\n")
+        if i % 5 == 4:
+            writer.flush()
+    writer.stop()
+    kept = logged(path, 3)
+    check(kept and kept == lines[-len(kept):], "rotation: lines lost or reordered")
+    check(len(kept) > 60, "rotation: only %d lines kept" % len(kept))
+    check(not os.path.exists(path + ".4"), "rotation: more than 3 backups")
+    for name in os.listdir(os.path.dirname(path)):
+        size = os.path.getsize(os.path.join(os.path.dirname(path), name))
+        check(size < 500, "rotation: %s has %d bytes" % (name, size))
+
+    # A backup removed behind the writer's back.
+    os.remove(path + ".2")
+    writer = LogWriter(path, max_size=500, backups=3, buffer_size=256, interval=60)
+    writer.start()
+    writer._backup_count = 3
+    for i in range(100):
+        writer.write("again %04d\n" % i)
+        writer.flush()
+    writer.stop()
+    again = ["again %04d" % i for i in range(100)]
+    kept = [line for line in logged(path, 3) if line.startswith("again")]
+    check(kept and kept == again[-len(kept):], "rotation: not recovered from a missing backup")
+
+
+def check_dropped(folder):
+    path = os.path.join(folder, "dropped.log")
+    # Not started, nothing writes but flush().
+    writer = LogWriter(path, buffer_size=64)
+    for i in range(5):
+        writer.write("dropped line %05d\n" % i)
+    check(writer.dropped == 2, "dropped: %d lines dropped, not 2" % writer.dropped)
+    writer.flush()
+    check(
+        logged(path, 0) == ["dropped line 00000", "dropped line 00001", "dropped line 00002", "... 2 log lines dropped"],
+        "dropped: %r" % logged(path, 0)
+    )
+
+    # A long line dropped, the next ones fit after its count.
+    os.remove(path)
+    writer = LogWriter(path, buffer_size=64)
+    writer.write("first\n")
+    writer.write("x" * 60 + "\n")
+    writer.write("next\n")
+    writer.flush()
+    check(logged(path, 0) == ["first", "... 1 log lines dropped", "next"], "dropped: %r" % logged(path, 0))
+
+
+def check_long_lines(folder):
+    path = os.path.join(folder, "long.log")
+    writer = LogWriter(path, buffer_size=64)
+    long_line = "y" * 100
+    writer.write("before\n")
+    writer.write(long_line + "\n")
+    writer.write("after\n")
+    writer.flush()
+    check(logged(path, 0) == ["before", long_line, "after"], "long lines: %r" % logged(path, 0))
+
+
+def check_triggers(folder):
+    path = os.path.join(folder, "triggers.log")
+    writer = LogWriter(path, buffer_size=1000, interval=1)
+    writer.start()
+    writer.write("info\n", INFO)
+    time.sleep(0.3)
+    check(not os.path.exists(path), "triggers: info line written before the interval")
+    writer.write("error\n", ERROR)
+    check(wait_for(lambda: logged(path, 0) == ["info", "error"], 1), "triggers: error line not written at once")
+    writer.write("x" * 600 + "\n", INFO)
+    check(wait_for(lambda: len(logged(path, 0)) == 3, 1), "triggers: half full buffer not written")
+    writer.write("late\n", INFO)
+    check(wait_for(lambda: len(logged(path, 0)) == 4, 2), "triggers: line not written after the interval")
+    writer.stop()
+
+
+def check_logger(folder):
+    logging.setLogFile(os.path.join(folder, "logger"), "project.log")
+    logging.setSaveLog(True, 0x2000, 2)
+    logging.setLogDebug(False)
+    logging.setLogLevel("info")
+    log = logging.getLogger("check")
+    log.debug("hidden")
+    log.info("receive %s", "message")
+    log.warn("offline")
+    logging.flushLog()
+    lines = logged(os.path.join(folder, "logger", "project.log"), 2)
+    check(
+        [line.split("] ", 1)[1] for line in lines] == ["receive message", "offline"],
+        "logger: %r" % lines
+    )
+    logging.setSaveLog(False)
+
+
+def main():
+    folder = tempfile.mkdtemp()
+    try:
+        check_rotation(folder)
+        check_dropped(folder)
+        check_long_lines(folder)
+        check_triggers(folder)
+        check_logger(folder)
+    finally:
+        shutil.rmtree(folder)
+    for error in errors:
+        print(error)
+    print("%d differences" % len(errors))
+    return not errors
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,266 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : gen_schemas.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Generate code/ocpp/v16/schemas.py, the constant schema tables,
+             and the `__slots__` of the payload classes from their
+             `__schemas__`. Runs on CPython:
+
+                 python scripts/gen_schemas.py          # rewrite them
+                 python scripts/gen_schemas.py --check  # check they're current
+
+             tests/test_schema_tables.py checks that the tables validate as
+             the schemas do.
+@version   : v1.0.0
+@date      : 2024-05-23 09:41:16
+@copyright : Copyright (c) 2024
+"""
+
+import os
+import sys
+import json
+import types
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+OUTPUT = os.path.join(ROOT, "code", "ocpp", "v16", "schemas.py")
+
+# Map `usr` to the `code` folder, as QuecPython mounts it.
+_usr = types.ModuleType("usr")
+_usr.__path__ = [os.path.join(ROOT, "code")]
+sys.modules["usr"] = _usr
+
+from usr.ocpp import dataclasses as dc  # noqa: E402
+
+# Module of the classes and prefix of the names of their tables.
+MODULES = (
+    ("usr.ocpp.v16.datatypes", "datatypes_"),
+    ("usr.ocpp.v16.call", "call_"),
+    ("usr.ocpp.v16.call_result", "call_result_"),
+)
+
+HEADER = '''# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : schemas.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Schemas of the OCPP 1.6 payload classes as constant tables.
+@version   : v1.0.0
+@date      : 2024-05-23 09:41:16
+@copyright : Copyright (c) 2024
+"""
+
+# Generated by scripts/gen_schemas.py from the `__schemas__` of the payload
+# classes, don't edit it. Read by usr.ocpp.dataclasses.TableValidator.
+#
+# Only tuples, strings and ints, so it can be frozen into the firmware, where
+# the tables stay in flash. A table is None for an empty schema or
+# (required keys, properties), a property is (key, kind, argument):
+#
+#   1 str        maxLength, 0 for none
+#   2 int
+#   3 float
+#   4 enum       name of the tuple of its values below
+#   5 object     name of its class in DATATYPES
+#   6 str list   maxLength of the items, 0 for none
+#   7 object list  name of the class of the items in DATATYPES
+#   0 any other type, not checked
+
+DATATYPES = "usr.ocpp.v16.datatypes"
+'''
+
+
+def module_classes(name, prefix):
+    """Yield (table name, class) of the payload classes of a module."""
+    __import__(name)
+    module = sys.modules[name]
+    for attr in sorted(dir(module)):
+        cls = getattr(module, attr)
+        # call and call_result import some datatypes, which are skipped.
+        if (isinstance(cls, type) and issubclass(cls, dc.dataclass) and cls is not dc.dataclass and
+                (prefix == "datatypes_" or attr.endswith("Payload"))):
+            yield prefix + attr, cls
+
+
+def payload_classes():
+    """Yield (table name, class) of all payload classes and datatypes."""
+    for name, prefix in MODULES:
+        for item in module_classes(name, prefix):
+            yield item
+
+
+def enum_name(enum):
+    return "enum_" + enum.__name__
+
+
+def enum_values(enum):
+    """Values of a StrEnum in the order of the class, without the aliases."""
+    values = []
+    for k, v in enum.__dict__.items():
+        if not k.startswith("_") and v not in values:
+            values.append(v)
+    return tuple(values)
+
+
+def required_keys(schema):
+    """Required keys in the order of the properties, some are sets."""
+    required = schema["required"]
+    return [k for k in schema["properties"] if k in required] + sorted(k for k in required if k not in schema["properties"])
+
+
+def convert(prop, enums):
+    """Return (kind, argument) of a property of a __schemas__ dict."""
+    _type = prop["type"]
+    if _type is str:
+        return dc.STR, prop.get("maxLength") or 0
+    if _type is int:
+        return dc.INT, 0
+    if _type is float:
+        return dc.FLOAT, 0
+    if _type is dc.StrEnum:
+        enums[enum_name(prop["enum"])] = enum_values(prop["enum"])
+        return dc.ENUM, enum_name(prop["enum"])
+    if _type is dc.dataclass:
+        return dc.OBJECT, prop["cls"].__name__
+    if _type is list:
+        items = prop["items"]
+        if items["type"] is str:
+            return dc.STR_LIST, items.get("maxLength") or 0
+        if items["type"] is dc.dataclass:
+            return dc.OBJECT_LIST, items["cls"].__name__
+    return dc.ANY, 0
+
+
+def q(s):
+    return json.dumps(s)
+
+
+def render():
+    enums = {}
+    tables = []
+    for name, cls in payload_classes():
+        schema = cls.__schemas__()
+        if not schema:
+            tables.append("%s = None\n" % name)
+            continue
+        lines = ["%s = (\n" % name]
+        lines.append("    (%s),\n" % "".join(q(k) + ", " for k in required_keys(schema)).rstrip(" "))
+        lines.append("    (\n")
+        for key, prop in schema["properties"].items():
+            kind, arg = convert(prop, enums)
+            lines.append("        (%s, %d, %s),\n" % (q(key), kind, q(arg) if isinstance(arg, str) else arg))
+        lines.append("    ),\n)\n")
+        tables.append("".join(lines))
+
+    out = [HEADER]
+    for name in sorted(enums):
+        values = "".join(q(v) + ", " for v in enums[name]).rstrip(" ")
+        out.append("\n%s = (%s)\n" % (name, values))
+    for table in tables:
+        out.append("\n%s" % table)
+    return "".join(out).replace("\n", "\r\n")
+
+
+def fields(cls):
+    """Names of the fields of a payload class, in the order of its schema."""
+    schema = cls.__schemas__()
+    return tuple(schema["properties"]) if schema else ()
+
+
+def slots_line(cls):
+    names = [q(k) for k in fields(cls)]
+    return "    __slots__ = (%s%s)\n" % (", ".join(names), "," if len(names) == 1 else "")
+
+
+def render_slots(name, prefix):
+    """Return the path and the source of a module with the `__slots__` of its classes."""
+    path = sys.modules[name].__file__
+    with open(path, "rb") as f:
+        lines = f.read().decode().replace("\r\n", "\n").splitlines(True)
+    for _, cls in module_classes(name, prefix):
+        start = lines.index("class %s(dataclass):\n" % cls.__name__) + 1
+        end = start
+        while end < len(lines) and not lines[end].startswith("class "):
+            end += 1
+        body = lines[start:end]
+        line = slots_line(cls)
+        for i, text in enumerate(body):
+            if text.startswith("    __slots__ = ") or text == "    pass\n":
+                body[i] = line
+                break
+            if text.startswith("    def ") or text.startswith("    @"):
+                body[i:i] = [line, "\n"]
+                break
+        lines[start:end] = body
+    return path, "".join(lines).replace("\n", "\r\n")
+
+
+def check():
+    errors = []
+    with open(OUTPUT, "rb") as f:
+        if f.read().decode() != render():
+            errors.append("%s is out of date, run scripts/gen_schemas.py" % OUTPUT)
+    for name, prefix in MODULES:
+        path, source = render_slots(name, prefix)
+        with open(path, "rb") as f:
+            if f.read().decode() != source:
+                errors.append("__slots__ of %s are out of date, run scripts/gen_schemas.py" % path)
+
+    from usr.ocpp.v16 import schemas
+    count = 0
+    for name, cls in payload_classes():
+        if getattr(cls, "__table__", None) != (schemas, name):
+            errors.append("%s doesn't use its table %s" % (cls.__name__, name))
+            continue
+        count += 1
+        if hasattr(cls(**{k: "x" for k in fields(cls)}), "__dict__"):
+            errors.append("%s has a __dict__" % cls.__name__)
+    for error in errors:
+        print(error)
+    print("%d payload classes checked, %d errors" % (count, len(errors)))
+    return not errors
+
+
+def main():
+    if "--check" in sys.argv[1:]:
+        sys.exit(0 if check() else 1)
+    if not os.path.exists(OUTPUT):
+        # The payload modules import it, start with no tables.
+        with open(OUTPUT, "wb") as f:
+            f.write(HEADER.replace("\n", "\r\n").encode())
+    with open(OUTPUT, "wb") as f:
+        f.write(render().encode())
+    print("Wrote %s" % OUTPUT)
+    for name, prefix in MODULES:
+        path, source = render_slots(name, prefix)
+        with open(path, "wb") as f:
+            f.write(source.encode())
+        print("Wrote %s" % path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : conftest.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Runs the tests on CPython: maps `usr` to the `code` folder as
+             QuecPython mounts it and stands in for the QuecPython modules.
+             utime and osTimer run on `CLOCK`, which follows the real time
+             until a test takes the `clock` fixture and moves it by hand.
+@version   : v1.0.0
+@date      : 2024-06-03 10:20:31
+@copyright : Copyright (c) 2024
+"""
+
+import os
+import sys
+import time
+import types
+import random
+import logging
+import threading
+import traceback
+
+import pytest
+
+_usr = types.ModuleType("usr")
+_usr.__path__ = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "code")]
+sys.modules["usr"] = _usr
+
+_TICKS_MAX = 0x40000000
+
+
+class Clock(object):
+    """
+    The time of utime and osTimer. In manual mode the time only moves on
+    advance(), which fires the timers due on the way.
+    """
+
+    def __init__(self):
+        self.manual = False
+        self.now_ms = 0
+        self.timers = []
+        # (period, periodic) of every osTimer.start().
+        self.starts = []
+
+    def ms(self):
+        if self.manual:
+            return self.now_ms
+        return int(time.monotonic() * 1000)
+
+    def us(self):
+        if self.manual:
+            return self.now_ms * 1000
+        return int(time.monotonic() * 1000000)
+
+    def advance(self, ms):
+        end = self.now_ms + ms
+        while True:
+            due = [t for t in self.timers if t.due <= end]
+            if not due:
+                break
+            timer = min(due, key=lambda t: t.due)
+            self.now_ms = max(self.now_ms, timer.due)
+            timer.fire()
+        self.now_ms = end
+
+
+CLOCK = Clock()
+
+
+class osTimer(object):
+
+    def __init__(self):
+        self.due = None
+        self._callback = None
+        self._period = 0
+        self._periodic = 0
+        # Armed real time timers fire only while it's unchanged.
+        self._generation = 0
+
+    def start(self, period, periodic, callback):
+        self.stop()
+        CLOCK.starts.append((period, periodic))
+        self._callback = callback
+        self._period = period
+        self._periodic = periodic
+        if CLOCK.manual:
+            self.due = CLOCK.now_ms + period
+            CLOCK.timers.append(self)
+        else:
+            self._arm()
+        return 0
+
+    def stop(self):
+        if self in CLOCK.timers:
+            CLOCK.timers.remove(self)
+        self.due = None
+        self._generation += 1
+        return 0
+
+    def fire(self):
+        if self._periodic:
+            self.due += self._period
+        else:
+            self.stop()
+        self._callback(None)
+
+    def _arm(self):
+        timer = threading.Timer(self._period / 1000, self._fired, (self._generation,))
+        timer.daemon = True
+        timer.start()
+
+    def _fired(self, generation):
+        if generation != self._generation:
+            return
+        if self._periodic:
+            self._arm()
+        else:
+            self._generation += 1
+        self._callback(None)
+
+
+utime = types.ModuleType("utime")
+utime.ticks_ms = lambda: CLOCK.ms() % _TICKS_MAX
+utime.ticks_us = lambda: CLOCK.us() % _TICKS_MAX
+utime.ticks_add = lambda ticks, delta: (ticks + delta) % _TICKS_MAX
+
+
+def _ticks_diff(a, b):
+    diff = (a - b) % _TICKS_MAX
+    return diff - _TICKS_MAX if diff >= _TICKS_MAX // 2 else diff
+
+
+utime.ticks_diff = _ticks_diff
+utime.time = lambda: int(time.time())
+utime.localtime = time.localtime
+utime.sleep = time.sleep
+utime.sleep_ms = lambda ms: time.sleep(ms / 1000)
+
+sys.modules.setdefault("utime", utime)
+sys.modules.setdefault("osTimer", osTimer)
+
+log = types.ModuleType("log")
+log.getLogger = logging.getLogger
+sys.modules.setdefault("log", log)
+
+for _name, _module in (
+    ("uos", "os"), ("ujson", "json"), ("ure", "re"), ("ustruct", "struct"), ("uhashlib", "hashlib"),
+    ("ubinascii", "binascii"), ("urandom", "random"), ("usocket", "socket"), ("ucollections", "collections"),
+    ("uio", "io"), ("usys", "sys"),
+):
+    sys.modules.setdefault(_name, __import__(_module))
+
+if not hasattr(sys, "print_exception"):
+    sys.print_exception = traceback.print_exception
+
+random.seed(0)
+
+
+@pytest.fixture
+def clock():
+    """CLOCK in manual mode, starting close to the wrap of the ticks."""
+    CLOCK.manual = True
+    CLOCK.now_ms = _TICKS_MAX - 5000
+    CLOCK.timers = []
+    CLOCK.starts = []
+    yield CLOCK
+    CLOCK.manual = False
+    CLOCK.timers = []
+    CLOCK.starts = []
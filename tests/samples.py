@@ -0,0 +1,106 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : samples.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : The payload classes of OCPP 1.6 and sample payloads of them,
+             valid and broken in every way.
+@version   : v1.0.0
+@date      : 2024-06-09 10:05:37
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+
+import usr.ocpp.v16  # noqa: F401, imports usr.ocpp.charge_point
+from usr.ocpp import dataclasses as dc
+from usr.ocpp.v16 import schemas
+
+MODULES = ("usr.ocpp.v16.datatypes", "usr.ocpp.v16.call", "usr.ocpp.v16.call_result")
+
+
+def _classes():
+    """Yield the payload classes and datatypes, without the ones imported."""
+    for name in MODULES:
+        __import__(name)
+        module = sys.modules[name]
+        for attr in sorted(dir(module)):
+            cls = getattr(module, attr)
+            if (isinstance(cls, type) and issubclass(cls, dc.dataclass) and cls is not dc.dataclass and
+                    cls.__module__ == name):
+                yield cls
+
+
+CLASSES = list(_classes())
+
+
+def table_validator(cls):
+    """A new TableValidator of a payload class, as get_validator() makes it."""
+    return dc.TableValidator(cls, *cls.__table__)
+
+
+def samples(cls, depth=0):
+    """Yield (name, payload) of a valid payload and of broken ones."""
+    table = table_validator(cls)
+    if table.properties is None:
+        yield "empty", {}
+        yield "unknown key", {"foo": 1}
+        return
+    valid = {prop[0]: _value(table, prop, depth) for prop in table.properties}
+    yield "valid", dict(valid)
+    yield "required only", {k: valid[k] for k in table.required}
+    yield "unknown key", dict(valid, foo=1)
+    for key in table.required:
+        yield "without " + key, {k: v for k, v in valid.items() if k != key}
+    for prop in table.properties:
+        for i, val in enumerate(_broken(table, prop, depth)):
+            yield "%s broken %d" % (prop[0], i), dict(valid, **{prop[0]: val})
+
+
+def _value(table, prop, depth):
+    key, kind, arg = prop
+    if kind == dc.STR:
+        return "x" * (arg or 3)
+    if kind == dc.INT:
+        return 1
+    if kind == dc.FLOAT:
+        return 1.5
+    if kind == dc.ENUM:
+        return getattr(schemas, arg)[-1]
+    if kind == dc.OBJECT:
+        return next(samples(table.classes[key][0], depth + 1))[1]
+    if kind == dc.STR_LIST:
+        return ["y" * (arg or 3)]
+    if kind == dc.OBJECT_LIST:
+        return [next(samples(table.classes[key][0], depth + 1))[1]]
+    return True
+
+
+def _broken(table, prop, depth):
+    key, kind, arg = prop
+    if kind == dc.STR:
+        return [7, "x" * (arg + 1)] if arg else [7]
+    if kind in (dc.INT, dc.FLOAT):
+        return ["1", 1 if kind == dc.FLOAT else 1.5]
+    if kind == dc.ENUM:
+        return ["NotAValue", 7]
+    if kind == dc.OBJECT:
+        cls = table.classes[key][0]
+        return [{"foo": 1}] + ([] if depth else [dict(next(samples(cls, 1))[1], foo=1)])
+    if kind == dc.STR_LIST:
+        return [[7], ["z" * (arg + 1)]] if arg else [[7]]
+    if kind == dc.OBJECT_LIST:
+        return [[{"foo": 1}], []]
+    return []
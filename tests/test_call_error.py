@@ -0,0 +1,109 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_call_error.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : A CALL whose payload isn't valid is answered by a CallError.
+@version   : v1.0.0
+@date      : 2024-06-04 09:12:37
+@copyright : Copyright (c) 2024
+"""
+
+import json
+import asyncio
+
+import pytest
+
+import usr.ocpp.v16  # noqa: F401, imports usr.ocpp.charge_point
+from usr.ocpp.routing import on
+from usr.ocpp.v16 import ChargePoint
+from usr.ocpp.v16.payloads import call, call_result
+from usr.ocpp.async_charge_point import ChargePoint as AsyncChargePoint
+
+
+class Connection(object):
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+class AsyncConnection(Connection):
+
+    async def send(self, message):
+        self.sent.append(message)
+
+
+class Handlers(object):
+
+    @on("BootNotification")
+    def on_boot_notification(self, **kwargs):
+        return call_result.BootNotificationPayload(
+            current_time="2024-06-04T09:12:37Z", interval=300, status="Accepted"
+        )
+
+
+class AsyncCentralSystem(Handlers, AsyncChargePoint):
+    _call = call
+    _call_result = call_result
+    _ocpp_version = "1.6"
+
+
+class CentralSystem(Handlers, ChargePoint):
+    pass
+
+
+INVALID = [
+    ({"chargePointVendor": 5, "chargePointModel": "M"}, "TypeConstraintViolation"),
+    ({"chargePointVendor": "V", "chargePointModel": "M", "colour": "red"}, "FormatViolation"),
+    ({"chargePointVendor": "V" * 21, "chargePointModel": "M"}, "TypeConstraintViolation"),
+]
+
+
+def _boot(payload):
+    return json.dumps([2, "1", "BootNotification", payload])
+
+
+def _check_call_error(sent, code):
+    assert len(sent) == 1
+    message = json.loads(sent[0])
+    assert message[:3] == [4, "1", code]
+    assert "BootNotification" in message[4]["ocpp_message"]
+
+
+@pytest.mark.parametrize("payload, code", INVALID)
+def test_async_invalid_payload(payload, code):
+    connection = AsyncConnection()
+    cs = AsyncCentralSystem("CP_1", connection)
+    asyncio.run(cs.route_message(_boot(payload)))
+    _check_call_error(connection.sent, code)
+
+
+@pytest.mark.parametrize("payload, code", INVALID)
+def test_invalid_payload(payload, code):
+    connection = Connection()
+    cs = CentralSystem("CP_1", connection)
+    cs.route_message(_boot(payload))
+    _check_call_error(connection.sent, code)
+
+
+def test_valid_payload():
+    connection = AsyncConnection()
+    cs = AsyncCentralSystem("CP_1", connection)
+    asyncio.run(cs.route_message(_boot({"chargePointVendor": "V", "chargePointModel": "M"})))
+    message = json.loads(connection.sent[0])
+    assert message[:2] == [3, "1"] and message[2]["status"] == "Accepted"
@@ -0,0 +1,176 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_connect.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Addresses cached and failed over by Client.connect(), and the
+             milliseconds of its phases.
+@version   : v1.0.0
+@date      : 2024-06-08 11:15:02
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+import types
+
+import pytest
+
+from usr.tools import uwebsocket
+from usr.tools.uwebsocket import Client, resolve, forget, _connect
+
+A = ("10.0.0.1", 80)
+B = ("10.0.0.2", 80)
+
+
+class DNS(object):
+    """getaddrinfo() answering `addresses`, or failing when it's None."""
+
+    def __init__(self, *addresses):
+        self.addresses = list(addresses)
+        self.calls = 0
+
+    def __call__(self, hostname, port):
+        self.calls += 1
+        if self.addresses is None:
+            raise OSError("no network")
+        return [(2, 1, 6, "", addr) for addr in self.addresses]
+
+
+@pytest.fixture
+def dns(monkeypatch):
+    monkeypatch.setattr(uwebsocket, "_DNS_CACHE", {})
+    dns = DNS(A, B, A)
+    monkeypatch.setattr(uwebsocket.socket, "getaddrinfo", dns)
+    dns.now = 1000
+    monkeypatch.setattr(uwebsocket.utime, "time", lambda: dns.now)
+    return dns
+
+
+def test_cached(dns):
+    assert resolve("cs", 80) == [A, B]
+    dns.now += 299
+    assert resolve("cs", 80) is resolve("cs", 80)
+    assert dns.calls == 1
+    dns.now += 1
+    resolve("cs", 80)
+    assert dns.calls == 2
+    forget("cs", 80)
+    resolve("cs", 80)
+    assert dns.calls == 3
+
+
+def test_clock_set_back(dns):
+    resolve("cs", 80)
+    dns.now -= 1
+    resolve("cs", 80)
+    assert dns.calls == 2
+
+
+def test_ticks_wrap_ignored(dns, clock):
+    resolve("cs", 80)
+    # Ticks wrapped once, nothing else but the RTC tells the age.
+    clock.advance(0x40000000 + 1000)
+    dns.now += 0x40000000 // 1000
+    resolve("cs", 80)
+    assert dns.calls == 2
+
+
+def test_expired_used_when_failing(dns):
+    addresses = resolve("cs", 80)
+    dns.addresses = None
+    dns.now += 1000
+    assert resolve("cs", 80) is addresses
+    with pytest.raises(OSError):
+        resolve("other", 80)
+
+
+class Socket(object):
+    """A socket which can connect to the addresses in `up` only."""
+
+    up = ()
+    tried = []
+
+    def connect(self, addr):
+        Socket.tried.append(addr)
+        if addr not in Socket.up:
+            raise OSError("unreachable")
+
+    def close(self):
+        pass
+
+
+def test_failover(dns, monkeypatch):
+    monkeypatch.setattr(uwebsocket.socket, "socket", Socket)
+    monkeypatch.setattr(Socket, "tried", [])
+    monkeypatch.setattr(Socket, "up", (B,))
+    addresses = resolve("cs", 80)
+    assert isinstance(_connect("cs", 80, addresses), Socket)
+    # The address which answers is tried first next time.
+    assert addresses == [B, A]
+    _connect("cs", 80, addresses)
+    assert Socket.tried == [A, B, B]
+    monkeypatch.setattr(Socket, "up", ())
+    with pytest.raises(OSError):
+        _connect("cs", 80, addresses)
+    # Resolved again, the host may have moved.
+    resolve("cs", 80)
+    assert dns.calls == 2
+
+
+class Upgraded(object):
+    """Answers the handshake request as a server upgrading the connection."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.response = b""
+
+    def write(self, data):
+        key = bytes(data).split(b"Sec-WebSocket-Key: ")[1].split(b"\r\n")[0]
+        self.response = (
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + uwebsocket.accept_key(key).encode() + b"\r\n\r\n"
+        )
+
+    def recv(self, n):
+        self.clock.advance(200)
+        data, self.response = self.response[:n], self.response[n:]
+        return data
+
+    def close(self):
+        pass
+
+
+def test_timings(clock, monkeypatch):
+    sock = Upgraded(clock)
+
+    def resolve(hostname, port):
+        clock.advance(30)
+        return [A]
+
+    def connect(hostname, port, addresses):
+        clock.advance(100)
+        return sock
+
+    def wrap_socket(sock):
+        clock.advance(700)
+        return sock
+
+    monkeypatch.setattr(uwebsocket, "resolve", resolve)
+    monkeypatch.setattr(uwebsocket, "_connect", connect)
+    assert Client.connect("ws://cs/ocpp").timings == {"dns": 30, "tcp": 100, "upgrade": 200}
+    ussl = types.ModuleType("ussl")
+    ussl.wrap_socket = wrap_socket
+    monkeypatch.setitem(sys.modules, "ussl", ussl)
+    assert Client.connect("wss://cs/ocpp").timings == {"dns": 30, "tcp": 100, "tls": 700, "upgrade": 200}
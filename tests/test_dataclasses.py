@@ -0,0 +1,92 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_dataclasses.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Payload objects of classes without `__slots__`.
+@version   : v1.0.0
+@date      : 2024-06-05 15:48:02
+@copyright : Copyright (c) 2024
+"""
+
+import json
+
+import pytest
+
+import usr.ocpp.v16  # noqa: F401, imports usr.ocpp.charge_point
+from usr.ocpp.v16 import call
+from usr.ocpp.messages import Call, encode
+from usr.ocpp.dataclasses import dataclass, asdict, fields
+from usr.ocpp.exceptions import FormatViolationError
+
+
+class Boot(call.BootNotificationPayload):
+    """A subclass which doesn't list its fields."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._sent = False
+
+
+class Tagged(call.HeartbeatPayload):
+
+    def __init__(self, tag):
+        self.tag = tag
+
+
+class Point(dataclass):
+    """A dataclass of the application, without `__slots__`."""
+
+    def __init__(self, x, y=None):
+        self.x = x
+        self.y = y
+
+
+def _encode(action, payload, validate=True):
+    return json.loads(encode(Call("1", action, None), payload, "1.6", validate))
+
+
+def test_slots():
+    boot = call.BootNotificationPayload(charge_point_model="M", charge_point_vendor="V")
+    assert fields(boot) is call.BootNotificationPayload.__slots__
+
+
+def test_subclass_without_slots():
+    boot = Boot(charge_point_model="M", charge_point_vendor="V")
+    assert fields(boot) == call.BootNotificationPayload.__slots__
+    assert asdict(boot)["charge_point_vendor"] == "V"
+    assert _encode("BootNotification", boot)[3] == {"chargePointModel": "M", "chargePointVendor": "V"}
+    assert "charge_point_vendor='V'" in repr(boot)
+
+
+def test_subclass_adding_a_field():
+    assert asdict(Tagged("a")) == {"tag": "a"}
+    assert _encode("Heartbeat", Tagged("a"))[3] == {"tag": "a"}
+    boot = Boot(charge_point_model="M", charge_point_vendor="V")
+    boot.note = "n"
+    assert asdict(boot)["note"] == "n"
+    assert _encode("BootNotification", boot, False)[3]["note"] == "n"
+    # Not a property of the schema.
+    with pytest.raises(FormatViolationError):
+        _encode("BootNotification", boot)
+
+
+def test_dataclass_without_slots():
+    point = Point(1, Point(2, 3))
+    assert fields(point) == ("x", "y")
+    assert asdict(point) == {"x": 1, "y": {"x": 2, "y": 3}}
+    assert asdict([Point("a")]) == [{"x": "a", "y": None}]
+    assert _encode("DataTransfer", point, False)[3] == {"x": 1, "y": {"x": 2, "y": 3}}
+    assert repr(point) == "Point(x=1, y=Point(x=2, y=3))"
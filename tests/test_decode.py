@@ -0,0 +1,140 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_decode.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : camelCase payloads decoded into payload objects in one walk.
+@version   : v1.0.0
+@date      : 2024-06-09 15:12:44
+@copyright : Copyright (c) 2024
+"""
+
+import pytest
+
+import usr.ocpp.v16  # noqa: F401, imports usr.ocpp.charge_point
+from usr.ocpp.v16 import call, datatypes
+from usr.ocpp.dataclasses import get_validator
+from usr.ocpp.exceptions import (
+    SchemaValidationError, ProtocolError, TypeConstraintViolationError, FormatViolationError,
+)
+from usr.ocpp.messages import Call, CallResult, decode, _decode
+
+METER_VALUES = {
+    "connectorId": 1,
+    "transactionId": 7,
+    "meterValue": [
+        {"timestamp": "2024-01-01T00:00:00Z", "sampledValue": [{"value": "10", "unit": "Wh"}, {"value": "3"}]},
+        {"timestamp": "2024-01-01T00:01:00Z", "sampledValue": []},
+    ],
+}
+
+
+def _decoded(cls, data, validate=True):
+    return _decode(data, get_validator(cls), validate)
+
+
+def test_nested_object():
+    message = CallResult("1", None, "StartTransaction")
+    message.payload = {"transactionId": 3, "idTagInfo": {"status": "Accepted", "parentIdTag": "P"}}
+    decode(message, "1.6")
+    info = message.payload["id_tag_info"]
+    assert isinstance(info, datatypes.IdTagInfo)
+    assert (info.status, info.parent_id_tag, info.expiry_date) == ("Accepted", "P", None)
+    assert message.payload["transaction_id"] == 3
+
+
+def test_lists_of_objects():
+    payload = _decoded(call.MeterValuesPayload, METER_VALUES)
+    assert sorted(payload) == ["connector_id", "meter_value", "transaction_id"]
+    first, second = payload["meter_value"]
+    assert isinstance(first, datatypes.MeterValue) and isinstance(second, datatypes.MeterValue)
+    assert [type(i) for i in first.sampled_value] == [datatypes.SampledValue] * 2
+    assert (first.sampled_value[0].value, first.sampled_value[0].unit) == ("10", "Wh")
+    assert first.sampled_value[1].unit is None
+    assert second.sampled_value == []
+    # Same as the payload class built by hand.
+    assert call.MeterValuesPayload(**payload).meter_value[0].timestamp == "2024-01-01T00:00:00Z"
+
+
+def test_decode_of_a_call():
+    message = Call("1", "MeterValues", METER_VALUES)
+    decode(message, "1.6")
+    assert message.payload["meter_value"][0].sampled_value[0].value == "10"
+
+
+def test_object_not_fitting_its_class():
+    message = CallResult("1", None, "StartTransaction")
+    message.payload = {"transactionId": 3, "idTagInfo": {"status": "Accepted", "unknownKey": 1}}
+    decode(message, "1.6", validate=False)
+    # Left a dict, with its keys translated.
+    assert message.payload["id_tag_info"] == {"status": "Accepted", "unknown_key": 1}
+    message.payload = {"transactionId": 3, "idTagInfo": {"status": "Accepted", "unknownKey": 1}}
+    with pytest.raises(FormatViolationError):
+        decode(message, "1.6")
+
+
+def test_items_which_arent_objects():
+    data = dict(METER_VALUES, meterValue=["x", {"timestamp": "t", "sampledValue": []}])
+    payload = _decoded(call.MeterValuesPayload, data, False)
+    assert payload["meter_value"][0] == "x"
+    assert isinstance(payload["meter_value"][1], datatypes.MeterValue)
+    with pytest.raises(SchemaValidationError):
+        _decoded(call.MeterValuesPayload, data)
+
+
+@pytest.mark.parametrize("data, validator", [
+    # A required key missing is reported before the other errors.
+    ({"transactionId": "7", "meterValue": []}, "required"),
+    ({"connectorId": "1", "meterValue": []}, "type"),
+    (dict(METER_VALUES, meterValue=[{"timestamp": 1, "sampledValue": []}]), "type"),
+    (dict(METER_VALUES, meterValue=[{"timestamp": "t", "sampledValue": [{"value": 1}]}]), "type"),
+    (dict(METER_VALUES, meterValue=[{"timestamp": "t", "sampledValue": [{"unit": "Wh"}]}]), "required"),
+    (dict(METER_VALUES, meterValue=[{"timestamp": "t", "sampledValue": [{"value": "1", "unit": "x"}]}]), "type"),
+    (dict(METER_VALUES, extra=1), "NotExist"),
+])
+def test_schema_errors(data, validator):
+    with pytest.raises(SchemaValidationError) as e:
+        _decoded(call.MeterValuesPayload, data)
+    assert e.value.validator == validator
+    # Not validated, decoded all the same.
+    assert len(_decoded(call.MeterValuesPayload, data, False)) == len(data)
+
+
+def test_first_error_reported():
+    with pytest.raises(SchemaValidationError) as e:
+        _decoded(call.BootNotificationPayload, {
+            "chargePointVendor": "V", "chargePointModel": 1, "chargePointSerialNumber": "x" * 26,
+        })
+    assert "charge_point_model" in e.value.message
+
+
+def test_max_length():
+    with pytest.raises(SchemaValidationError) as e:
+        _decoded(call.BootNotificationPayload, {"chargePointVendor": "V" * 21, "chargePointModel": "M"})
+    assert e.value.validator == "maxLength"
+
+
+@pytest.mark.parametrize("payload, error", [
+    ({"transactionId": 3}, ProtocolError),
+    ({"transactionId": "3", "idTagInfo": {"status": "Accepted"}}, TypeConstraintViolationError),
+    ({"transactionId": 3, "idTagInfo": {"status": "Maybe"}}, TypeConstraintViolationError),
+])
+def test_ocpp_errors(payload, error):
+    message = CallResult("1", None, "StartTransaction")
+    message.payload = payload
+    with pytest.raises(error):
+        decode(message, "1.6")
+    # Quoted in snake_case, as validate_payload() does.
+    assert "transaction_id" in message.payload
@@ -0,0 +1,113 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_encoder.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : usr.ocpp.messages.encode() gives the same JSON, or raises the
+             same error, as asdict(), remove_nones(), validate_payload(),
+             snake_to_camel_case() and to_json() in turn, for sample
+             payloads of every Action, valid and broken in every way.
+@version   : v1.0.0
+@date      : 2024-05-24 15:38:02
+@copyright : Copyright (c) 2024
+"""
+
+import pytest
+
+import usr.ocpp.v16  # noqa: F401, imports usr.ocpp.charge_point
+from usr.ocpp import dataclasses as dc
+from usr.ocpp.keys import snake_to_camel_case
+from usr.ocpp.messages import Call, CallResult, encode, remove_nones, validate_payload
+
+from samples import CLASSES, samples
+
+ACTIONS = [cls for cls in CLASSES if cls.__name__.endswith("Payload")]
+
+
+def _encode_in_steps(message, payload, validate):
+    """The steps encode() stands for."""
+    message.payload = remove_nones(dc.asdict(payload))
+    if validate:
+        validate_payload(message, "1.6")
+    message.payload = snake_to_camel_case(message.payload)
+    return message.to_json()
+
+
+def _build(cls, data, raw):
+    """
+    Payload object of a snake_case dict. Nested dicts become objects of
+    their classes too, unless `raw` or they don't fit the class.
+    """
+    # Keys left out of the sample are None fields of the object.
+    data = dict({k: None for k in dc.fields(cls)}, **data)
+    if not raw:
+        for key, (_cls, many) in dc.get_validator(cls).classes.items():
+            val = data.get(key)
+            if many and isinstance(val, list):
+                data[key] = [_object(_cls, i) for i in val]
+            elif not many:
+                data[key] = _object(_cls, val)
+    return cls(**data)
+
+
+def _object(cls, val):
+    if not isinstance(val, dict):
+        return val
+    try:
+        return _build(cls, val, False)
+    except TypeError:
+        return val
+
+
+def _variants(cls, payload):
+    """Yield (name, payload object) of a sample payload."""
+    try:
+        obj = _build(cls, payload, False)
+    except TypeError:
+        # Unknown keys, no object of the class can have them.
+        return
+    yield "", obj
+    yield " raw", _build(cls, payload, True)
+    for key, (_cls, many) in dc.get_validator(cls).classes.items():
+        val = getattr(obj, key)
+        if many and isinstance(val, list):
+            yield " %s with Nones" % key, _build(cls, dict(payload, **{key: [None] + val + [None]}), False)
+        elif not many and val is not None:
+            empty = _cls(**{k: None for k in dc.fields(_cls)})
+            yield " %s empty" % key, _build(cls, dict(payload, **{key: empty}), False)
+
+
+def _outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as e:
+        return "%s %s" % (type(e).__name__, e)
+
+
+def _message(cls):
+    action = cls.__name__[:-len("Payload")]
+    if cls.__module__.endswith("call_result"):
+        return CallResult("1", None, action)
+    return Call("1", action, None)
+
+
+@pytest.mark.parametrize("cls", ACTIONS, ids=lambda cls: cls.__module__.rsplit(".", 1)[1] + "." + cls.__name__)
+def test_same_as_steps(cls):
+    for case, payload in samples(cls):
+        for variant, obj in _variants(cls, payload):
+            for validate in (True, False):
+                expected = _outcome(_encode_in_steps, _message(cls), obj, validate)
+                got = _outcome(encode, _message(cls), obj, "1.6", validate)
+                assert got == expected, "%s%s validate=%s" % (case, variant, validate)
@@ -0,0 +1,164 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_handshake.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Handshake responses read, parsed and checked by Client.connect().
+@version   : v1.0.0
+@date      : 2024-06-08 14:37:50
+@copyright : Copyright (c) 2024
+"""
+
+import pytest
+
+from usr.tools import uwebsocket
+from usr.tools.uwebsocket import (
+    Client, HandshakeError, parse_response, accept_key, _read_response, MAX_RESPONSE_SIZE,
+)
+
+# The example of RFC 6455 section 1.3.
+KEY = b"dGhlIHNhbXBsZSBub25jZQ=="
+ACCEPT = "s3pPLMBiTxaQ9kYGzzhZRbK+xOo="
+
+UPGRADE = {"upgrade": "websocket", "connection": "Upgrade", "sec-websocket-accept": ACCEPT}
+
+
+class Socket(object):
+    """Returns `chunks` one per recv(), or per readline() without recv()."""
+
+    def __init__(self, *chunks):
+        self.chunks = list(chunks)
+        self.writes = []
+        self.closed = False
+
+    def recv(self, n):
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def read(self, n):
+        return self.recv(n)
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+    def close(self):
+        self.closed = True
+
+
+class Lines(Socket):
+    """A socket without recv(), e.g. of ussl."""
+
+    recv = None
+
+    def readline(self):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+def test_accept_key():
+    assert accept_key(KEY) == ACCEPT
+
+
+def test_parse_response():
+    status, headers = parse_response(
+        b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nCONNECTION:Upgrade\r\n"
+        b"Sec-WebSocket-Extensions: a\r\nSec-WebSocket-Extensions:  b; c=1 "
+    )
+    assert status == 101
+    assert headers == {"upgrade": "websocket", "connection": "Upgrade", "sec-websocket-extensions": "a, b; c=1"}
+
+
+@pytest.mark.parametrize("head", [b"HTTP/1.1", b"SSH-2.0 x", b"HTTP/1.1 abc OK", b"HTTP/1.1 101 OK\r\nno colon",
+                                  b"HTTP/1.1 101 OK\r\n: empty"])
+def test_parse_response_malformed(head):
+    with pytest.raises(HandshakeError):
+        parse_response(head)
+
+
+def test_read_response():
+    # The empty line split over chunks, a frame sent right after it.
+    sock = Socket(b"HTTP/1.1 101 OK\r\n", b"Upgrade: websocket\r", b"\n", b"\r\n\x81\x02[]", b"more")
+    assert _read_response(sock) == (b"HTTP/1.1 101 OK\r\nUpgrade: websocket", b"\x81\x02[]")
+    assert sock.chunks == [b"more"]
+
+
+def test_read_response_by_lines():
+    sock = Lines(b"HTTP/1.1 101 OK\r\n", b"Upgrade: websocket\r\n", b"\r\n", b"\x81\x02[]")
+    assert _read_response(sock) == (b"HTTP/1.1 101 OK\r\nUpgrade: websocket", b"")
+    assert sock.chunks == [b"\x81\x02[]"]
+
+
+def test_read_response_one_chunk():
+    assert _read_response(Socket(b"HTTP/1.1 101 OK\r\n\r\nabc")) == (b"HTTP/1.1 101 OK", b"abc")
+
+
+def test_read_response_too_long_or_closed():
+    with pytest.raises(HandshakeError):
+        _read_response(Socket(*[b"X-Padding: " + b"x" * 0x1f0 + b"\r\n"] * (MAX_RESPONSE_SIZE // 0x1f0 + 2)))
+    with pytest.raises(HandshakeError):
+        _read_response(Socket(b"HTTP/1.1 101 OK\r\n"))
+
+
+def test_check():
+    assert Client._check(101, dict(UPGRADE), KEY, [], None) == (None, [], None)
+    headers = dict(UPGRADE, **{"sec-websocket-protocol": "ocpp1.6"})
+    assert Client._check(101, headers, KEY, ["ocpp2.0", "ocpp1.6"], None) == ("ocpp1.6", [], None)
+
+
+@pytest.mark.parametrize("status, headers, protocols", [
+    (200, UPGRADE, []),
+    (101, dict(UPGRADE, upgrade="h2c"), []),
+    (101, dict(UPGRADE, connection="keep-alive"), []),
+    (101, dict(UPGRADE, **{"sec-websocket-accept": "x"}), []),
+    (101, {"upgrade": "websocket", "connection": "Upgrade"}, []),
+    (101, dict(UPGRADE, **{"sec-websocket-protocol": "ocpp2.0"}), ["ocpp1.6"]),
+    (101, dict(UPGRADE, **{"sec-websocket-extensions": "permessage-deflate"}), []),
+])
+def test_check_failed(status, headers, protocols):
+    with pytest.raises(HandshakeError):
+        Client._check(status, headers, KEY, protocols, None)
+
+
+def _server(sock, response):
+    """Answers the request written to `sock` with `response`, accept key filled in."""
+
+    def write(data):
+        Socket.write(sock, data)
+        key = bytes(data).split(b"Sec-WebSocket-Key: ")[1].split(b"\r\n")[0]
+        sock.chunks.append(response.replace(b"{accept}", accept_key(key).encode()))
+
+    sock.write = write
+
+
+def test_connect(monkeypatch):
+    sock = Socket()
+    _server(sock, b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                  b"Sec-WebSocket-Accept: {accept}\r\nSec-WebSocket-Protocol: ocpp1.6\r\n\r\n\x81\x02[]")
+    monkeypatch.setattr(uwebsocket, "resolve", lambda hostname, port: [(hostname, port)])
+    monkeypatch.setattr(uwebsocket, "_connect", lambda hostname, port, addresses: sock)
+    ws = Client.connect("ws://cs/ocpp", headers={"Sec-WebSocket-Protocol": "ocpp1.6"})
+    assert ws.subprotocol == "ocpp1.6"
+    assert ws.extensions == []
+    # The frame which came with the response.
+    assert ws.recv() == "[]"
+
+
+def test_connect_misrouted(monkeypatch):
+    sock = Socket()
+    # A proxy answering for the server.
+    _server(sock, b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+    monkeypatch.setattr(uwebsocket, "resolve", lambda hostname, port: [(hostname, port)])
+    monkeypatch.setattr(uwebsocket, "_connect", lambda hostname, port, addresses: sock)
+    with pytest.raises(HandshakeError):
+        Client.connect("ws://cs/ocpp")
+    assert sock.closed
@@ -0,0 +1,171 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_journal.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Acknowledgements and compaction of the Journal, with resets
+             on the way.
+@version   : v1.0.0
+@date      : 2024-06-04 14:27:10
+@copyright : Copyright (c) 2024
+"""
+
+import pytest
+
+from usr.ocpp import journal
+from usr.ocpp.journal import Journal
+
+
+class Reset(Exception):
+    """The module resets, nothing after it is written."""
+
+
+def _journal(tmp_path, count=4):
+    """A journal of `count` CALLs in flight, as ChargePoint.call() sends them."""
+    j = Journal(str(tmp_path / "journal"), sync_every=1)
+    for i in range(count):
+        j.append("id%d" % i, "StartTransaction", '[2, "id%d", "StartTransaction", {}]' % i, inflight=True)
+    return j
+
+
+def _ids(j):
+    return [unique_id for unique_id, message in j.records()]
+
+
+def test_reload(tmp_path):
+    j = _journal(tmp_path)
+    assert j.ack("id1")
+    assert j.ack("id0")
+    j = Journal(j.path)
+    assert len(j) == 2
+    assert _ids(j) == ["id2", "id3"]
+
+
+@pytest.mark.parametrize("after", [False, True])
+def test_reset_during_compaction(tmp_path, monkeypatch, after):
+    j = _journal(tmp_path)
+    assert j.ack("id0") and j.ack("id1")
+    rename = journal.uos.rename
+
+    def reset(src, dst):
+        if after:
+            rename(src, dst)
+        raise Reset()
+
+    monkeypatch.setattr(journal.uos, "rename", reset)
+    with pytest.raises(Reset):
+        # The head passes half the file, which is rewritten without it.
+        j.ack("id2")
+    monkeypatch.undo()
+
+    j = Journal(j.path)
+    if after:
+        assert _ids(j) == ["id3"]
+    else:
+        # The CALLs acknowledged are sent again, none is lost.
+        assert _ids(j) == ["id0", "id1", "id2", "id3"]
+
+
+def test_compaction(tmp_path):
+    j = _journal(tmp_path)
+    for i in range(3):
+        assert j.ack("id%d" % i)
+    assert j._head == 0
+    j = Journal(j.path)
+    assert _ids(j) == ["id3"]
+
+
+def test_ack_unknown_or_twice(tmp_path):
+    j = _journal(tmp_path)
+    assert not j.ack("id9")
+    assert j.ack("id2")
+    assert not j.ack("id2")
+    assert len(j) == 3
+    assert j.ack("id0")
+    assert not j.ack("id0")
+    assert len(j) == 2
+    j.release("id1")
+    j.release("id3")
+    assert _ids(j) == ["id1", "id3"]
+
+
+def test_ack_replayed(tmp_path):
+    j = Journal(_journal(tmp_path).path, sync_every=1)
+    # Loaded from the file, only acknowledged once replayed.
+    assert not j.ack("id0")
+    assert len(j) == 4
+    records = j.records()
+    assert next(records)[0] == "id0"
+    assert j.ack("id0")
+    assert not j.ack("id0")
+    assert not j.ack("id1")
+    assert [i for i, message in records] == ["id1", "id2", "id3"]
+    assert j.ack("id2") and j.ack("id1")
+    assert len(j) == 1
+    assert _ids(Journal(j.path)) == ["id3"]
+
+
+def test_ack_released(tmp_path):
+    j = _journal(tmp_path, 2)
+    # Not delivered by ChargePoint.call(), left to records().
+    j.release("id1")
+    assert not j.ack("id1")
+    assert _ids(j) == ["id1"]
+    assert j.ack("id1") and j.ack("id0")
+    assert len(j) == 0
+
+
+def test_ack_unsynced_and_inflight(tmp_path):
+    j = Journal(str(tmp_path / "journal"), sync_every=8)
+    j.append("mv0", "MeterValues", "{}")
+    j.append("mv1", "MeterValues", "{}", inflight=True)
+    assert j.backlog() == 1
+    assert j.ack("mv1")
+    assert not j.ack("mv1")
+    assert not j.ack("mv0")
+    assert _ids(j) == ["mv0"]
+    assert j.ack("mv0")
+    assert len(j) == 0
+    assert not j.ack("mv0")
+
+
+def test_torn_line_dropped(tmp_path):
+    j = _journal(tmp_path, 2)
+    with open(j.path, "ab") as f:
+        # A reset while the line is written.
+        f.write(b'id2 [2, "id2", "Start')
+    j = Journal(j.path, sync_every=1)
+    assert len(j) == 2
+    assert _ids(j) == ["id0", "id1"]
+    j.append("id3", "StopTransaction", '[2, "id3", "StopTransaction", {}]')
+    j = Journal(j.path)
+    assert [message for unique_id, message in j.records()] == [
+        '[2, "id0", "StartTransaction", {}]', '[2, "id1", "StartTransaction", {}]',
+        '[2, "id3", "StopTransaction", {}]',
+    ]
+
+
+def test_flushed_to_storage(tmp_path, monkeypatch):
+    fsync = []
+    monkeypatch.setattr(journal.uos, "fsync", fsync.append, raising=False)
+    j = Journal(str(tmp_path / "journal"), sync_every=4)
+    j.append("mv0", "MeterValues", "{}")
+    # Only in RAM up to `sync_every`.
+    assert fsync == []
+    j.append("tx0", "StartTransaction", "{}")
+    assert len(fsync) == 1
+    for i in range(1, 5):
+        j.append("mv%d" % i, "MeterValues", "{}")
+    assert len(fsync) == 2
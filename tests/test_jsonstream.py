@@ -0,0 +1,98 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_jsonstream.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Values read one by one from a JSON document, and CALLs unpacked
+             without their streamed array.
+@version   : v1.0.0
+@date      : 2024-06-07 15:21:48
+@copyright : Copyright (c) 2024
+"""
+
+import json
+
+import pytest
+
+import usr.ocpp.v16  # noqa: F401, imports usr.ocpp.charge_point
+from usr.ocpp.messages import unpack
+from usr.tools.jsonstream import Reader
+
+DOCUMENTS = [
+    '[1]',
+    '[0, 1, true, null, -2.5e3]',
+    '{"a": 1}',
+    '{"a": "x", "b": false}',
+    '[[1, 2], {"a": [3]}, 4]',
+    '{"a": {"b": [1, {"c": null}]}, "d": 1}',
+    '["a\\"b", "\\\\", "]", "}", "\\\\\\""]',
+    '{"k\\"]": "v\\"}", "n": 0}',
+    '[ 1 , "two" ,[ ] , { } ]',
+]
+
+
+def _read(reader):
+    if reader.peek() == 0x5b:
+        return [_read(reader) for _ in reader.items()]
+    if reader.peek() == 0x7b:
+        return {key: _read(reader) for key in reader.keys()}
+    return reader.read()
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_walk(doc):
+    assert _read(Reader(doc.encode())) == json.loads(doc)
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_values_and_skip(doc):
+    expected = json.loads(doc)
+    if isinstance(expected, list):
+        assert list(Reader(bytearray(doc.encode())).values()) == expected
+        reader = Reader(doc.encode())
+        spans = [reader.skip() for _ in reader.items()]
+        assert [json.loads(doc[s:e]) for s, e in spans] == expected
+    assert Reader(memoryview(doc.encode())).skip() == (0, len(doc))
+
+
+def test_trailing_scalar():
+    reader = Reader(b'[0, 12]')
+    elements = reader.items()
+    next(elements)
+    assert reader.read() == 0
+    next(elements)
+    assert reader.skip() == (4, 6)
+    assert list(elements) == []
+    assert reader.pos == 7
+
+
+@pytest.mark.parametrize("doc", ['[1', '{"a": [1}', '"abc', '[1 2]', '{"a" 1}', '[1,]', '[1] x'])
+def test_malformed(doc):
+    with pytest.raises(ValueError):
+        reader = Reader(doc.encode())
+        _read(reader)
+        if reader.peek() is not None:
+            raise ValueError
+
+
+def test_streamed_with_trailing_scalar():
+    payload = {"localAuthorizationList": [{"idTag": "A"}, {"idTag": "B"}], "updateType": "Full",
+               "listVersion": 3}
+    buf = json.dumps([2, "1", "SendLocalList", payload]).encode()
+    message = unpack(buf, ("SendLocalList",))
+    assert message.streamed is not None
+    assert message.payload == {"localAuthorizationList": [], "updateType": "Full", "listVersion": 3}
+    _, start, end = message.streamed
+    assert json.loads(buf[start:end]) == payload["localAuthorizationList"]
@@ -0,0 +1,162 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_keepalive.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : PINGs of idle connections, their PONGs and dead peers, on the
+             clock of the tests.
+@version   : v1.0.0
+@date      : 2024-06-08 09:44:26
+@copyright : Copyright (c) 2024
+"""
+
+import io
+import threading
+
+import pytest
+
+from usr.tools import uwebsocket
+from usr.tools.uwebsocket import WebsocketClient, OP_PING, OP_PONG, OP_TEXT
+
+
+class Socket(object):
+    """Frames written are kept, frames to read are queued with put()."""
+
+    def __init__(self):
+        self.frames = []
+        self.inbox = io.BytesIO()
+        self.closed = False
+        self.fail = False
+
+    def put(self, opcode, data):
+        # Unmasked, as a server sends it.
+        pos = self.inbox.tell()
+        self.inbox.seek(0, 2)
+        self.inbox.write(bytes([0x80 | opcode, len(data)]) + data)
+        self.inbox.seek(pos)
+
+    def write(self, data):
+        if self.fail:
+            raise OSError("broken pipe")
+        # Masked frames with payloads below 126 bytes.
+        payload = bytearray(data[6:])
+        uwebsocket.apply_mask(payload, bytes(data[2:6]))
+        self.frames.append((data[0] & 0x0f, bytes(payload)))
+
+    def read(self, n):
+        return self.inbox.read(n)
+
+    def readinto(self, buf):
+        return self.inbox.readinto(buf)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def ws(clock, monkeypatch):
+    # The PINGs are written by the thread at once.
+    monkeypatch.setattr(uwebsocket._thread, "start_new_thread", lambda function, args: function(*args))
+    ws = WebsocketClient(Socket())
+    dead = []
+    ws.keepalive(10, lambda: dead.append(clock.ms()))
+    ws.dead = dead
+    return ws
+
+
+def _pings(ws):
+    return [data for opcode, data in ws.sock.frames if opcode == OP_PING]
+
+
+def test_ping_and_pong(ws, clock):
+    assert clock.starts == [(10000, 1)]
+    clock.advance(10000)
+    assert _pings(ws) == [b"\x00\x00\x00\x01"]
+    clock.advance(250)
+    ws.sock.put(OP_PONG, b"\x00\x00\x00\x01")
+    ws.sock.put(OP_TEXT, b"[]")
+    assert ws.recv() == "[]"
+    assert ws.rtt_ms == 250
+    # Idle for another interval.
+    clock.advance(9750)
+    assert _pings(ws) == [b"\x00\x00\x00\x01", b"\x00\x00\x00\x02"]
+    assert ws.dead == [] and ws.open
+
+
+def test_frames_received_no_ping(ws, clock):
+    # Frames within the last half interval on every tick.
+    for _ in range(10):
+        clock.advance(4000)
+        ws.sock.put(OP_TEXT, b"1")
+        assert ws.recv() == "1"
+    assert ws.pings == 0 and _pings(ws) == []
+
+
+def test_pong_of_another_ping_ignored(ws, clock):
+    clock.advance(10000)
+    ws.sock.put(OP_PONG, b"other")
+    ws.sock.put(OP_TEXT, b"1")
+    ws.recv()
+    assert ws.rtt_ms is None
+
+
+def test_dead_peer(ws, clock):
+    start = clock.ms()
+    clock.advance(10000)
+    assert len(_pings(ws)) == 1
+    clock.advance(10000)
+    assert ws.dead == [start + 20000]
+    # Stopped.
+    assert clock.timers == []
+    clock.advance(50000)
+    assert len(_pings(ws)) == 1 and len(ws.dead) == 1
+
+
+def test_dead_peer_aborted(clock, monkeypatch):
+    monkeypatch.setattr(uwebsocket._thread, "start_new_thread", lambda function, args: function(*args))
+    ws = WebsocketClient(Socket())
+    ws.keepalive(10)
+    clock.advance(20000)
+    assert not ws.open and ws.sock.closed
+
+
+def test_ping_failed(ws, clock):
+    ws.sock.fail = True
+    clock.advance(10000)
+    assert ws.dead == [clock.ms()]
+
+
+def test_stopped(ws, clock):
+    ws.keepalive(0)
+    assert clock.timers == []
+    clock.advance(100000)
+    assert _pings(ws) == [] and ws.dead == []
+
+
+def test_timer_doesnt_wait_for_the_socket(clock):
+    ws = WebsocketClient(Socket())
+    ws.keepalive(10)
+    with ws._write_lock:
+        # A frame being written, the timer mustn't block on it.
+        tick = threading.Thread(target=clock.advance, args=(10000,))
+        tick.start()
+        tick.join(2)
+        assert not tick.is_alive()
+        assert _pings(ws) == []
+    for _ in range(200):
+        if _pings(ws):
+            break
+        threading.Event().wait(0.01)
+    assert _pings(ws) == [b"\x00\x00\x00\x01"]
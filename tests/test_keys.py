@@ -0,0 +1,69 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_keys.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Tests of the key translation of usr.ocpp.keys.
+@version   : v1.0.0
+@date      : 2024-06-03 10:20:31
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+import threading
+
+from usr.ocpp.keys import LRUCache, camel_to_snake_key, snake_to_camel_key
+
+
+def test_vendor_keys_round_trip():
+    assert camel_to_snake_key("vendorSpecificField") == "vendor_specific_field"
+    assert snake_to_camel_key("vendor_specific_field") == "vendorSpecificField"
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c"), len(cache)) == (1, 3, 2)
+
+
+def test_lru_cache_shared_by_threads():
+    cache = LRUCache(4)
+    errors = []
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def hammer(offset):
+        try:
+            for i in range(20000):
+                key = (i + offset) % 7
+                if cache.get(key) is None:
+                    cache.put(key, key)
+        except Exception as e:
+            errors.append(e)
+
+    try:
+        threads = [threading.Thread(target=hammer, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch)
+    assert errors == []
+    assert len(cache) <= 4
@@ -0,0 +1,99 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_log_writer.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Lines dropped by a full LogWriter, lines longer than its
+             buffer and failed writes, see scripts/check_log_writer.py for
+             the rest.
+@version   : v1.0.0
+@date      : 2024-06-06 16:40:51
+@copyright : Copyright (c) 2024
+"""
+
+import os
+
+from usr.tools.logging import LogWriter
+
+
+def _lines(writer, *lines):
+    # Not started, nothing writes but flush().
+    for line in lines:
+        writer.write(line + "\n")
+    writer.flush()
+    with open(writer.path) as f:
+        return f.read().splitlines()
+
+
+def test_dropped_counted_in_place(tmp_path):
+    writer = LogWriter(str(tmp_path / "log"), buffer_size=64)
+    lines = _lines(writer, "a" * 20, "b" * 50, "c" * 50, "d")
+    assert lines == ["a" * 20, "... 2 log lines dropped", "d"]
+    assert writer.dropped == 0
+
+
+def test_dropped_at_the_end(tmp_path):
+    writer = LogWriter(str(tmp_path / "log"), buffer_size=64)
+    lines = _lines(writer, "a" * 40, "b" * 40, "c" * 10, "d" * 10)
+    # No room left for the count, the short lines wait behind it.
+    assert lines == ["a" * 40, "... 3 log lines dropped"]
+
+
+def test_long_line_written(tmp_path):
+    writer = LogWriter(str(tmp_path / "log"), buffer_size=64)
+    lines = _lines(writer, "before", "x" * 200, "after")
+    assert lines == ["before", "x" * 200, "after"]
+    assert writer.dropped == 0
+
+
+def test_long_line_after_dropped(tmp_path):
+    writer = LogWriter(str(tmp_path / "log"), buffer_size=64)
+    lines = _lines(writer, "a" * 50, "b" * 50, "x" * 100)
+    assert lines == ["a" * 50, "... 1 log lines dropped", "x" * 100]
+
+
+def test_failed_writes_counted(tmp_path, capsys):
+    # Not started, the folder isn't made.
+    writer = LogWriter(str(tmp_path / "missing" / "log"), buffer_size=64)
+    for line in ("a", "b", "c"):
+        writer.write(line + "\n")
+        writer.flush()
+    assert writer.errors == 3
+    # Printed once for the run of failures.
+    assert len(capsys.readouterr().out.splitlines()) == 1
+    os.mkdir(str(tmp_path / "missing"))
+    assert _lines(writer, "d", "e") == ["... 3 log file errors, lines lost", "d", "e"]
+    assert writer.errors == 3
+    # A new run of failures is printed again.
+    os.remove(writer.path)
+    os.rmdir(str(tmp_path / "missing"))
+    writer.write("f\n")
+    writer.flush()
+    assert writer.errors == 4
+    assert len(capsys.readouterr().out.splitlines()) == 1
+
+
+def test_failed_rotation_counted(tmp_path, capsys, monkeypatch):
+    writer = LogWriter(str(tmp_path / "log"), max_size=16, buffer_size=64)
+
+    def fail():
+        raise OSError(5)
+
+    assert _lines(writer, "a" * 10) == ["a" * 10]
+    monkeypatch.setattr(writer, "_rotate", fail)
+    # Written though not rotated.
+    assert _lines(writer, "b" * 10) == ["a" * 10, "... 1 log file errors, lines lost", "b" * 10]
+    assert writer.errors == 1
+    assert "Rotating the log" in capsys.readouterr().out
@@ -0,0 +1,81 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_logging.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Logger messages formatted only when their level is logged.
+@version   : v1.0.0
+@date      : 2024-06-10 16:21:37
+@copyright : Copyright (c) 2024
+"""
+
+import pytest
+
+from usr.tools import logging
+from usr.tools.logging import DEBUG, INFO, WARN, ERROR, CRITICAL
+
+
+class Arg(object):
+    """An argument which counts how often it's formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+
+@pytest.fixture
+def log():
+    level, debug = logging.getLogLevel(), logging.getLogDebug()
+    yield logging.getLogger("test")
+    logging.setLogLevel(level)
+    logging.setLogDebug(debug)
+
+
+def test_is_enabled_for(log):
+    logging.setLogDebug(True)
+    assert all(log.isEnabledFor(level) for level in (DEBUG, INFO, CRITICAL))
+    # Out of debug mode, debug messages aren't logged even at level debug.
+    logging.setLogDebug(False)
+    logging.setLogLevel("debug")
+    assert not log.isEnabledFor(DEBUG)
+    assert log.isEnabledFor(INFO)
+    logging.setLogLevel("error")
+    assert [log.isEnabledFor(level) for level in (DEBUG, INFO, WARN, ERROR, CRITICAL)] == [
+        False, False, False, True, True]
+
+
+def test_formatted_lazily(log, capsys):
+    logging.setLogDebug(False)
+    logging.setLogLevel("warn")
+    arg = Arg()
+    log.debug("send %s", arg)
+    log.info("send %s", arg)
+    assert arg.formatted == 0
+    assert capsys.readouterr().out == ""
+    log.warn("send %s", arg)
+    assert arg.formatted == 1
+    assert capsys.readouterr().out.endswith("[test][warn] send arg\n")
+
+
+def test_not_a_format(log, capsys):
+    logging.setLogDebug(True)
+    log.info("send", 1, "a")
+    log.info("100%")
+    out = capsys.readouterr().out.splitlines()
+    assert out[0].endswith(" send 1 a")
+    assert out[1].endswith(" 100%")
@@ -0,0 +1,62 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_metrics.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Metrics recorded and dumped, on QuecPython and CPython.
+@version   : v1.0.0
+@date      : 2024-06-06 10:02:19
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+import importlib.util
+
+from usr.ocpp import metrics
+from usr.ocpp.metrics import Metrics, HANDLER, RTT, OTHER
+
+
+def test_record_and_dump(clock):
+    m = Metrics(max_actions=1)
+    m.record("Heartbeat", HANDLER, 100)
+    m.record("Heartbeat", HANDLER, 999999)
+    m.record("Heartbeat", HANDLER, 5000000)
+    m.record("MeterValues", RTT, 2000)
+    clock.advance(1500)
+    dump = m.dump()
+    assert dump["since_ms"] == 1500
+    handler = dump["actions"]["Heartbeat"]["handler"]
+    assert handler["count"] == 3
+    assert handler["total_ms"] == 6000
+    assert handler["max_us"] == 5000000
+    assert handler["histogram"] == [1, 0, 0, 0, 0, 0, 1, 0, 1]
+    # Beyond max_actions.
+    assert dump["actions"][OTHER] == {"rtt": {"count": 1, "total_ms": 2, "max_us": 2000,
+                                              "histogram": [0, 0, 1, 0, 0, 0, 0, 0, 0]}}
+    m.reset()
+    assert m.dump()["actions"] == {}
+
+
+def test_without_utime(monkeypatch):
+    # Imported on CPython, as by a central system.
+    monkeypatch.setitem(sys.modules, "utime", None)
+    spec = importlib.util.spec_from_file_location("cpython_metrics", metrics.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    m = module.Metrics()
+    m.record("Heartbeat", HANDLER, 10)
+    dump = m.dump()
+    assert 0 <= dump["since_ms"] < 1000
+    assert dump["actions"]["Heartbeat"]["handler"]["count"] == 1
@@ -0,0 +1,171 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_response_wait.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Tests of the deadline of the response waits of
+             usr.ocpp.charge_point on the clock of the `clock` fixture,
+             which only moves when a test advances it.
+@version   : v1.0.0
+@date      : 2024-06-03 10:20:31
+@copyright : Copyright (c) 2024
+"""
+
+import time
+import threading
+
+import pytest
+import utime
+
+import usr.ocpp.v16  # noqa: F401, imports usr.ocpp.charge_point
+from usr.ocpp.charge_point import Queue, _TIMEOUT, deadline_ms
+from usr.ocpp.exceptions import TimeoutError
+from usr.ocpp.messages import CallResult
+
+
+def stray(i):
+    return CallResult("stray-%d" % i, {})
+
+
+def test_deadline_ms_wraps(clock):
+    start = utime.ticks_ms()
+    deadline = deadline_ms(7.5)
+    # The clock starts 5 s before the ticks wrap.
+    assert deadline < start
+    assert utime.ticks_diff(deadline, start) == 7500
+
+
+def test_response_after_burst_of_strays(clock):
+    queue = Queue()
+    for i in range(1000):
+        queue.put(stray(i))
+    queue.put(CallResult("mine", {}))
+    dropped = []
+
+    def accept(response):
+        # Every stray response takes 20 ms to arrive.
+        clock.advance(20)
+        if response.unique_id == "mine":
+            return True
+        dropped.append(response.unique_id)
+        return False
+
+    deadline = deadline_ms(30)
+    assert queue.get_until(deadline, accept).unique_id == "mine"
+    assert len(dropped) == 1000
+    # Armed once for the whole wait, not once per stray response.
+    assert clock.starts == [(30000, 0)]
+    assert clock.timers == []
+
+
+@pytest.mark.parametrize("step", [1, 7, 50, 333])
+def test_timeout_under_burst_of_strays(clock, step):
+    queue = Queue()
+    for i in range(5000):
+        queue.put(stray(i))
+
+    def accept(response):
+        clock.advance(step)
+        return False
+
+    start = utime.ticks_ms()
+    with pytest.raises(TimeoutError):
+        queue.get_until(deadline_ms(2), accept)
+    waited = utime.ticks_diff(utime.ticks_ms(), start)
+    # Raised by the first stray response arriving past the deadline.
+    assert 2000 <= waited < 2000 + step
+    assert clock.starts == [(2000, 0)]
+
+
+def test_timeout_of_empty_queue(clock):
+    queue = Queue()
+    deadline = deadline_ms(1)
+
+    def later():
+        time.sleep(0.05)
+        # The timer puts _TIMEOUT once it fires.
+        clock.advance(1000)
+
+    thread = threading.Thread(target=later)
+    thread.start()
+    with pytest.raises(TimeoutError):
+        queue.get_until(deadline)
+    thread.join()
+    assert utime.ticks_diff(utime.ticks_ms(), deadline) == 0
+    assert queue.empty()
+    assert clock.timers == []
+
+
+def test_deadline_passed_before_waiting(clock):
+    queue = Queue()
+    queue.put(CallResult("mine", {}))
+    deadline = deadline_ms(1)
+    clock.advance(1000)
+    with pytest.raises(TimeoutError):
+        queue.get_until(deadline)
+    assert clock.starts == []
+
+
+def test_stale_timeout_sentinel_rearms_timer(clock):
+    queue = Queue()
+    # Left over by the timer of an earlier wait.
+    queue.put(_TIMEOUT)
+    queue.put(CallResult("mine", {}))
+    deadline = deadline_ms(5)
+
+    def accept(response):
+        clock.advance(1200)
+        return True
+
+    assert queue.get_until(deadline, accept).unique_id == "mine"
+    assert clock.starts == [(5000, 0), (5000, 0)]
+    assert clock.timers == []
+
+
+def test_early_timer_rearms_for_the_rest(clock):
+    queue = Queue()
+    deadline = deadline_ms(3)
+    seen = []
+
+    def accept(response):
+        seen.append(response)
+        if len(seen) == 1:
+            # The timer fires 1 s early, as if its clock ran fast.
+            clock.advance(1000)
+            queue._timeout(None)
+            queue.put(stray(2))
+        elif len(seen) == 2:
+            clock.advance(500)
+        else:
+            clock.advance(1500)
+        return False
+
+    queue.put(stray(0))
+    queue.put(stray(1))
+    with pytest.raises(TimeoutError):
+        queue.get_until(deadline, accept)
+    # Re-armed for the 1.5 s left when the early _TIMEOUT is taken.
+    assert clock.starts == [(3000, 0), (1500, 0)]
+    assert utime.ticks_diff(utime.ticks_ms(), deadline) == 0
+    assert len(seen) == 3
+
+
+def test_get_is_relative(clock):
+    queue = Queue()
+    queue.put(stray(0))
+    assert queue.get(2.5).unique_id == "stray-0"
+    assert clock.starts == [(2500, 0)]
+    # Stopped on return.
+    assert clock.timers == []
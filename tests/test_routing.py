@@ -0,0 +1,107 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_routing.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Route tables built once per class and bound to each instance.
+@version   : v1.0.0
+@date      : 2024-06-10 09:26:18
+@copyright : Copyright (c) 2024
+"""
+
+import pytest
+
+from usr.ocpp import routing
+from usr.ocpp.routing import on, after, create_route_map, class_routes
+
+
+class Point(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    @on("Reset", call_unique_id_required=True)
+    def on_reset(self, type):
+        return self.name, type
+
+    @after("Reset")
+    def after_reset(self, type):
+        return "after", self.name
+
+    @on("Heartbeat", skip_schema_validation=True)
+    def on_heartbeat(self):
+        return self.name
+
+
+class Other(Point):
+
+    @on("Heartbeat")
+    def on_other_heartbeat(self):
+        return "other", self.name
+
+
+def test_table_built_once_per_class():
+    routes = class_routes(Point)
+    assert class_routes(Point) is routes
+    assert create_route_map(Point("a")).routes is create_route_map(Point("b")).routes is routes
+    assert sorted(routes) == ["Heartbeat", "Reset"]
+    assert routes["Heartbeat"]["_skip_schema_validation"] is True
+    assert routes["Reset"]["_skip_schema_validation"] is False
+    assert routes["Reset"]["_stream_items"] is False
+
+
+def test_subclass_has_its_table():
+    routes = class_routes(Other)
+    assert routes is not class_routes(Point)
+    assert create_route_map(Other("o"))["Heartbeat"]["_on_action"]() == ("other", "o")
+    assert create_route_map(Point("p"))["Heartbeat"]["_on_action"]() == "p"
+    assert routes["Heartbeat"]["_skip_schema_validation"] is False
+
+
+def test_bound_per_instance():
+    a, b = create_route_map(Point("a")), create_route_map(Point("b"))
+    assert b["Reset"]["_on_action"](type="Hard") == ("b", "Hard")
+    assert a["Reset"]["_on_action"](type="Soft") == ("a", "Soft")
+    assert a["Reset"]["_after_action"](type="Soft") == ("after", "a")
+    # Bound once, the table of the class isn't changed.
+    assert a["Reset"] is a["Reset"]
+    assert a["Reset"]["_on_action"] is not b["Reset"]["_on_action"]
+    assert isinstance(class_routes(Point)["Reset"]["_on_action"], routing.InnerBase)
+    # The options of the decorator.
+    assert a["Reset"]["_on_action"]._call_unique_id_required is True
+
+
+def test_dict_interface():
+    routes = create_route_map(Point("a"))
+    assert "Reset" in routes and "BootNotification" not in routes
+    assert len(routes) == 2 and sorted(routes) == sorted(routes.keys())
+    assert routes.get("BootNotification") is None
+    assert routes.get("Heartbeat")["_on_action"]() == "a"
+    assert [action for action, handlers in routes.items()] == list(routes.keys())
+
+
+def test_called_through_the_instance():
+    point = Point("a")
+    assert point.on_reset("Hard") == ("a", "Hard")
+    assert Point.on_reset(Point("b"), "Soft") == ("b", "Soft")
+
+
+def test_called_without_descriptors(monkeypatch):
+    monkeypatch.setattr(routing, "_DESCRIPTORS", False)
+    with pytest.raises(TypeError):
+        # As the port sees `point.on_reset("Hard")`.
+        Point.__dict__["on_reset"]("Hard")
+    # The route map doesn't need them.
+    assert create_route_map(Point("a"))["Reset"]["_on_action"](type="Hard") == ("a", "Hard")
@@ -0,0 +1,67 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_schema_tables.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : The constant schema tables validate as the `__schemas__` they
+             are generated from: sample payloads of every class, valid and
+             broken in every way, give the same result with both.
+@version   : v1.0.0
+@date      : 2024-06-09 10:05:37
+@copyright : Copyright (c) 2024
+"""
+
+import pytest
+
+import usr.ocpp.v16  # noqa: F401, imports usr.ocpp.charge_point
+from usr.ocpp import dataclasses as dc
+from usr.ocpp.v16 import schemas
+from usr.ocpp.exceptions import SchemaValidationError
+
+from samples import CLASSES, samples, table_validator
+
+
+def _outcome(validate, *args):
+    try:
+        validate(*args)
+    except SchemaValidationError as e:
+        return e.validator, e.message
+    return None
+
+
+def test_all_classes_use_tables():
+    assert len(CLASSES) == 89
+    assert [cls for cls in CLASSES if getattr(cls, "__table__", (None,))[0] is not schemas] == []
+
+
+@pytest.mark.parametrize("cls", CLASSES, ids=lambda cls: cls.__module__.rsplit(".", 1)[1] + "." + cls.__name__)
+def test_same_as_schema(cls):
+    compiled = dc.SchemaValidator(cls)
+    table = table_validator(cls)
+    assert set(compiled.keys()) == set(table.keys())
+    assert compiled.classes == table.classes
+    for case, payload in samples(cls):
+        assert _outcome(compiled.validate, payload) == _outcome(table.validate, payload), case
+        for key, val in payload.items():
+            assert _outcome(compiled.check, key, val) == _outcome(table.check, key, val), (case, key)
+
+
+def test_unknown_key():
+    table = table_validator(usr.ocpp.v16.call.BootNotificationPayload)
+    with pytest.raises(SchemaValidationError) as e:
+        table.validate({"charge_point_model": "M", "charge_point_vendor": "V", "foo": 1})
+    assert e.value.validator == "NotExist"
+    with pytest.raises(SchemaValidationError):
+        table.check("foo", 1)
@@ -0,0 +1,221 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_supervisor.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Boots retried by the Supervisor before the journal is replayed.
+@version   : v1.0.0
+@date      : 2024-06-05 09:31:44
+@copyright : Copyright (c) 2024
+"""
+
+import time
+import queue
+
+import pytest
+
+from usr.ocpp import supervisor
+from usr.ocpp.supervisor import Supervisor
+from usr.ocpp.exceptions import TimeoutError
+from usr.tools.uwebsocket import ConnectionClosed
+
+
+class Connection(object):
+    """A websocket whose messages are only ended by abort()."""
+
+    timings = {}
+
+    def __init__(self):
+        self.open = True
+        self._inbox = queue.Queue()
+
+    def keepalive(self, interval, on_dead=None):
+        pass
+
+    def recv(self, decode=True):
+        if not self.open:
+            raise ConnectionClosed()
+        return self._inbox.get()
+
+    def abort(self):
+        self.open = False
+        self._inbox.put(None)
+
+
+class ChargePoint(object):
+    """Runs the receive loop of the connections bound and counts replays."""
+
+    def __init__(self):
+        self.connection = None
+        self.replays = []
+
+    def bind(self, connection):
+        self.connection = connection
+
+    def start(self):
+        while True:
+            self.connection.recv()
+
+    def connection_lost(self):
+        pass
+
+    def replay(self):
+        self.replays.append(self.connection)
+
+
+class Response(object):
+
+    def __init__(self, status, interval=0.01):
+        self.status = status
+        self.interval = interval
+
+
+class Boot(object):
+    """Answers the boots in turn, a response, an exception or a function."""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.calls = 0
+        # Most boots under way at once.
+        self.active = 0
+        self.most = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.active += 1
+        self.most = max(self.most, self.active)
+        try:
+            answer = self.answers.pop(0)
+            if callable(answer):
+                answer = answer()
+        finally:
+            self.active -= 1
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    made = []
+
+    class Client(object):
+
+        @staticmethod
+        def connect(uri, **kwargs):
+            made.append(Connection())
+            return made[-1]
+
+    monkeypatch.setattr(supervisor, "Client", Client)
+    return made
+
+
+def _wait(condition, timeout=5):
+    end = time.time() + timeout
+    while not condition():
+        assert time.time() < end
+        time.sleep(0.005)
+
+
+def test_boot_retried_until_accepted(connections):
+    boot = Boot(Response("Pending"), TimeoutError(), Response("Rejected"), Response("Accepted"))
+    cp = ChargePoint()
+    s = Supervisor(cp, "ws://cs/cp", boot=boot, min_backoff=0.01, max_backoff=0.02)
+    s.start()
+    try:
+        _wait(lambda: cp.replays)
+        assert s.booted
+        assert boot.calls == 4
+        assert cp.replays == connections == [cp.connection]
+        assert s.connects == 1
+    finally:
+        s.stop()
+
+
+def test_boot_waits_for_the_interval(connections):
+    started = time.time()
+    boot = Boot(Response("Pending", 0.3), Response("Accepted"))
+    cp = ChargePoint()
+    s = Supervisor(cp, "ws://cs/cp", boot=boot)
+    s.start()
+    try:
+        _wait(lambda: cp.replays)
+        assert time.time() - started >= 0.3
+        assert boot.calls == 2
+    finally:
+        s.stop()
+
+
+def test_boot_ends_with_its_connection(connections):
+    cp = ChargePoint()
+    s = None
+
+    def lose():
+        # Pending for long, then the connection is lost while waiting.
+        s.lost()
+        return Response("Pending", 30)
+
+    boot = Boot(lose, Response("Accepted"))
+    s = Supervisor(cp, "ws://cs/cp", boot=boot, min_backoff=0.01, max_backoff=0.02)
+    s.start()
+    try:
+        _wait(lambda: cp.replays)
+        assert boot.calls == 2
+        # Booted and replayed on the second connection only.
+        assert len(connections) == 2
+        assert cp.replays == [connections[1]]
+    finally:
+        s.stop()
+
+
+def test_boot_on_every_connection(connections):
+    # The Central System may have restarted.
+    boot = Boot(Response("Accepted"), Response("Accepted"))
+    cp = ChargePoint()
+    s = Supervisor(cp, "ws://cs/cp", boot=boot, min_backoff=0.01, max_backoff=0.02)
+    s.start()
+    try:
+        _wait(lambda: cp.replays)
+        s.lost()
+        _wait(lambda: len(cp.replays) == 2)
+        assert boot.calls == 2
+        assert cp.replays == connections
+        assert s.booted
+    finally:
+        s.stop()
+
+
+def test_boot_of_lost_connection_waited_for(connections):
+    cp = ChargePoint()
+    s = None
+
+    def lose():
+        # The response arrives after the next connection has been made.
+        s.lost()
+        _wait(lambda: len(connections) == 2)
+        time.sleep(0.05)
+        return Response("Accepted")
+
+    boot = Boot(lose, Response("Accepted"))
+    s = Supervisor(cp, "ws://cs/cp", boot=boot, min_backoff=0.01, max_backoff=0.02)
+    s.start()
+    try:
+        _wait(lambda: cp.replays)
+        time.sleep(0.05)
+        assert boot.calls == 2
+        assert boot.most == 1
+        assert cp.replays == [connections[1]]
+    finally:
+        s.stop()
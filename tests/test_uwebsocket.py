@@ -0,0 +1,107 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_uwebsocket.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Frames of fragmented messages sent by several threads.
+@version   : v1.0.0
+@date      : 2024-06-04 11:05:52
+@copyright : Copyright (c) 2024
+"""
+
+import time
+import threading
+
+import pytest
+
+from usr.tools.uwebsocket import Websocket, ConnectionClosed, OP_CONT, OP_TEXT, OP_PING
+
+
+class Socket(object):
+    """Collects the frames written, switching threads after each one."""
+
+    def __init__(self):
+        self.frames = []
+
+    def write(self, data):
+        data = bytes(data)
+        # Unmasked frames with payloads below 126 bytes.
+        self.frames.append((data[0] & 0x80 != 0, data[0] & 0x0f, data[2:2 + (data[1] & 0x7f)]))
+        time.sleep(0.001)
+
+    def close(self):
+        pass
+
+
+def _messages(frames):
+    """The messages of the frames, failing on interleaved data frames."""
+    messages = []
+    data = None
+    for fin, opcode, payload in frames:
+        if opcode >= OP_PING:
+            continue
+        if data is None:
+            assert opcode == OP_TEXT
+            data = payload
+        else:
+            assert opcode == OP_CONT
+            data += payload
+        if fin:
+            messages.append(data.decode())
+            data = None
+    assert data is None
+    return messages
+
+
+def test_fragments_of_threads_dont_interleave():
+    ws = Websocket(Socket(), fragment_size=4)
+    sent = [str(i) * 40 for i in range(4)]
+    threads = [threading.Thread(target=ws.send, args=(message,)) for message in sent]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(ws.sock.frames) == 40
+    assert sorted(_messages(ws.sock.frames)) == sent
+
+
+def test_ping_between_fragments():
+    ws = Websocket(Socket(), fragment_size=4)
+    write_frame = ws.write_frame
+    pinged = []
+
+    def fragment(opcode, data=b'', fin=True, rsv1=False):
+        write_frame(opcode, data, fin, rsv1)
+        if not pinged:
+            # The PING of the keepalive timer, while send() is under way.
+            ping = threading.Thread(target=write_frame, args=(OP_PING, b'1'))
+            ping.start()
+            ping.join(2)
+            pinged.append(not ping.is_alive())
+
+    ws.write_frame = fragment
+    ws.send("a" * 12)
+    assert pinged == [True]
+    assert [frame[1] for frame in ws.sock.frames] == [OP_TEXT, OP_PING, OP_CONT, OP_CONT]
+    assert _messages(ws.sock.frames) == ["a" * 12]
+
+
+def test_closed():
+    ws = Websocket(Socket())
+    ws.abort()
+    with pytest.raises(ConnectionClosed):
+        ws.recv()
+    with pytest.raises(ConnectionClosed):
+        ws.send("a")
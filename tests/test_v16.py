@@ -0,0 +1,54 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_v16.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : The ChargePoint of usr.ocpp.v16 is chosen by osTimer.
+@version   : v1.0.0
+@date      : 2024-06-07 09:20:33
+@copyright : Copyright (c) 2024
+"""
+
+import sys
+import importlib.util
+
+import pytest
+
+import usr.ocpp.v16
+from usr.ocpp import charge_point, async_charge_point
+
+
+def _load_v16():
+    """Run the package init of usr.ocpp.v16 again, as a module of its own."""
+    spec = importlib.util.spec_from_file_location("v16_again", usr.ocpp.v16.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_quecpython():
+    assert _load_v16().ChargePoint.__bases__ == (charge_point.ChargePoint,)
+
+
+def test_cpython(monkeypatch):
+    monkeypatch.setitem(sys.modules, "osTimer", None)
+    assert _load_v16().ChargePoint.__bases__ == (async_charge_point.ChargePoint,)
+
+
+def test_import_error_not_hidden(monkeypatch):
+    # An import of usr.ocpp.charge_point which fails on the module.
+    monkeypatch.setitem(sys.modules, "usr.ocpp.charge_point", None)
+    with pytest.raises(ImportError):
+        _load_v16()
@@ -0,0 +1,169 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_workers.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Handlers run by a WorkerPool: lanes, limits and queue metrics.
+@version   : v1.0.0
+@date      : 2024-06-10 14:02:51
+@copyright : Copyright (c) 2024
+"""
+
+import time
+import threading
+
+import pytest
+
+from usr.ocpp.workers import WorkerPool
+
+
+def _wait(condition, timeout=5):
+    end = time.time() + timeout
+    while not condition():
+        assert time.time() < end
+        time.sleep(0.002)
+
+
+class Handlers(object):
+    """Handlers which run until released, logging when they start and end."""
+
+    def __init__(self):
+        self.log = []
+        self.running = set()
+        self.most = 0
+        self.release = {}
+        self._lock = threading.Lock()
+
+    def handler(self, name):
+        self.release[name] = threading.Event()
+
+        def run():
+            with self._lock:
+                self.log.append(("start", name))
+                self.running.add(name)
+                self.most = max(self.most, len(self.running))
+            self.release[name].wait(5)
+            with self._lock:
+                self.running.discard(name)
+                self.log.append(("end", name))
+        return run
+
+
+@pytest.fixture
+def handlers():
+    h = Handlers()
+    yield h
+    for event in h.release.values():
+        event.set()
+
+
+def test_sequential_lane_in_order(handlers):
+    pool = WorkerPool(size=3, max_queued=8)
+    names = ["start", "stop", "reset"]
+    for action, name in zip(("RemoteStartTransaction", "RemoteStopTransaction", "Reset"), names):
+        assert pool.submit(action, handlers.handler(name))
+    pool.start()
+    try:
+        for name in names:
+            _wait(lambda: handlers.running == {name})
+            handlers.release[name].set()
+        _wait(lambda: pool.done == 3)
+        assert handlers.log == [(event, name) for name in names for event in ("start", "end")]
+        assert handlers.most == 1
+    finally:
+        pool.stop()
+
+
+def test_other_actions_side_by_side(handlers):
+    pool = WorkerPool(size=3, max_queued=8)
+    pool.submit("RemoteStartTransaction", handlers.handler("start"))
+    pool.submit("DataTransfer", handlers.handler("data"))
+    pool.submit("ChangeConfiguration", handlers.handler("config"))
+    pool.start()
+    try:
+        _wait(lambda: handlers.running == {"start", "data", "config"})
+        assert pool.stats()["running"] == 3
+    finally:
+        pool.stop()
+
+
+def test_limits(handlers):
+    pool = WorkerPool(size=4, max_queued=8, limits={"DataTransfer": 2})
+    for i in range(4):
+        pool.submit("DataTransfer", handlers.handler(i))
+    pool.start()
+    try:
+        _wait(lambda: handlers.running == {0, 1})
+        time.sleep(0.02)
+        assert handlers.running == {0, 1}
+        handlers.release[1].set()
+        _wait(lambda: handlers.running == {0, 2})
+        for i in (0, 2, 3):
+            handlers.release[i].set()
+        _wait(lambda: pool.done == 4)
+        assert handlers.most == 2
+        # Started in the order submitted.
+        assert [name for event, name in handlers.log if event == "start"] == [0, 1, 2, 3]
+    finally:
+        pool.stop()
+
+
+def test_limit_of_a_sequential_action_rejected():
+    with pytest.raises(ValueError):
+        WorkerPool(limits={"Reset": 2})
+    with pytest.raises(ValueError):
+        WorkerPool(sequential=(("Reset",), ("Reset", "UnlockConnector")))
+    # Out of the groups, the limit applies.
+    pool = WorkerPool(limits={"Reset": 2}, sequential=(("RemoteStartTransaction",),))
+    assert pool._lanes["Reset"][0] == 2
+
+
+def test_stats_and_rejected(handlers):
+    pool = WorkerPool(size=1, max_queued=2)
+    assert pool.submit("DataTransfer", handlers.handler("a"))
+    assert pool.submit("DataTransfer", handlers.handler("b"))
+    assert not pool.submit("DataTransfer", handlers.handler("c"))
+    assert pool.stats() == {"queued": 2, "running": 0, "peak_queued": 2, "submitted": 2, "rejected": 1, "done": 0}
+    pool.start()
+    try:
+        _wait(lambda: handlers.running == {"a"})
+        assert pool.stats()["queued"] == 1 and pool.stats()["running"] == 1
+        # A free place in the queue.
+        assert pool.submit("DataTransfer", handlers.handler("d"))
+        for name in ("a", "b", "d"):
+            handlers.release[name].set()
+        _wait(lambda: pool.done == 3)
+        assert pool.stats() == {"queued": 0, "running": 0, "peak_queued": 2, "submitted": 3, "rejected": 1,
+                                "done": 3}
+    finally:
+        pool.stop()
+
+
+def test_handler_error(capsys):
+    pool = WorkerPool(size=1)
+    done = []
+
+    def fail():
+        raise RuntimeError("boom")
+
+    pool.submit("Reset", fail)
+    pool.submit("Reset", lambda: done.append(True))
+    pool.start()
+    try:
+        # The worker and the lane outlive the error.
+        _wait(lambda: done)
+        assert pool.stats()["done"] == 2
+    finally:
+        pool.stop()
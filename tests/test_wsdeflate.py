@@ -0,0 +1,161 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_wsdeflate.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : permessage-deflate negotiated, and messages compressed on the way.
+@version   : v1.0.0
+@date      : 2024-06-07 14:03:15
+@copyright : Copyright (c) 2024
+"""
+
+import io
+import zlib
+
+import pytest
+
+from usr.tools.wsdeflate import PerMessageDeflate
+from usr.tools.uwebsocket import (
+    Websocket, WebsocketClient, Client, HandshakeError, parse_extensions, OP_TEXT, OP_CONT,
+    CLOSE_TOO_BIG,
+)
+
+MESSAGE = '[2,"1","MeterValues",{"connectorId":1,"meterValue":[]}]' * 20
+
+
+class Stream(object):
+    """Both ends of a connection: frames written are read back."""
+
+    def __init__(self):
+        self.buf = io.BytesIO()
+        self.frames = []
+
+    def write(self, data):
+        data = bytes(data)
+        self.frames.append(data)
+        self.buf.write(data)
+
+    def rewind(self):
+        self.buf.seek(0)
+
+    def read(self, n):
+        return self.buf.read(n)
+
+    def readinto(self, buf):
+        return self.buf.readinto(buf)
+
+    def close(self):
+        pass
+
+
+def _accepted(value, deflate=None):
+    deflate = deflate or PerMessageDeflate()
+    return Client._check(101, {
+        "upgrade": "websocket", "connection": "Upgrade", "sec-websocket-extensions": value,
+    }, b"", [], deflate)
+
+
+def test_offer():
+    assert PerMessageDeflate().offer() == "permessage-deflate; client_max_window_bits"
+    deflate = PerMessageDeflate(client_max_window_bits=10, server_max_window_bits=11, server_no_context_takeover=True)
+    assert deflate.offer() == ("permessage-deflate; server_no_context_takeover; "
+                               "client_max_window_bits=10; server_max_window_bits=11")
+
+
+def test_accepted(monkeypatch):
+    monkeypatch.setattr("usr.tools.uwebsocket.accept_key", lambda key: None)
+    deflate = PerMessageDeflate()
+    assert _accepted('permessage-deflate; server_max_window_bits="10"; client_no_context_takeover',
+                     deflate) == (None, ["permessage-deflate"], deflate)
+    assert deflate.server_max_window_bits == 10
+    assert deflate.client_no_context_takeover
+    # Not accepted by the server, sent uncompressed.
+    assert _accepted("") == (None, [], None)
+    for value in ("x-webkit-deflate-frame", "permessage-deflate; client_max_window_bits=8",
+                  "permessage-deflate; server_max_window_bits=16", "permessage-deflate; mystery",
+                  "permessage-deflate, permessage-deflate"):
+        with pytest.raises(HandshakeError):
+            _accepted(value)
+
+
+def test_parse_extensions():
+    assert parse_extensions('a; b=1, c; d="x" ;e,') == [("a", [("b", "1")]), ("c", [("d", "x"), ("e", None)])]
+
+
+@pytest.mark.parametrize("takeover", [True, False])
+def test_round_trip(takeover):
+    sender = PerMessageDeflate(client_no_context_takeover=not takeover)
+    receiver = PerMessageDeflate(server_no_context_takeover=not takeover)
+    sizes = []
+    for _ in range(3):
+        data = sender.compress(MESSAGE.encode())
+        # The sync flush tail is left out.
+        assert not data.endswith(b"\x00\x00\xff\xff")
+        sizes.append(len(data))
+        assert receiver.decompress(data, 0x10000) == MESSAGE.encode()
+    # The window of the last message compresses the next one.
+    assert (sizes[1] < sizes[0]) == takeover
+    assert sender.raw_sent == receiver.raw_received == 3 * len(MESSAGE)
+    assert sender.wire_sent == receiver.wire_received == sum(sizes)
+
+
+def test_decompress_too_big():
+    data = PerMessageDeflate().compress(b"a" * 1000)
+    with pytest.raises(ValueError):
+        PerMessageDeflate().decompress(data, 999)
+    assert PerMessageDeflate().decompress(data, 1000) == b"a" * 1000
+
+
+def test_rsv1_on_first_frame_only():
+    stream = Stream()
+    client = WebsocketClient(stream, fragment_size=16, deflate=PerMessageDeflate())
+    client.send(MESSAGE)
+    assert len(stream.frames) > 1
+    assert [frame[0] & 0x40 != 0 for frame in stream.frames] == [True] + [False] * (len(stream.frames) - 1)
+    assert [frame[0] & 0x0f for frame in stream.frames] == [OP_TEXT] + [OP_CONT] * (len(stream.frames) - 1)
+    stream.rewind()
+    server = Websocket(stream, deflate=PerMessageDeflate())
+    assert server.recv() == MESSAGE
+
+
+def test_uncompressed_messages_received():
+    stream = Stream()
+    WebsocketClient(stream).send("plain")
+    stream.rewind()
+    assert Websocket(stream, deflate=PerMessageDeflate()).recv() == "plain"
+
+
+def test_compressed_bomb_closed():
+    stream = Stream()
+    client = WebsocketClient(stream, deflate=PerMessageDeflate())
+    client.send(b"\x00" * 0x20000)
+    # Small on the wire.
+    assert len(stream.frames[0]) < 0x200
+    stream.rewind()
+    server = Websocket(stream, max_size=0x10000, deflate=PerMessageDeflate())
+    assert server.recv() is None
+    assert not server.open
+    close = stream.frames[-1]
+    assert int.from_bytes(close[2:4], "big") == CLOSE_TOO_BIG
+
+
+def test_compressed_without_extension_closed():
+    stream = Stream()
+    raw = zlib.compressobj(6, zlib.DEFLATED, -15)
+    WebsocketClient(stream).write_frame(OP_TEXT, raw.compress(b"x") + raw.flush(zlib.Z_SYNC_FLUSH)[:-4], rsv1=True)
+    stream.rewind()
+    server = Websocket(stream)
+    assert server.recv() is None
+    assert not server.open
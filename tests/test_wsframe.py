@@ -0,0 +1,97 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_wsframe.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : Frames and the handshake request written with one call each.
+@version   : v1.0.0
+@date      : 2024-06-07 11:26:40
+@copyright : Copyright (c) 2024
+"""
+
+import pytest
+
+from usr.tools import uwebsocket
+from usr.tools.uwebsocket import Websocket, WebsocketClient, Client, OP_TEXT, OP_BYTES, SEND_BUF_SIZE
+
+
+class Socket(object):
+    """Keeps every write, answers the handshake request with `response`."""
+
+    def __init__(self, response=None):
+        self.writes = []
+        self.response = response
+        self.closed = False
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+    def recv(self, n):
+        data, self.response = self.response[:n], self.response[n:]
+        return data
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("length, header", [(0, 2), (125, 2), (126, 4), (0xffff, 4), (0x10000, 10)])
+@pytest.mark.parametrize("ws_class, mask", [(Websocket, 0), (WebsocketClient, 4)])
+def test_one_write_per_frame(ws_class, mask, length, header):
+    ws = ws_class(Socket())
+    ws.write_frame(OP_BYTES, b"x" * length)
+    ws.write_frame(OP_TEXT, b"y")
+    assert ws.frames_sent == ws.writes == len(ws.sock.writes) == 2
+    frame = ws.sock.writes[0]
+    assert len(frame) == header + mask + length
+    assert frame[0] == 0x80 | OP_BYTES
+    assert len(ws.sock.writes[1]) == 2 + mask + 1
+    if not mask:
+        assert frame[header:] == b"x" * length
+
+
+def test_send_buffer_reused():
+    ws = Websocket(Socket())
+    ws.write_frame(OP_TEXT, b"a" * 10)
+    buf = ws._send_buf
+    assert buf is not None
+    ws.write_frame(OP_TEXT, b"b" * SEND_BUF_SIZE)
+    assert ws._send_buf is buf
+    ws.write_frame(OP_TEXT, b"c" * (SEND_BUF_SIZE + 1))
+    assert ws._send_buf is buf and len(buf) == uwebsocket.HEADER_ROOM + SEND_BUF_SIZE
+    assert [len(frame) for frame in ws.sock.writes] == [12, SEND_BUF_SIZE + 4, SEND_BUF_SIZE + 5]
+
+
+def test_handshake_request_written_at_once(monkeypatch):
+    sock = Socket()
+
+    def write(data):
+        Socket.write(sock, data)
+        key = data.split(b"Sec-WebSocket-Key: ")[1].split(b"\r\n")[0]
+        sock.response = (
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + uwebsocket.accept_key(key).encode() + b"\r\n\r\n"
+        )
+
+    sock.write = write
+    monkeypatch.setattr(uwebsocket, "resolve", lambda hostname, port: [(hostname, port)])
+    monkeypatch.setattr(uwebsocket, "_connect", lambda hostname, port, addresses: sock)
+    ws = Client.connect("ws://example.com/ocpp/CP1", headers={"Sec-WebSocket-Protocol": "ocpp1.6"})
+    assert len(sock.writes) == 1
+    lines = sock.writes[0].decode().split("\r\n")
+    assert lines[0] == "GET /ocpp/CP1 HTTP/1.1"
+    assert "Host: example.com:80" in lines
+    assert "Sec-WebSocket-Protocol:ocpp1.6" in lines
+    assert lines[-2:] == ["", ""]
+    assert ws.sock is sock and not sock.closed
@@ -0,0 +1,113 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+@file      : test_wsmask.py
+@author    : Jack Sun (jack.sun@quectel.com)
+@brief     : WebSocket payloads masked and unmasked in place.
+@version   : v1.0.0
+@date      : 2024-06-07 10:12:08
+@copyright : Copyright (c) 2024
+"""
+
+import io
+
+import pytest
+
+from usr.tools import wsmask
+from usr.tools.uwebsocket import Websocket, WebsocketClient, OP_TEXT, OP_BYTES, RECV_BUF_SIZE
+
+KEY = b"\x12\x34\xab\xcd"
+LENGTHS = (0, 1, 3, 4, 5, 7, 8, 125, 126, RECV_BUF_SIZE, RECV_BUF_SIZE + 3, 70000)
+
+
+def _reference(data, key):
+    return bytes(b ^ key[i % 4] for i, b in enumerate(data))
+
+
+def _payload(length):
+    return bytes((i * 7 + 3) & 0xff for i in range(length))
+
+
+class Stream(object):
+    """Both ends of a connection: frames written are read back."""
+
+    def __init__(self):
+        self.buf = io.BytesIO()
+        self.written = []
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        self.buf.write(data)
+
+    def rewind(self):
+        self.buf.seek(0)
+
+    def read(self, n):
+        return self.buf.read(n)
+
+    def readinto(self, buf):
+        return self.buf.readinto(buf)
+
+
+@pytest.mark.parametrize("func", [wsmask.mask_bytes, wsmask.mask_int, wsmask.mask])
+@pytest.mark.parametrize("length", LENGTHS[:-1])
+def test_mask(func, length):
+    data = _payload(length)
+    buf = bytearray(data)
+    func(buf, KEY)
+    assert bytes(buf) == _reference(data, KEY)
+    # Masking twice gives the payload back.
+    func(buf, KEY)
+    assert bytes(buf) == data
+
+
+@pytest.mark.parametrize("func", [wsmask.mask_bytes, wsmask.mask_int])
+def test_mask_slice_in_place(func):
+    buf = bytearray(b"\xff" * 4 + _payload(10) + b"\xff" * 4)
+    func(memoryview(buf)[4:14], KEY)
+    assert buf[:4] == buf[14:] == b"\xff" * 4
+    assert bytes(buf[4:14]) == _reference(_payload(10), KEY)
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_masked_frames_read_back(length):
+    stream = Stream()
+    client = WebsocketClient(stream)
+    client.write_frame(OP_BYTES, _payload(length))
+    frame = stream.written[0]
+    # Masked on the wire.
+    assert frame[1] & 0x80
+    stream.rewind()
+    server = Websocket(stream, max_size=0x20000)
+    fin, opcode, data = server.read_frame()
+    assert (fin, opcode) == (True, OP_BYTES)
+    assert bytes(data) == _payload(length)
+
+
+def test_receive_buffer_reused():
+    stream = Stream()
+    client = WebsocketClient(stream)
+    client.write_frame(OP_TEXT, b"a" * 10)
+    client.write_frame(OP_TEXT, b"b" * 20)
+    client.write_frame(OP_TEXT, b"c" * (RECV_BUF_SIZE + 1))
+    stream.rewind()
+    server = Websocket(stream)
+    first = server.read_frame()[2]
+    assert bytes(first) == b"a" * 10
+    second = server.read_frame()[2]
+    assert second.obj is first.obj is server._recv_buf
+    large = server.read_frame()[2]
+    assert isinstance(large, bytearray) and large is not server._recv_buf
+    assert bytes(large) == b"c" * (RECV_BUF_SIZE + 1)